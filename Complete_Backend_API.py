@@ -75,7 +75,7 @@ import bcrypt
 import redis
 import logging
 from datetime import datetime, timedelta
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 import uuid
 from contextlib import asynccontextmanager
 import asyncpg
@@ -198,7 +198,7 @@ import bcrypt
 import redis
 import logging
 from datetime import datetime, timedelta
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 import uuid
 from contextlib import asynccontextmanager
 import asyncpg
@@ -395,12 +395,13 @@ async def get_current_user(
         logger.error(f"Authentication error: {str(e)}")
         raise HTTPException(status_code=401, detail="Authentication failed")
 
+TIER_HIERARCHY = {'basic': 0, 'pro': 1, 'premium': 2, 'enterprise': 3}
+
 def require_subscription_tier(min_tier: str):
     """Dependency to require minimum subscription tier"""
     def check_subscription(current_user: User = Depends(get_current_user)):
-        tier_hierarchy = {'basic': 0, 'pro': 1, 'premium': 2, 'enterprise': 3}
-        user_tier_level = tier_hierarchy.get(current_user.subscription_tier, 0)
-        required_level = tier_hierarchy.get(min_tier, 0)
+        user_tier_level = TIER_HIERARCHY.get(current_user.subscription_tier, 0)
+        required_level = TIER_HIERARCHY.get(min_tier, 0)
         
         if user_tier_level < required_level:
             raise HTTPException(
@@ -418,12 +419,14 @@ class ConnectionManager:
     def __init__(self):
         self.active_connections: Dict[str, WebSocket] = {}
         self.user_subscriptions: Dict[str, set] = {}  # user_id -> set of symbols
+        self.user_tiers: Dict[str, str] = {}  # user_id -> subscription tier
     
-    async def connect(self, websocket: WebSocket, user_id: str):
+    async def connect(self, websocket: WebSocket, user_id: str, subscription_tier: str = 'basic'):
         """Accept new WebSocket connection"""
         await websocket.accept()
         self.active_connections[user_id] = websocket
         self.user_subscriptions[user_id] = set()
+        self.user_tiers[user_id] = subscription_tier
         logger.info(f"User {user_id} connected via WebSocket")
     
     def disconnect(self, user_id: str):
@@ -432,6 +435,7 @@ class ConnectionManager:
             del self.active_connections[user_id]
         if user_id in self.user_subscriptions:
             del self.user_subscriptions[user_id]
+        self.user_tiers.pop(user_id, None)
         logger.info(f"User {user_id} disconnected from WebSocket")
     
     async def send_personal_message(self, message: dict, user_id: str):
@@ -469,6 +473,16 @@ class ConnectionManager:
         """Unsubscribe user from market data"""
         if user_id in self.user_subscriptions:
             self.user_subscriptions[user_id] -= set(symbols)
+    
+    def symbol_demand(self) -> Dict[str, Tuple[int, int]]:
+        """Symbol -> (subscriber count, highest subscriber tier level)"""
+        demand = {}
+        for user_id, subscriptions in self.user_subscriptions.items():
+            tier_level = TIER_HIERARCHY.get(self.user_tiers.get(user_id, 'basic'), 0)
+            for symbol in subscriptions:
+                count, level = demand.get(symbol, (0, 0))
+                demand[symbol] = (count + 1, max(level, tier_level))
+        return demand
 
 manager = ConnectionManager()
 
@@ -929,7 +943,7 @@ async def websocket_endpoint(websocket: WebSocket, user_token: str):
             return
         
         # Connect user
-        await manager.connect(websocket, user_id)
+        await manager.connect(websocket, user_id, payload.get('subscription_tier', 'basic'))
         
         try:
             while True:
@@ -1546,7 +1560,7 @@ import bcrypt
 import redis
 import logging
 from datetime import datetime, timedelta
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 import uuid
 from contextlib import asynccontextmanager
 import asyncpg
@@ -2,29 +2,730 @@ import os
 import pandas as pd
 import yfinance as yf
 import requests
+from requests.adapters import HTTPAdapter
 import numpy as np
-from functools import reduce
-from datetime import datetime, timedelta
+from functools import lru_cache, reduce
+from datetime import date, datetime, timedelta
 import json
-from typing import Dict, List, Tuple, Optional
+from typing import Any, Dict, List, Tuple, Optional, Union
 import warnings
 warnings.filterwarnings('ignore')
 
 # Advanced analysis imports
-from scipy.fft import fft
+from scipy.fft import fft, rfft
+from scipy.signal import lfilter
+from numpy.lib.stride_tricks import sliding_window_view
 from scipy.stats import pearsonr
 from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
 import time
+import zlib
+import hashlib
+import random
+import struct
+from email.utils import parsedate_to_datetime
+import argparse
+import signal
+import socketserver
+import threading
+from contextlib import contextmanager
+from io import BytesIO
+from zoneinfo import ZoneInfo
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from urllib.parse import quote, urlsplit
+
+# Optional imports with fallbacks
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+class OHLCVStore:
+    """On-disk OHLCV bars partitioned by symbol, one Parquet file per symbol"""
+    
+    def __init__(self, root: str):
+        self.root = root
+        os.makedirs(root, exist_ok=True)
+    
+    def _path(self, symbol: str) -> str:
+        return os.path.join(self.root, f"{quote(symbol, safe='')}.parquet")
+    
+    def has(self, symbol: str) -> bool:
+        return os.path.exists(self._path(symbol))
+    
+    def load(self, symbol: str, since: Optional[pd.Timestamp] = None) -> pd.DataFrame:
+        """Load stored bars for a symbol, optionally only those at or after ``since``"""
+        if not self.has(symbol):
+            return pd.DataFrame()
+        
+        df = pd.read_parquet(self._path(symbol))
+        if since is not None:
+            df = df[df['Date'] >= since].reset_index(drop=True)
+        return df
+    
+    def last_timestamp(self, symbol: str) -> Optional[pd.Timestamp]:
+        """Timestamp of the newest stored bar, or None if nothing is stored"""
+        if not self.has(symbol):
+            return None
+        
+        dates = pd.read_parquet(self._path(symbol), columns=['Date'])['Date']
+        return dates.iloc[-1] if len(dates) else None
+    
+    def append(self, symbol: str, df: pd.DataFrame) -> pd.DataFrame:
+        """Merge newly fetched bars; they replace any stored bars from their first date on"""
+        existing = self.load(symbol)
+        if not existing.empty:
+            existing = existing[existing['Date'] < df['Date'].iloc[0]]
+            df = pd.concat([existing, df], ignore_index=True)
+        
+        path = self._path(symbol)
+        tmp_path = f"{path}.tmp"
+        df.to_parquet(tmp_path, index=False)
+        os.replace(tmp_path, path)
+        return df
+
+def _json_default(obj):
+    """Serialize NumPy values natively and anything else as a string"""
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if isinstance(obj, np.generic):
+        return obj.item()
+    return str(obj)
+
+class MarketDataWriter:
+    """Atomic, incremental writer for the files the frontend reads
+    
+    Every file is written to a temp file and renamed into place, so readers
+    never see partial output, and is skipped when its content hash is
+    unchanged. Assets whose data did not change reuse their previously
+    serialized bytes. ``manifest.json`` lists the content hash of every file
+    and per-asset fragment so clients can fetch only what changed.
+    """
+    
+    def __init__(self, data_dir: str, use_msgpack: bool = False):
+        self.data_dir = data_dir
+        self.use_msgpack = use_msgpack and msgpack is not None
+        self.manifest_path = os.path.join(data_dir, 'manifest.json')
+        self.manifest = {'generation': 0, 'files': {}, 'assets': {}}
+        self._fragments = {}  # (asset_type, symbol) -> (serialized content, serialized bytes)
+        
+        if os.path.exists(self.manifest_path):
+            try:
+                with open(self.manifest_path) as f:
+                    self.manifest.update(json.load(f))
+            except Exception as e:
+                print(f"Warning: Ignoring unreadable manifest: {str(e)}")
+    
+    def dumps(self, obj) -> bytes:
+        """Serialize to compact JSON bytes, using orjson when available"""
+        if orjson is not None:
+            return orjson.dumps(obj, default=_json_default,
+                                option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS)
+        return json.dumps(obj, default=_json_default).encode('utf-8')
+    
+    def _atomic_write(self, path: str, payload: bytes):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(payload)
+        os.replace(tmp_path, path)
+    
+    def write_bytes(self, name: str, payload: bytes) -> bool:
+        """Write a file under data_dir unless its content is unchanged"""
+        digest = hashlib.sha256(payload).hexdigest()
+        path = os.path.join(self.data_dir, name)
+        entry = self.manifest['files'].get(name)
+        if entry and entry['sha256'] == digest and os.path.exists(path):
+            return False
+        
+        self._atomic_write(path, payload)
+        self.manifest['files'][name] = {'sha256': digest, 'size': len(payload)}
+        return True
+    
+    def write_json(self, name: str, obj) -> bool:
+        return self.write_bytes(name, self.dumps(obj))
+    
+    def remove(self, name: str):
+        path = os.path.join(self.data_dir, name)
+        if os.path.exists(path):
+            os.remove(path)
+        self.manifest['files'].pop(name, None)
+    
+    def write_market_data(self, market_data: Dict) -> int:
+        """Write per-asset fragments and market_data.json; returns the number reserialized"""
+        reserialized = 0
+        seen = set()
+        sections = []
+        assets_manifest = {}
+        
+        for asset_type, assets in market_data.items():
+            entries = []
+            assets_manifest[asset_type] = {}
+            for symbol, data in assets.items():
+                key = (asset_type, symbol)
+                seen.add(key)
+                name = f"assets/{quote(asset_type, safe='')}/{quote(symbol, safe='')}.json"
+                
+                # A refresh that only moved last_updated keeps the previous fragment; compared as
+                # bytes because fresh NaNs never compare equal to the cached ones
+                content = self.dumps({field: value for field, value in data.items() if field != 'last_updated'})
+                cached = self._fragments.get(key)
+                if cached is None or cached[0] != content:
+                    cached = (content, self.dumps(data))
+                    self._fragments[key] = cached
+                    self.write_bytes(name, cached[1])
+                    reserialized += 1
+                
+                entries.append(self.dumps(symbol) + b':' + cached[1])
+                assets_manifest[asset_type][symbol] = name
+            sections.append(self.dumps(asset_type) + b':{' + b','.join(entries) + b'}')
+        
+        # Drop fragments for assets that are no longer configured
+        for asset_type, symbols in self.manifest.get('assets', {}).items():
+            for symbol, name in symbols.items():
+                if (asset_type, symbol) not in seen:
+                    self._fragments.pop((asset_type, symbol), None)
+                    self.remove(name)
+        self.manifest['assets'] = assets_manifest
+        
+        self.write_bytes('market_data.json', b'{' + b','.join(sections) + b'}')
+        if self.use_msgpack:
+            self.write_bytes('market_data.msgpack', msgpack.packb(market_data, default=_json_default))
+        return reserialized
+    
+    def publish_manifest(self):
+        """Atomically publish the manifest once all files it lists are in place"""
+        self.manifest['generation'] += 1
+        self.manifest['generated_at'] = datetime.now().isoformat()
+        self._atomic_write(self.manifest_path, json.dumps(self.manifest).encode('utf-8'))
+
+_worker_analyzer = None
+
+def _score_texts(texts: List[str]) -> List[float]:
+    """Score a batch of texts with VADER inside a worker process"""
+    global _worker_analyzer
+    if _worker_analyzer is None:
+        _worker_analyzer = SentimentIntensityAnalyzer()
+    return [_worker_analyzer.polarity_scores(text)['compound'] for text in texts]
+
+class SentimentCache:
+    """Persistent VADER compound scores keyed by article hash, plus per-asset query results"""
+    
+    def __init__(self, path: str, retention_days: int = 30):
+        self.path = path
+        self.retention = retention_days * 86400
+        self.lock = threading.Lock()
+        self.articles = {}  # article key -> [compound score, first seen timestamp]
+        self.queries = {}   # asset -> {'fetched_at': timestamp, 'keys': [article keys]}
+        
+        if os.path.exists(path):
+            try:
+                with open(path) as f:
+                    data = json.load(f)
+                self.articles = data.get('articles', {})
+                self.queries = data.get('queries', {})
+            except Exception as e:
+                print(f"Warning: Ignoring unreadable sentiment cache: {str(e)}")
+    
+    @staticmethod
+    def article_key(article: Dict, text: str) -> str:
+        """Hash of the article URL and scored text, so edited articles are rescored"""
+        return hashlib.sha1(f"{article.get('url') or ''}\n{text}".encode('utf-8')).hexdigest()
+    
+    def query_scores(self, asset: str, ttl: Optional[float]) -> Optional[List[float]]:
+        """Scores from the asset's last query if it is younger than ``ttl`` seconds"""
+        with self.lock:
+            query = self.queries.get(asset)
+            if query is None or (ttl is not None and time.time() - query['fetched_at'] > ttl):
+                return None
+            return [self.articles[key][0] for key in query['keys'] if key in self.articles]
+    
+    def missing(self, keys: List[str]) -> List[str]:
+        with self.lock:
+            return [key for key in keys if key not in self.articles]
+    
+    def store(self, asset: str, keys: List[str], scores: Dict[str, float]) -> List[float]:
+        """Record new article scores and the asset's query; returns scores for ``keys``"""
+        now = time.time()
+        with self.lock:
+            for key, score in scores.items():
+                self.articles[key] = [score, now]
+            self.queries[asset] = {'fetched_at': now, 'keys': keys}
+            return [self.articles[key][0] for key in keys]
+    
+    def save(self):
+        """Prune expired articles and write the cache atomically"""
+        cutoff = time.time() - self.retention
+        with self.lock:
+            referenced = {key for query in self.queries.values() for key in query['keys']}
+            self.articles = {
+                key: entry for key, entry in self.articles.items()
+                if entry[1] >= cutoff or key in referenced
+            }
+            payload = {'articles': self.articles, 'queries': self.queries}
+        
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(payload, f)
+        os.replace(tmp_path, self.path)
+
+class CachedHTTPClient:
+    """Shared keep-alive HTTP client with per-host caps, retries and a conditional-request cache
+    
+    Responses are cached on disk by URL and parameters. Within ``ttl`` a
+    cached body is returned without touching the network; after that the
+    request is revalidated with If-None-Match / If-Modified-Since and a 304
+    reuses the cached body. 429 and 5xx responses are retried with
+    exponential backoff, honoring Retry-After when the server sends it.
+    """
+    
+    RETRY_STATUSES = {429, 500, 502, 503, 504}
+    
+    def __init__(self, cache_dir: str, host_limits: Optional[Dict[str, int]] = None,
+                 default_limit: int = 4, timeout: float = 15, ttl: float = 300,
+                 max_retries: int = 4, backoff: float = 1.0, max_backoff: float = 60):
+        self.cache_dir = cache_dir
+        self.host_limits = host_limits or {}
+        self.default_limit = default_limit
+        self.timeout = timeout
+        self.ttl = ttl
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        os.makedirs(cache_dir, exist_ok=True)
+        
+        # Pool size matches the widest host cap so no connection is thrown away
+        pool_size = max([default_limit, *self.host_limits.values()])
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=pool_size)
+        self.session = requests.Session()
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        
+        self._host_semaphores = {}
+        self._lock = threading.Lock()
+        self.stats = {'requests': 0, 'cache_hits': 0, 'not_modified': 0, 'retries': 0}
+    
+    def _semaphore(self, host: str) -> threading.BoundedSemaphore:
+        with self._lock:
+            if host not in self._host_semaphores:
+                limit = self.host_limits.get(host, self.default_limit)
+                self._host_semaphores[host] = threading.BoundedSemaphore(limit)
+            return self._host_semaphores[host]
+    
+    def _count(self, stat: str):
+        with self._lock:
+            self.stats[stat] += 1
+    
+    def _cache_path(self, url: str, params: Optional[Dict]) -> str:
+        key = json.dumps([url, sorted((params or {}).items())], default=str)
+        return os.path.join(self.cache_dir, f"{hashlib.sha256(key.encode('utf-8')).hexdigest()}.json")
+    
+    def _load_entry(self, path: str) -> Optional[Dict]:
+        try:
+            with open(path) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+    
+    def _save_entry(self, path: str, entry: Dict):
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(entry, f)
+        os.replace(tmp_path, path)
+    
+    def _retry_delay(self, response: Optional[requests.Response], attempt: int) -> float:
+        """Seconds to wait before the next attempt: Retry-After if given, else exponential backoff"""
+        retry_after = response.headers.get('Retry-After') if response is not None else None
+        if retry_after:
+            try:
+                return min(float(retry_after), self.max_backoff)
+            except ValueError:
+                try:
+                    delay = (parsedate_to_datetime(retry_after) - datetime.now(ZoneInfo('UTC'))).total_seconds()
+                    return min(max(delay, 0.0), self.max_backoff)
+                except (TypeError, ValueError):
+                    pass
+        return min(self.backoff * 2 ** attempt, self.max_backoff) * random.uniform(0.5, 1.0)
+    
+    def request(self, url: str, params: Optional[Dict] = None,
+                headers: Optional[Dict] = None) -> requests.Response:
+        """GET under the host's concurrency cap, retrying throttled and failed attempts"""
+        semaphore = self._semaphore(urlsplit(url).hostname or '')
+        
+        for attempt in range(self.max_retries + 1):
+            response = None
+            with semaphore:
+                try:
+                    self._count('requests')
+                    response = self.session.get(url, params=params, headers=headers, timeout=self.timeout)
+                except (requests.ConnectionError, requests.Timeout):
+                    if attempt == self.max_retries:
+                        raise
+                else:
+                    if response.status_code not in self.RETRY_STATUSES or attempt == self.max_retries:
+                        return response
+            
+            # Sleep outside the semaphore so other requests to the host can proceed
+            self._count('retries')
+            time.sleep(self._retry_delay(response, attempt))
+    
+    def get_json(self, url: str, params: Optional[Dict] = None, ttl: Optional[float] = None):
+        """GET a JSON document through the on-disk cache"""
+        ttl = self.ttl if ttl is None else ttl
+        path = self._cache_path(url, params)
+        entry = self._load_entry(path)
+        
+        if entry is not None and time.time() - entry['fetched_at'] < ttl:
+            self._count('cache_hits')
+            return json.loads(entry['body'])
+        
+        headers = {}
+        if entry is not None:
+            if entry.get('etag'):
+                headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                headers['If-Modified-Since'] = entry['last_modified']
+        
+        response = self.request(url, params=params, headers=headers)
+        if response.status_code == 304 and entry is not None:
+            self._count('not_modified')
+            entry['fetched_at'] = time.time()
+            self._save_entry(path, entry)
+            return json.loads(entry['body'])
+        
+        response.raise_for_status()
+        payload = response.json()
+        self._save_entry(path, {
+            'url': url,
+            'fetched_at': time.time(),
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified'),
+            'body': response.text
+        })
+        return payload
+    
+    def prune(self, max_age: float = 7 * 86400):
+        """Delete cache entries not refreshed within ``max_age`` seconds"""
+        cutoff = time.time() - max_age
+        for name in os.listdir(self.cache_dir):
+            path = os.path.join(self.cache_dir, name)
+            try:
+                if os.path.getmtime(path) < cutoff:
+                    os.remove(path)
+            except OSError:
+                continue
+    
+    def close(self):
+        self.session.close()
+
+class AdaptiveWeights:
+    """Adaptive indicator weights stored as an (asset types x indicators) matrix
+    
+    ``weights[asset_type]`` returns a row as an indicator -> weight dict, so
+    callers read it like the per-type dicts it replaces. A cycle's updates for
+    an asset type run as one EMA filter over the stacked information gains.
+    Realized forward returns shift weight toward the directional indicators
+    that pointed the right way. The whole state checkpoints to JSON.
+    """
+    
+    INDICATORS = ['rsi', 'macd', 'bb_squeeze', 'stochastic', 'ema_cross',
+                  'volume_profile', 'momentum', 'volatility']
+    DIRECTIONAL = ['rsi', 'macd', 'stochastic', 'ema_cross', 'momentum']
+    
+    def __init__(self, asset_types: List[str], alpha: float = 0.1, feedback_rate: float = 0.05):
+        self.alpha = alpha
+        self.feedback_rate = feedback_rate
+        self.indicators = list(self.INDICATORS)
+        self.columns = {indicator: j for j, indicator in enumerate(self.indicators)}
+        self.directional = np.array([self.columns[indicator] for indicator in self.DIRECTIONAL])
+        self.asset_types = []
+        self.rows = {}
+        self.matrix = np.zeros((0, len(self.indicators)))
+        self.pending = {}  # symbol -> {'asset_type', 'price', 'signals'} awaiting a forward return
+        
+        for asset_type in asset_types:
+            self._add_row(asset_type)
+    
+    def _add_row(self, asset_type: str) -> int:
+        self.rows[asset_type] = len(self.asset_types)
+        self.asset_types.append(asset_type)
+        self.matrix = np.vstack([self.matrix, np.full((1, len(self.indicators)), 1.0 / len(self.indicators))])
+        return self.rows[asset_type]
+    
+    def __contains__(self, asset_type: str) -> bool:
+        return asset_type in self.rows
+    
+    def __getitem__(self, asset_type: str) -> Dict[str, float]:
+        return self.as_dict(self.matrix[self.rows[asset_type]])
+    
+    def __setitem__(self, asset_type: str, weights: Dict[str, float]):
+        row = self.rows[asset_type] if asset_type in self.rows else self._add_row(asset_type)
+        for indicator, weight in weights.items():
+            if indicator in self.columns:
+                self.matrix[row, self.columns[indicator]] = float(weight)
+    
+    def get(self, asset_type: str, default=None):
+        return self[asset_type] if asset_type in self.rows else default
+    
+    def keys(self) -> List[str]:
+        return list(self.asset_types)
+    
+    def items(self):
+        return [(asset_type, self[asset_type]) for asset_type in self.asset_types]
+    
+    def to_dict(self) -> Dict[str, Dict[str, float]]:
+        return dict(self.items())
+    
+    def as_dict(self, row: np.ndarray) -> Dict[str, float]:
+        return {indicator: float(row[j]) for indicator, j in self.columns.items()}
+    
+    def information_gains(self, indicators_list: List[Dict]) -> Tuple[np.ndarray, np.ndarray]:
+        """Normalized information gain per indicator for each dict, plus which indicators were present"""
+        present = np.array([[indicator in (indicators or {}) for indicator in self.indicators]
+                            for indicators in indicators_list], dtype=bool).reshape(-1, len(self.indicators))
+        values = np.array([[float((indicators or {}).get(indicator, 0.0)) for indicator in self.indicators]
+                           for indicators in indicators_list]).reshape(-1, len(self.indicators))
+        
+        # Deviation from neutral: RSI and stochastic around 50, everything else around 0
+        centred = [self.columns['rsi'], self.columns['stochastic']]
+        gains = np.minimum(np.abs(values) * 10, 1.0)
+        gains[:, centred] = np.abs(values[:, centred] - 50) / 50
+        gains = np.where(present & np.isfinite(gains), gains, 0.0)
+        
+        totals = gains.sum(axis=1, keepdims=True)
+        return gains / np.where(totals > 0, totals, 1.0), present
+    
+    def update(self, asset_type: str, indicators: Dict) -> Dict[str, float]:
+        """Apply a single update and return the new weights"""
+        return self.as_dict(self.update_batch(asset_type, [indicators])[-1])
+    
+    def update_batch(self, asset_type: str, indicators_list: List[Dict]) -> np.ndarray:
+        """Apply one update per indicator dict, in order; returns the weights after each step
+        
+        When every dict carries every indicator the weights keep summing to one,
+        so the updates reduce to w_k = alpha * gain_k + (1 - alpha) * w_(k-1)
+        and run as a single IIR filter down the stacked gains.
+        """
+        row = self.rows[asset_type] if asset_type in self.rows else self._add_row(asset_type)
+        if not indicators_list:
+            return np.zeros((0, len(self.indicators)))
+        
+        gains, present = self.information_gains(indicators_list)
+        initial = self.matrix[row].copy()
+        alpha = self.alpha
+        
+        if (present.all(axis=1) | ~present.any(axis=1)).all():
+            # Empty dicts and all-neutral readings leave the weights unchanged
+            informative = present.all(axis=1) & (gains.sum(axis=1) > 0)
+            steps = np.tile(initial, (len(indicators_list), 1))
+            if informative.any():
+                filtered, _ = lfilter([alpha], [1.0, -(1 - alpha)], gains[informative], axis=0,
+                                      zi=((1 - alpha) * initial)[None, :])
+                latest = np.cumsum(informative) - 1
+                steps[latest >= 0] = filtered[latest[latest >= 0]]
+        else:
+            # Partially populated dicts renormalize after every step, so replay them one by one
+            steps = np.empty((len(indicators_list), len(self.indicators)))
+            weights = initial
+            for k in range(len(indicators_list)):
+                mask = present[k]
+                weights[mask] = alpha * gains[k, mask] + (1 - alpha) * weights[mask]
+                weights /= weights.sum() or 1.0
+                steps[k] = weights
+        
+        self.matrix[row] = steps[-1]
+        return steps
+    
+    def directional_signals(self, indicators: Dict) -> np.ndarray:
+        """Directional indicators mapped to [-1, 1] as in the confluence score"""
+        return np.array([
+            (indicators.get('rsi', 50) - 50) / 50,
+            np.tanh(indicators.get('macd', 0) * 100),
+            (indicators.get('stochastic', 50) - 50) / 50,
+            np.tanh(indicators.get('ema_cross', 0) * 100),
+            np.tanh(indicators.get('momentum', 0) * 10)
+        ], dtype=float)
+    
+    def apply_feedback(self, asset_type: str, signals: np.ndarray, returns: np.ndarray) -> bool:
+        """Move weight toward directional indicators whose signals matched realized returns
+        
+        ``signals`` holds one row of ``directional_signals`` per observation and
+        ``returns`` the forward return that followed it. Non-directional
+        indicators keep their share of the total weight.
+        """
+        if asset_type not in self.rows or len(returns) == 0:
+            return False
+        
+        rewards = np.clip(np.nan_to_num(signals * np.asarray(returns, dtype=float)[:, None]), 0, None).sum(axis=0)
+        if rewards.sum() <= 0:
+            return False
+        
+        row = self.matrix[self.rows[asset_type]]
+        share = row[self.directional].sum()
+        row[self.directional] = (1 - self.feedback_rate) * row[self.directional] + \
+            self.feedback_rate * share * rewards / rewards.sum()
+        return True
+    
+    def record(self, symbol: str, asset_type: str, price: float, indicators: Dict):
+        """Remember this run's signals so the next run can score them against the realized return"""
+        self.pending[symbol] = {
+            'asset_type': asset_type,
+            'price': float(price),
+            'signals': self.directional_signals(indicators).tolist()
+        }
+    
+    def realize(self, prices: Dict[str, Tuple[str, float]]) -> int:
+        """Feed back forward returns of pending signals, one batched step per asset type
+        
+        ``prices`` maps symbol -> (asset_type, latest price). Returns the number
+        of asset types whose weights moved.
+        """
+        groups = {}
+        for symbol, (asset_type, price) in prices.items():
+            pending = self.pending.get(symbol)
+            if pending is None or pending['asset_type'] != asset_type or not pending['price'] or not np.isfinite(price):
+                continue
+            signals, returns = groups.setdefault(asset_type, ([], []))
+            signals.append(pending['signals'])
+            returns.append(price / pending['price'] - 1)
+        
+        return sum(
+            self.apply_feedback(asset_type, np.array(signals, dtype=float), np.array(returns))
+            for asset_type, (signals, returns) in groups.items()
+        )
+    
+    def save(self, path: str):
+        """Checkpoint weights and pending signals atomically"""
+        payload = {
+            'indicators': self.indicators,
+            'weights': self.to_dict(),
+            'pending': self.pending,
+            'saved_at': datetime.now().isoformat()
+        }
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(payload, f)
+        os.replace(tmp_path, path)
+    
+    def load(self, path: str) -> bool:
+        """Restore a checkpoint for the configured asset types; False if there is none"""
+        if not os.path.exists(path):
+            return False
+        
+        try:
+            with open(path) as f:
+                payload = json.load(f)
+        except Exception as e:
+            print(f"Warning: Ignoring unreadable weights checkpoint: {str(e)}")
+            return False
+        
+        for asset_type, weights in payload.get('weights', {}).items():
+            if asset_type in self.rows:
+                self[asset_type] = weights
+        self.pending = payload.get('pending', {})
+        return True
+
+# Packed shape records for the 3D view: shape_buffer.bin / shape_delta.bin are a
+# SHAPE_HEADER followed by fixed-stride little-endian records; shape_index.json
+# maps record indices to symbols. Colour channels are quantized to value * 255.
+SHAPE_TYPES = ['sphere', 'tetrahedron', 'octahedron', 'icosahedron']
+SHAPE_BUFFER_VERSION = 1
+SHAPE_HEADER = struct.Struct('<4sHHIII')  # magic, version, stride, record count, generation, base generation
+SHAPE_RECORD_DTYPE = np.dtype({
+    'names': ['x', 'y', 'z', 'scale_base', 'volatility_multiplier', 'pulse_frequency',
+              'rotation_speed', 'oscillation_amplitude', 'index',
+              'hue', 'saturation', 'lightness', 'shape_type', 'asset_type'],
+    'formats': ['<f4'] * 8 + ['<u4'] + ['u1'] * 5,
+    'offsets': [0, 4, 8, 12, 16, 20, 24, 28, 32, 36, 37, 38, 39, 40],
+    'itemsize': 44
+})
+
+def confluence_angle(indicator: str) -> float:
+    """Fixed 3D mapping angle for an indicator; crc32 so it is identical in every process"""
+    return zlib.crc32(indicator.encode('utf-8')) % 360 * np.pi / 180
 
 class FinancialMarketEngine:
-    def __init__(self, data_dir="data", news_api_key=None):
+    def __init__(self, data_dir="data", news_api_key=None, max_workers: int = 8,
+                 provider_limits: Optional[Dict[str, int]] = None,
+                 use_store: bool = True, offline: bool = False,
+                 sentiment_ttl: Optional[Dict[str, int]] = None, sentiment_workers: int = 2,
+                 use_msgpack: bool = False, yahoo_batch_size: int = 50,
+                 http_cache_ttl: int = 300, shape_output: str = 'both',
+                 processes: int = 0, shard_chunk_size: Optional[int] = None,
+                 resume_weights: bool = True):
         self.data_dir = data_dir
         self.news_api_key = news_api_key
         os.makedirs(data_dir, exist_ok=True)
+        self.writer = MarketDataWriter(data_dir, use_msgpack=use_msgpack)
+        
+        # Shape mapping output: 'json', 'binary' (packed records + delta frame) or 'both'
+        self.shape_output = shape_output
+        self._shape_frame = ([], None)  # (symbol keys, records) of the last binary frame
+        self._shape_generation = 0
+        
+        # Local OHLCV store: only bars newer than the last stored one are fetched
+        self.offline = offline
+        self.history_window = timedelta(days=365)
+        self.store = None
+        if use_store:
+            if pyarrow is None:
+                print("Warning: pyarrow not installed, OHLCV store disabled")
+            else:
+                self.store = OHLCVStore(os.path.join(data_dir, 'ohlcv'))
+        
+        # Concurrent ingestion: bounded in-flight requests per provider
+        self.max_workers = max_workers
+        self.provider_limits = provider_limits or {
+            'yahoo': 4,
+            'coingecko': 2,
+            'newsapi': 2
+        }
+        self.provider_semaphores = {
+            provider: threading.BoundedSemaphore(limit)
+            for provider, limit in self.provider_limits.items()
+        }
+        self.asset_timings = {}
+        self.stage_timings = {}  # pipeline stage -> seconds spent in the last run
+        
+        # Sharded analysis: with processes > 1 the CPU-bound work runs in a process pool
+        self.processes = processes
+        self.shard_chunk_size = shard_chunk_size
+        self._shard_pool = None
+        
+        # Shared HTTP client for CoinGecko and NewsAPI (yfinance manages its own session)
+        self.http = CachedHTTPClient(
+            os.path.join(data_dir, 'http_cache'),
+            host_limits={
+                'api.coingecko.com': self.provider_limits.get('coingecko', 2),
+                'newsapi.org': self.provider_limits.get('newsapi', 2)
+            },
+            ttl=http_cache_ttl
+        )
+        
+        # Yahoo tickers are downloaded this many per request; 0 fetches one ticker at a time
+        self.yahoo_batch_size = yahoo_batch_size
         
         # Initialize sentiment analyzer
         self.analyzer = SentimentIntensityAnalyzer()
         
+        # Sentiment cache: query TTLs in seconds by asset or asset type, 'default' otherwise
+        self.sentiment_ttl = {'default': 3600, 'crypto_coins': 900}
+        self.sentiment_ttl.update(sentiment_ttl or {})
+        self.sentiment_cache = SentimentCache(os.path.join(data_dir, 'sentiment_cache.json'))
+        self.sentiment_workers = sentiment_workers
+        self.sentiment_batch_size = 64
+        # Created here, on the main thread; a run's new articles are scored together, so batches fill up
+        self._sentiment_pool = ProcessPoolExecutor(max_workers=sentiment_workers) if sentiment_workers > 1 else None
+        
         # Asset configurations
         self.asset_config = {
             'stocks': ["^GSPC", "^DJI", "^IXIC", "AAPL", "MSFT", "GOOGL", "TSLA"],
@@ -34,31 +735,60 @@ class FinancialMarketEngine:
             'futures': ["CL=F", "NG=F", "ZC=F"]  # Oil, Natural Gas, Corn
         }
         
-        # Adaptive weights system
-        self.adaptive_weights = {}
+        # Adaptive weights system, resumed from the last checkpoint so learning carries over
+        self.weights_checkpoint = os.path.join(data_dir, 'adaptive_weights_state.json')
         self.initialize_weights()
+        self.weights_restored = self.load_adaptive_weights() if resume_weights else False
         
-        # Market data storage
+        # Market data storage, kept between runs of a long-lived engine
         self.market_data = {}
+        self.frames = {}
         self.indicators = {}
         self.sentiment_scores = {}
-        self.correlations = {}
+        self.correlation_symbols = []
+        self.correlation_matrix = np.zeros((0, 0))
+        self.return_correlation_method = 'pearson'
+        self.return_correlation_symbols = []
+        self.return_correlation_matrix = np.zeros((0, 0))
+        
+        # Resonance view: per-symbol spectra are cached and reused across runs
+        self.resonance_top_k = 10
+        self.resonance = {}
+        self._spectrum_cache = {}
         
     def initialize_weights(self):
-        """Initialize adaptive weights for all indicators"""
-        indicators = ['rsi', 'macd', 'bb_squeeze', 'stochastic', 'ema_cross', 
-                     'volume_profile', 'momentum', 'volatility']
+        """Initialize uniform adaptive weights for all indicators"""
+        self.adaptive_weights = AdaptiveWeights(list(self.asset_config.keys()))
+
+    def load_adaptive_weights(self, path: Optional[str] = None) -> bool:
+        """Resume adaptive weights from the checkpoint, or from a previous run's adaptive_weights.json"""
+        if path is None and self.adaptive_weights.load(self.weights_checkpoint):
+            return True
         
-        for asset_type in self.asset_config.keys():
-            self.adaptive_weights[asset_type] = {
-                indicator: 1.0 / len(indicators) for indicator in indicators
-            }
+        path = path or os.path.join(self.data_dir, 'adaptive_weights.json')
+        if not os.path.exists(path):
+            return False
+        
+        try:
+            with open(path) as f:
+                saved = json.load(f)
+        except Exception as e:
+            print(f"Warning: Could not load adaptive weights: {str(e)}")
+            return False
+        
+        for asset_type, weights in saved.items():
+            if asset_type in self.adaptive_weights:
+                self.adaptive_weights[asset_type] = weights
+        return True
 
-    def fetch_yfinance_data(self, ticker: str, period: str = "1y") -> pd.DataFrame:
+    def fetch_yfinance_data(self, ticker: str, period: str = "1y", start: Optional[str] = None) -> pd.DataFrame:
         """Enhanced Yahoo Finance data fetching with error handling"""
         try:
             stock = yf.Ticker(ticker)
-            df = stock.history(period=period, auto_adjust=True)
+            if start:
+                df = stock.history(start=start, auto_adjust=True)
+            else:
+                df = stock.history(period=period, auto_adjust=True)
             
             if df.empty:
                 print(f"Warning: No data retrieved for {ticker}")
@@ -72,6 +802,65 @@ class FinancialMarketEngine:
             print(f"Error fetching {ticker}: {str(e)}")
             return pd.DataFrame()
 
+    def fetch_yfinance_batch(self, tickers: List[str], period: str = "1y",
+                             start: Optional[str] = None) -> Dict[str, pd.DataFrame]:
+        """Download many tickers per request; tickers that fail are left out of the result"""
+        frames = {}
+        size = max(self.yahoo_batch_size, 1)
+        window = {'start': start} if start else {'period': period}
+        
+        for i in range(0, len(tickers), size):
+            batch = tickers[i:i + size]
+            try:
+                raw = yf.download(batch, group_by='ticker', threads=True, auto_adjust=True,
+                                  progress=False, ignore_tz=False, **window)
+            except Exception as e:
+                print(f"Error batch fetching {len(batch)} tickers: {str(e)}")
+                continue
+            
+            for ticker in batch:
+                if isinstance(raw.columns, pd.MultiIndex):
+                    if ticker not in raw.columns.get_level_values(0):
+                        continue
+                    df = raw[ticker]
+                elif len(batch) == 1:
+                    df = raw
+                else:
+                    continue
+                
+                # The wide frame is indexed by the union of all tickers' dates
+                df = df.dropna(how='all')
+                if df.empty:
+                    continue
+                
+                df = df.rename_axis('Date').reset_index()
+                df.columns.name = None
+                df['Symbol'] = ticker
+                frames[ticker] = df
+        
+        return frames
+
+    def prefetch_yfinance(self, tickers: List[str]) -> Dict[str, pd.DataFrame]:
+        """Batch-download Yahoo bars for a run, grouping tickers that need the same window
+        
+        Tickers missing from the result (failed or empty in the batch) are
+        fetched one at a time by ``fetch_price_history`` afterwards.
+        """
+        if self.offline or self.yahoo_batch_size <= 0 or not tickers:
+            return {}
+        
+        # Stored tickers only need bars from their last stored date onwards
+        groups = {}
+        for ticker in tickers:
+            last = self.store.last_timestamp(ticker) if self.store is not None else None
+            groups.setdefault(last.strftime('%Y-%m-%d') if last is not None else None, []).append(ticker)
+        
+        frames = {}
+        for start, group in groups.items():
+            with self.provider_semaphores['yahoo']:
+                frames.update(self.fetch_yfinance_batch(group, start=start))
+        return frames
+
     def fetch_crypto_data(self, coin_id: str, days: int = 365) -> pd.DataFrame:
         """Fetch cryptocurrency data from CoinGecko with enhanced metrics"""
         try:
@@ -83,8 +872,7 @@ class FinancialMarketEngine:
                 'interval': 'daily'
             }
             
-            response = requests.get(url, params=params)
-            data = response.json()
+            data = self.http.get_json(url, params=params)
             
             if 'prices' not in data:
                 print(f"Warning: No price data for {coin_id}")
@@ -107,10 +895,78 @@ class FinancialMarketEngine:
             print(f"Error fetching crypto data for {coin_id}: {str(e)}")
             return pd.DataFrame()
 
+    def fetch_price_history(self, asset_type: str, asset: str,
+                            prefetched: Optional[pd.DataFrame] = None) -> pd.DataFrame:
+        """Fetch price history through the OHLCV store, requesting only new bars
+        
+        ``prefetched`` holds bars already downloaded by a batch request.
+        """
+        is_crypto = asset_type == 'crypto_coins'
+        if self.store is None:
+            if prefetched is not None:
+                return prefetched
+            return self.fetch_crypto_data(asset) if is_crypto else self.fetch_yfinance_data(asset)
+        
+        last = self.store.last_timestamp(asset)
+        if not self.offline:
+            # Re-request the last stored bar as well, it may have been partial
+            if prefetched is not None:
+                df = prefetched
+            elif last is None:
+                df = self.fetch_crypto_data(asset) if is_crypto else self.fetch_yfinance_data(asset)
+            elif is_crypto:
+                days = max((pd.Timestamp.now(tz=last.tz) - last).days + 1, 1)
+                df = self.fetch_crypto_data(asset, days=days)
+            else:
+                df = self.fetch_yfinance_data(asset, start=last.strftime('%Y-%m-%d'))
+            
+            if not df.empty:
+                last = self.store.append(asset, df)['Date'].iloc[-1]
+        
+        if last is None:
+            return pd.DataFrame()
+        
+        # Serve the same one-year window a full fetch would return
+        return self.store.load(asset, since=last - self.history_window)
+
+    def _sentiment_ttl_for(self, asset: str) -> float:
+        """Query TTL for an asset: per-asset override, then asset type, then default"""
+        if asset in self.sentiment_ttl:
+            return self.sentiment_ttl[asset]
+        for asset_type, assets in self.asset_config.items():
+            if asset in assets and asset_type in self.sentiment_ttl:
+                return self.sentiment_ttl[asset_type]
+        return self.sentiment_ttl['default']
+
+    def score_texts(self, texts: List[str]) -> List[float]:
+        """VADER compound scores, batched across a process pool for large inputs"""
+        if len(texts) < self.sentiment_batch_size or self._sentiment_pool is None:
+            return [self.analyzer.polarity_scores(text)['compound'] for text in texts]
+        
+        size = self.sentiment_batch_size
+        batches = [texts[i:i + size] for i in range(0, len(texts), size)]
+        return [score for batch in self._sentiment_pool.map(_score_texts, batches) for score in batch]
+
     def fetch_news_sentiment(self, asset: str, max_articles: int = 50) -> float:
-        """Fetch and analyze news sentiment for an asset"""
-        if not self.news_api_key:
+        """Fetch and analyze news sentiment for an asset, reusing cached article scores"""
+        articles = self.fetch_news_articles(asset, max_articles)
+        if isinstance(articles, tuple):
+            return self.score_news_articles({asset: articles})[asset]
+        return articles
+
+    def fetch_news_articles(self, asset: str, max_articles: int = 50) -> Union[float, Tuple[List[str], Dict[str, str]]]:
+        """Cached sentiment for an asset, or its fetched articles still to be scored
+        
+        Articles come back as (article keys, text by key) so a whole run's new
+        articles can go through ``score_news_articles`` together.
+        """
+        if not self.news_api_key and not self.offline:
             return 0.0
+        
+        # Offline reruns use whatever was cached last, regardless of age
+        cached = self.sentiment_cache.query_scores(asset, None if self.offline else self._sentiment_ttl_for(asset))
+        if cached is not None or self.offline:
+            return np.mean(cached) if cached else 0.0
             
         try:
             # Clean asset name for search
@@ -125,28 +981,46 @@ class FinancialMarketEngine:
                 'apiKey': self.news_api_key
             }
             
-            response = requests.get(url, params=params)
-            data = response.json()
+            # Fresh within the sentiment TTL anyway, so only conditional revalidation applies
+            data = self.http.get_json(url, params=params, ttl=0)
             
             if 'articles' not in data:
                 return 0.0
             
-            sentiments = []
+            keys = []
+            texts = {}
             for article in data['articles']:
                 title = article.get('title', '')
                 description = article.get('description', '')
                 text = f"{title} {description}"
                 
                 if text.strip():
-                    sentiment = self.analyzer.polarity_scores(text)
-                    sentiments.append(sentiment['compound'])
+                    key = self.sentiment_cache.article_key(article, text)
+                    keys.append(key)
+                    texts[key] = text
             
-            return np.mean(sentiments) if sentiments else 0.0
+            return keys, texts
             
         except Exception as e:
             print(f"Error fetching sentiment for {asset}: {str(e)}")
             return 0.0
 
+    def score_news_articles(self, pending: Dict[str, Tuple[List[str], Dict[str, str]]]) -> Dict[str, float]:
+        """Score fetched articles for many assets in one ``score_texts`` call; returns sentiment by asset"""
+        texts = {}
+        for _, asset_texts in pending.values():
+            texts.update(asset_texts)
+        
+        # Only articles never seen before (e.g. by another asset's query) are scored
+        new_keys = self.sentiment_cache.missing(list(texts))
+        scores = dict(zip(new_keys, self.score_texts([texts[key] for key in new_keys])))
+        
+        sentiments = {}
+        for asset, (keys, _) in pending.items():
+            asset_scores = self.sentiment_cache.store(asset, keys, {key: scores[key] for key in keys if key in scores})
+            sentiments[asset] = np.mean(asset_scores) if asset_scores else 0.0
+        return sentiments
+
     def calculate_technical_indicators(self, df: pd.DataFrame) -> Dict:
         """Calculate comprehensive technical indicators"""
         if df.empty or 'Close' not in df.columns:
@@ -212,7 +1086,116 @@ class FinancialMarketEngine:
         
         return indicators
 
-    def calculate_geometric_entropy(self, price_series: pd.Series) -> float:
+    @staticmethod
+    def _ewm_panel(values: np.ndarray, span: int) -> np.ndarray:
+        """Column-wise equivalent of ``Series.ewm(span=span).mean()`` for a 2-D panel"""
+        alpha = 2.0 / (span + 1.0)
+        valid = ~np.isnan(values)
+        coefficients = [1.0, -(1.0 - alpha)]
+        
+        # adjust=True weighting: running weighted sum over running weight total
+        weighted_sum = lfilter([1.0], coefficients, np.where(valid, values, 0.0), axis=0)
+        weight_total = lfilter([1.0], coefficients, valid.astype(float), axis=0)
+        
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return weighted_sum / weight_total
+
+    @staticmethod
+    def _build_panel(frames: Dict[str, pd.DataFrame]) -> Tuple[List[str], np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Right-align every asset's OHLCV history into (bars x symbols) panels"""
+        symbols = [symbol for symbol, df in frames.items() if not df.empty and 'Close' in df.columns]
+        lengths = np.array([len(frames[symbol]) for symbol in symbols], dtype=int)
+        rows = int(lengths.max()) if symbols else 0
+        
+        def stack(column: str, fallback: Optional[str]) -> np.ndarray:
+            panel = np.full((rows, len(symbols)), np.nan)
+            for j, symbol in enumerate(symbols):
+                df = frames[symbol]
+                if column in df.columns:
+                    values = df[column].to_numpy(dtype=float)
+                elif fallback is not None:
+                    values = df[fallback].to_numpy(dtype=float)
+                else:
+                    values = np.ones(len(df))
+                panel[rows - len(values):, j] = values
+            return panel
+        
+        return symbols, lengths, stack('Close', None), stack('High', 'Close'), stack('Low', 'Close'), stack('Volume', None)
+
+    @staticmethod
+    def calculate_indicator_panel(frames: Dict[str, pd.DataFrame]) -> Dict[str, Dict]:
+        """Calculate technical indicators for many assets in one vectorized pass
+        
+        Each asset's history is right-aligned into a (bars x symbols) panel, so
+        row -1 is every symbol's latest bar and each column only sees its own
+        history (crypto and equity calendars differ). Returns the same
+        dict-per-symbol shape as ``calculate_technical_indicators``.
+        """
+        symbols, lengths, close, high, low, volume = FinancialMarketEngine._build_panel(frames)
+        if not symbols:
+            return {}
+        rows = close.shape[0]
+        last_close = close[-1]
+        
+        with np.errstate(divide='ignore', invalid='ignore'):
+            # RSI
+            # Reductions run over each symbol's own contiguous row so a symbol's
+            # result does not depend on which other symbols share the panel
+            delta = np.diff(close[-15:], axis=0).T.copy()
+            avg_gain = np.clip(delta, 0, None).mean(axis=1)
+            avg_loss = np.clip(-delta, 0, None).mean(axis=1)
+            rsi = 100 - (100 / (1 + avg_gain / avg_loss))
+            
+            # MACD and EMA crossover share the same EMAs
+            ema12 = FinancialMarketEngine._ewm_panel(close, 12)
+            ema26 = FinancialMarketEngine._ewm_panel(close, 26)
+            macd_line = ema12 - ema26
+            signal_line = FinancialMarketEngine._ewm_panel(macd_line, 9)
+            macd = macd_line[-1] - signal_line[-1]
+            ema_cross = (ema12[-1] - ema26[-1]) / last_close
+            
+            # Bollinger Bands Squeeze: (upper - lower) / sma20 == 4 * std / sma20
+            window = close[-20:].T.copy()
+            bb_squeeze = 4 * window.std(axis=1, ddof=1) / window.mean(axis=1)
+            
+            # Stochastic
+            lowest_low = low[-14:].min(axis=0)
+            highest_high = high[-14:].max(axis=0)
+            stochastic = 100 * (last_close - lowest_low) / (highest_high - lowest_low)
+            
+            # Volume Profile (simplified)
+            avg_volume = volume[-20:].T.copy().mean(axis=1)
+            volume_profile = (volume[-1] - avg_volume) / avg_volume
+            
+            # Momentum
+            reference = close[max(rows - 10, 0)]
+            momentum = (last_close - reference) / reference
+            
+            # Volatility (ATR-based); fmax skips the missing previous close like DataFrame.max()
+            previous_close = np.vstack([np.full((1, len(symbols)), np.nan), close[:-1]])[-14:]
+            true_range = np.fmax(high[-14:] - low[-14:],
+                                 np.fmax(np.abs(high[-14:] - previous_close),
+                                         np.abs(low[-14:] - previous_close)))
+            volatility = true_range.T.copy().mean(axis=1) / last_close
+        
+        columns = {
+            'rsi': np.where(lengths > 14, rsi, 50),
+            'macd': np.where(lengths > 26, macd, 0),
+            'bb_squeeze': np.where(lengths > 20, bb_squeeze, 0.1),
+            'stochastic': np.where(lengths > 14, stochastic, 50),
+            'ema_cross': np.where(lengths > 26, ema_cross, 0),
+            'volume_profile': np.where(lengths > 20, volume_profile, 0),
+            'momentum': np.where(lengths > 10, momentum, 0),
+            'volatility': np.where(lengths > 14, volatility, 0.02)
+        }
+        
+        return {
+            symbol: {indicator: float(values[j]) for indicator, values in columns.items()}
+            for j, symbol in enumerate(symbols)
+        }
+
+    @staticmethod
+    def calculate_geometric_entropy(price_series: pd.Series) -> float:
         """Calculate geometric entropy for chaos measurement"""
         if len(price_series) < 10:
             return 0.5
@@ -253,7 +1236,7 @@ class FinancialMarketEngine:
             if indicator in weights:
                 weight = weights[indicator]
                 # Map to 3D space
-                angle = hash(indicator) % 360 * np.pi / 180
+                angle = confluence_angle(indicator)
                 vector[0] += weight * value * np.cos(angle)
                 vector[1] += weight * value * np.sin(angle)
                 vector[2] += weight * value * np.cos(angle * 2)
@@ -289,170 +1272,506 @@ class FinancialMarketEngine:
             print(f"Error calculating resonance: {str(e)}")
             return 0.0
 
+    def calculate_resonance_matrix(self, frames: Dict[str, pd.DataFrame], window: Optional[int] = None,
+                                   top_k: Optional[int] = None, block_size: int = 256) -> Dict:
+        """Calculate cross-asset resonance for every pair from one rFFT per asset
+        
+        Closes are aligned on one calendar (the union of all assets' days, each
+        close carried over days its market was shut), so every spectrum covers
+        the same dates. By default the window spans the dates every asset
+        covers; an explicit ``window`` takes that many trailing days and leaves
+        out assets that start later. Matches ``calculate_cross_asset_resonance``
+        on each pair's aligned closes: since |A * conj(B)| = |A| |B|, the mean
+        cross-power is a weighted dot product of magnitude spectra. With
+        ``top_k`` only the k strongest partners per asset are kept, ranked by
+        uncapped cross-power.
+        """
+        closes = {}
+        for symbol, df in frames.items():
+            close = self._daily_closes(df)
+            if close is not None and len(close) >= 10:
+                closes[symbol] = close
+        if len(closes) < 2:
+            return {}
+        
+        aligned = pd.DataFrame(closes).sort_index().ffill()
+        if window is None:
+            aligned = aligned.loc[max(close.index[0] for close in closes.values()):]
+        else:
+            aligned = aligned.iloc[-window:]
+        aligned = aligned.loc[:, aligned.iloc[0].notna()] if len(aligned) else aligned
+        
+        window = len(aligned)
+        symbols = list(aligned.columns)
+        if len(symbols) < 2 or window < 2:
+            return {}
+        
+        values = np.ascontiguousarray(aligned.to_numpy(dtype=float).T)
+        spectra = np.vstack([self._magnitude_spectrum(symbol, row) for symbol, row in zip(symbols, values)])
+        
+        # rfft keeps one side of the spectrum; interior bins count twice in the full FFT
+        bin_weights = np.full(spectra.shape[1], 2.0)
+        bin_weights[0] = 1.0
+        if window % 2 == 0:
+            bin_weights[-1] = 1.0
+        weighted = spectra * bin_weights / window
+        
+        if top_k is None:
+            return {'symbols': symbols, 'window': window, 'matrix': np.minimum(weighted @ spectra.T, 1.0)}
+        
+        k = min(top_k, len(symbols) - 1)
+        partners = {}
+        for start in range(0, len(symbols), block_size):
+            block = weighted[start:start + block_size] @ spectra.T
+            rows = np.arange(block.shape[0])
+            block[rows, rows + start] = -np.inf
+            
+            best = np.argpartition(-block, k - 1, axis=1)[:, :k]
+            order = np.argsort(-block[rows[:, None], best], axis=1)
+            best = best[rows[:, None], order]
+            for row, columns in zip(rows, best):
+                partners[symbols[start + row]] = [
+                    (symbols[column], float(min(block[row, column], 1.0))) for column in columns
+                ]
+        
+        return {'symbols': symbols, 'window': window, 'top_k': partners}
+
+    def _magnitude_spectrum(self, symbol: str, values: np.ndarray) -> np.ndarray:
+        """|rFFT| of the z-scored series, cached per symbol until its windowed closes change"""
+        key = hashlib.blake2b(np.ascontiguousarray(values, dtype=float).tobytes(), digest_size=16).digest()
+        cached = self._spectrum_cache.get(symbol)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        
+        with np.errstate(divide='ignore', invalid='ignore'):
+            normalized = (values - np.nanmean(values)) / np.nanstd(values, ddof=1)
+        spectrum = np.abs(rfft(np.nan_to_num(normalized, nan=0.0, posinf=0.0, neginf=0.0)))
+        
+        self._spectrum_cache[symbol] = (key, spectrum)
+        return spectrum
+
     def update_adaptive_weights(self, asset_type: str, indicators: Dict, performance_feedback: float = None):
-        """Update adaptive weights based on indicator performance"""
+        """Update adaptive weights based on indicator performance
+        
+        ``performance_feedback`` is the realized forward return that followed
+        ``indicators``; when given, weight also shifts toward the directional
+        indicators that predicted it.
+        """
         if asset_type not in self.adaptive_weights:
             return
         
-        current_weights = self.adaptive_weights[asset_type]
-        alpha = 0.1  # Learning rate
-        
-        # Calculate information gain for each indicator
-        info_gains = {}
-        for indicator, value in indicators.items():
-            if indicator in current_weights:
-                # Simple info gain based on deviation from neutral
-                if indicator == 'rsi':
-                    info_gains[indicator] = abs(value - 50) / 50
-                elif indicator == 'stochastic':
-                    info_gains[indicator] = abs(value - 50) / 50
-                else:
-                    info_gains[indicator] = min(abs(value) * 10, 1.0)
+        self.adaptive_weights.update(asset_type, indicators)
+        if performance_feedback is not None:
+            signals = self.adaptive_weights.directional_signals(indicators)
+            self.adaptive_weights.apply_feedback(asset_type, signals[None, :], np.array([performance_feedback]))
+
+    @contextmanager
+    def timed_stage(self, stage: str):
+        """Add the block's wall time to ``stage_timings[stage]``"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.stage_timings[stage] = self.stage_timings.get(stage, 0.0) + time.perf_counter() - start
+
+    def _provider_for(self, asset_type: str) -> str:
+        """Map an asset type to the price provider that serves it"""
+        return 'coingecko' if asset_type == 'crypto_coins' else 'yahoo'
+
+    def fetch_asset_inputs(self, asset_type: str, asset: str,
+                           prefetched: Optional[pd.DataFrame] = None) -> Tuple[pd.DataFrame, Any, Dict]:
+        """Fetch price history and news for one asset under provider limits
+        
+        The sentiment slot holds a score, or articles from ``fetch_news_articles``
+        that ``_fetch_all_inputs`` scores together for the whole run.
+        """
+        timing = {}
+        
+        start = time.perf_counter()
+        if prefetched is not None:
+            df = self.fetch_price_history(asset_type, asset, prefetched=prefetched)
+        else:
+            with self.provider_semaphores[self._provider_for(asset_type)]:
+                df = self.fetch_price_history(asset_type, asset)
+        timing['fetch'] = time.perf_counter() - start
+        
+        sentiment = 0.0
+        if not df.empty:
+            start = time.perf_counter()
+            with self.provider_semaphores['newsapi']:
+                sentiment = self.fetch_news_articles(asset)
+            timing['sentiment'] = time.perf_counter() - start
         
-        # Normalize info gains
-        total_gain = sum(info_gains.values()) or 1.0
-        for indicator in info_gains:
-            info_gains[indicator] /= total_gain
+        return df, sentiment, timing
+
+    def analyze_asset(self, asset_type: str, asset: str, df: pd.DataFrame, sentiment: float,
+                      indicators: Optional[Dict] = None, entropy: Optional[float] = None,
+                      weights: Optional[Dict] = None) -> Dict:
+        """Run indicators, entropy, weight update and confluence for one asset"""
+        # Calculate indicators unless the panel engine already did
+        if indicators is None:
+            with self.timed_stage('indicators'):
+                indicators = self.calculate_technical_indicators(df)
+        
+        # Calculate geometric entropy unless a shard worker already did
+        if entropy is None:
+            with self.timed_stage('entropy'):
+                entropy = self.calculate_geometric_entropy(df['Close']) if 'Close' in df.columns else 0.5
+        
+        # Update adaptive weights unless a batched update already produced this asset's step
+        if weights is None:
+            with self.timed_stage('weights'):
+                self.update_adaptive_weights(asset_type, indicators)
+                weights = self.adaptive_weights[asset_type]
         
-        # Update weights
-        for indicator in current_weights:
-            if indicator in info_gains:
-                new_weight = alpha * info_gains[indicator] + (1 - alpha) * current_weights[indicator]
-                current_weights[indicator] = new_weight
+        # Calculate confluence
+        with self.timed_stage('confluence'):
+            confluence_magnitude, confluence_vector = self.calculate_confluence_score(indicators, weights)
         
-        # Renormalize weights
-        total_weight = sum(current_weights.values()) or 1.0
-        for indicator in current_weights:
-            current_weights[indicator] /= total_weight
+        return {
+            'symbol': asset,
+            'current_price': df['Close'].iloc[-1] if 'Close' in df.columns else 0,
+            'price_change_24h': ((df['Close'].iloc[-1] / df['Close'].iloc[-2]) - 1) * 100 if len(df) > 1 and 'Close' in df.columns else 0,
+            'volume': df['Volume'].iloc[-1] if 'Volume' in df.columns else 0,
+            'indicators': indicators,
+            'sentiment': sentiment,
+            'entropy': entropy,
+            'confluence_magnitude': confluence_magnitude,
+            'confluence_vector': confluence_vector.tolist(),
+            'weights': weights.copy(),
+            'last_updated': datetime.now().isoformat()
+        }
 
-    def process_all_assets(self) -> Dict:
-        """Process all configured assets and generate complete market data"""
-        all_data = {}
+    def analyze_asset_type(self, asset_type: str, items: List[Tuple]) -> Tuple[Dict, Dict]:
+        """Analyze one asset type's assets with a single batched weight update
+        
+        ``items`` are (asset, df, sentiment, indicators, entropy) tuples in
+        configuration order; indicators and entropy may be None. Each asset's
+        confluence uses the weights as they stood right after its own update.
+        Returns the per-asset results and analysis seconds.
+        """
+        prepared, timings = [], {}
+        for asset, df, sentiment, indicators, entropy in items:
+            start = time.perf_counter()
+            try:
+                if indicators is None:
+                    with self.timed_stage('indicators'):
+                        indicators = self.calculate_technical_indicators(df)
+            except Exception as e:
+                print(f"Error processing {asset}: {str(e)}")
+                continue
+            prepared.append((asset, df, sentiment, indicators, entropy))
+            timings[asset] = time.perf_counter() - start
+        
+        start = time.perf_counter()
+        with self.timed_stage('weights'):
+            steps = self.adaptive_weights.update_batch(asset_type, [item[3] for item in prepared])
+        batch_share = (time.perf_counter() - start) / max(len(prepared), 1)
+        
+        type_data = {}
+        for (asset, df, sentiment, indicators, entropy), step in zip(prepared, steps):
+            start = time.perf_counter()
+            try:
+                type_data[asset] = self.analyze_asset(
+                    asset_type, asset, df, sentiment, indicators=indicators, entropy=entropy,
+                    weights=self.adaptive_weights.as_dict(step)
+                )
+            except Exception as e:
+                print(f"Error processing {asset}: {str(e)}")
+                continue
+            timings[asset] += batch_share + time.perf_counter() - start
+        
+        return type_data, timings
+
+    def _fetch_all_inputs(self, asset_types: List[str], concurrent: bool) -> Dict[Tuple[str, str], Tuple]:
+        """Fetch inputs for every asset of the given types, keyed by (asset_type, asset)"""
+        jobs = [(asset_type, asset) for asset_type in asset_types for asset in self.asset_config[asset_type]]
+        
+        # Yahoo bars for the whole run in a few multi-ticker downloads
+        yahoo_tickers = [asset for asset_type, asset in jobs if self._provider_for(asset_type) == 'yahoo']
+        start = time.perf_counter()
+        with self.timed_stage('fetch'):
+            prefetched = self.prefetch_yfinance(yahoo_tickers)
+        if prefetched:
+            print(f"📦 Batched Yahoo download: {len(prefetched)}/{len(yahoo_tickers)} tickers "
+                  f"in {time.perf_counter() - start:.2f}s")
+        
+        def safe_fetch(asset_type, asset):
+            try:
+                return self.fetch_asset_inputs(asset_type, asset, prefetched=prefetched.get(asset))
+            except Exception as e:
+                print(f"Error fetching {asset}: {str(e)}")
+                return pd.DataFrame(), 0.0, {}
+        
+        with self.timed_stage('fetch'):
+            if not concurrent:
+                inputs = {job: safe_fetch(*job) for job in jobs}
+            else:
+                with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                    futures = {job: executor.submit(safe_fetch, *job) for job in jobs}
+                    inputs = {job: future.result() for job, future in futures.items()}
+        
+        # Every asset's new articles in one scoring pass, so the sentiment pool gets full batches
+        pending = {job[1]: articles for job, (_, articles, _) in inputs.items() if isinstance(articles, tuple)}
+        if pending:
+            start = time.perf_counter()
+            with self.timed_stage('sentiment'):
+                sentiments = self.score_news_articles(pending)
+            share = (time.perf_counter() - start) / len(pending)
+            for job, (df, articles, timing) in inputs.items():
+                if isinstance(articles, tuple):
+                    timing['sentiment'] = timing.get('sentiment', 0.0) + share
+                    inputs[job] = (df, sentiments[job[1]], timing)
+        return inputs
+
+    def process_all_assets(self, concurrent: bool = False) -> Dict:
+        """Process all configured assets and generate complete market data
+        
+        With ``concurrent=True`` the network fetches run on a thread pool bounded
+        per provider; analysis still runs in configuration order so adaptive
+        weight updates are reproducible.
+        """
+        return self.process_asset_types(list(self.asset_config), concurrent=concurrent)
+
+    def process_asset_types(self, asset_types: List[str], concurrent: bool = False) -> Dict:
+        """Refresh the given asset types, then rebuild cross-asset outputs over all held data"""
+        self.asset_timings = {}
+        self.stage_timings = {}
         
         print("🔄 Processing market data...")
+        run_start = time.perf_counter()
+        inputs = self._fetch_all_inputs(asset_types, concurrent)
+        fetch_elapsed = time.perf_counter() - run_start
         
-        for asset_type, assets in self.asset_config.items():
-            print(f"Processing {asset_type}...")
-            type_data = {}
-            
-            for asset in assets:
-                try:
-                    # Fetch data based on asset type
-                    if asset_type == 'crypto_coins':
-                        df = self.fetch_crypto_data(asset)
-                    else:
-                        df = self.fetch_yfinance_data(asset)
-                    
-                    if df.empty:
-                        continue
-                    
-                    # Calculate indicators
-                    indicators = self.calculate_technical_indicators(df)
-                    
-                    # Get sentiment
-                    sentiment = self.fetch_news_sentiment(asset)
-                    
-                    # Calculate geometric entropy
-                    entropy = self.calculate_geometric_entropy(df['Close']) if 'Close' in df.columns else 0.5
-                    
-                    # Update adaptive weights
-                    self.update_adaptive_weights(asset_type, indicators)
-                    
-                    # Calculate confluence
-                    weights = self.adaptive_weights[asset_type]
-                    confluence_magnitude, confluence_vector = self.calculate_confluence_score(indicators, weights)
-                    
-                    # Store processed data
-                    asset_data = {
-                        'symbol': asset,
-                        'current_price': df['Close'].iloc[-1] if 'Close' in df.columns else 0,
-                        'price_change_24h': ((df['Close'].iloc[-1] / df['Close'].iloc[-2]) - 1) * 100 if len(df) > 1 and 'Close' in df.columns else 0,
-                        'volume': df['Volume'].iloc[-1] if 'Volume' in df.columns else 0,
-                        'indicators': indicators,
-                        'sentiment': sentiment,
-                        'entropy': entropy,
-                        'confluence_magnitude': confluence_magnitude,
-                        'confluence_vector': confluence_vector.tolist(),
-                        'weights': weights.copy(),
-                        'last_updated': datetime.now().isoformat()
-                    }
-                    
-                    type_data[asset] = asset_data
-                    
-                except Exception as e:
-                    print(f"Error processing {asset}: {str(e)}")
-                    continue
-            
-            all_data[asset_type] = type_data
+        # Returns realized since the previous run score that run's signals before new updates
+        latest = {
+            asset: (asset_type, float(df['Close'].iloc[-1]))
+            for (asset_type, asset), (df, _, _) in inputs.items() if not df.empty and 'Close' in df.columns
+        }
+        if self.adaptive_weights.realize(latest):
+            print("🎯 Applied forward-return feedback to adaptive weights")
+        
+        if self.processes > 1:
+            self._analyze_sharded(asset_types, inputs)
+        else:
+            self._analyze_serial(asset_types, inputs)
+        
+        for asset_type in asset_types:
+            for asset, data in self.market_data.get(asset_type, {}).items():
+                self.adaptive_weights.record(asset, asset_type, data['current_price'], data['indicators'])
+        
+        # Keep configuration order regardless of which types were refreshed
+        self.market_data = {
+            asset_type: self.market_data[asset_type]
+            for asset_type in self.asset_config if asset_type in self.market_data
+        }
+        
+        for timing in self.asset_timings.values():
+            timing['total'] = sum(timing.values())
+        self.report_asset_timings(fetch_elapsed)
         
         # Calculate cross-asset correlations
         print("🔄 Calculating cross-asset correlations...")
-        self.calculate_all_correlations(all_data)
+        self.sentiment_cache.save()
+        with self.timed_stage('correlations'):
+            self.calculate_all_correlations(self.market_data)
+            self.calculate_return_correlations(self.frames)
+        with self.timed_stage('resonance'):
+            self.resonance = self.calculate_resonance_matrix(self.frames, top_k=self.resonance_top_k)
         
         # Save processed data
-        self.save_processed_data(all_data)
+        with self.timed_stage('save'):
+            self.save_processed_data(self.market_data)
         
         print("✅ Market data processing complete!")
-        return all_data
+        return self.market_data
 
-    def calculate_all_correlations(self, market_data: Dict):
-        """Calculate correlations between all asset pairs"""
-        self.correlations = {}
+    def _analyze_serial(self, asset_types: List[str], inputs: Dict[Tuple[str, str], Tuple]):
+        """Analyze fetched inputs in this process, in configuration order"""
+        # Indicators for every refreshed asset in one vectorized pass
+        with self.timed_stage('indicators'):
+            panel_indicators = self.calculate_indicator_panel(
+                {asset: df for (_, asset), (df, _, _) in inputs.items()}
+            )
         
-        # Flatten all assets for correlation calculation
-        all_assets = {}
-        for asset_type, assets in market_data.items():
-            for symbol, data in assets.items():
-                all_assets[symbol] = data
+        for asset_type in asset_types:
+            print(f"Processing {asset_type}...")
+            items = []
+            
+            for asset in self.asset_config[asset_type]:
+                df, sentiment, timing = inputs[(asset_type, asset)]
+                self.asset_timings[asset] = timing
+                
+                if df.empty:
+                    self.frames.pop(asset, None)
+                    continue
+                items.append((asset, df, sentiment, panel_indicators.get(asset), None))
+            
+            type_data, timings = self.analyze_asset_type(asset_type, items)
+            for asset, df, *_ in items:
+                if asset in type_data:
+                    self.asset_timings[asset]['analysis'] = timings[asset]
+                    self.frames[asset] = df
+            
+            self.market_data[asset_type] = type_data
+
+    def _get_shard_pool(self) -> ProcessPoolExecutor:
+        if self._shard_pool is None:
+            self._shard_pool = ProcessPoolExecutor(max_workers=self.processes)
+        return self._shard_pool
+
+    def _analyze_sharded(self, asset_types: List[str], inputs: Dict[Tuple[str, str], Tuple]):
+        """Analyze fetched inputs across worker processes, then merge into this engine
         
-        symbols = list(all_assets.keys())
+        Workers only get price frames: the symbols are split into many small
+        indicator/entropy chunks so idle workers keep pulling work while a slow
+        chunk finishes. The weight updates and confluence (cheap, and ordered)
+        then run here exactly as in the serial path.
+        """
+        pool = self._get_shard_pool()
+        frames = {}
+        for asset_type in asset_types:
+            for asset in self.asset_config[asset_type]:
+                df, _, timing = inputs[(asset_type, asset)]
+                self.asset_timings[asset] = timing
+                if not df.empty:
+                    frames[asset] = df
         
-        for i, symbol_a in enumerate(symbols):
-            for j, symbol_b in enumerate(symbols[i+1:], i+1):
+        symbols = list(frames)
+        chunk_size = self.shard_chunk_size or max(1, -(-len(symbols) // (self.processes * 4)))
+        chunks = [
+            pool.submit(_shard_indicator_chunk, {asset: frames[asset] for asset in symbols[i:i + chunk_size]})
+            for i in range(0, len(symbols), chunk_size)
+        ]
+        analysis = {}
+        # Workers compute indicators and entropy together; their wall time is booked as indicators
+        with self.timed_stage('indicators'):
+            for future in chunks:
                 try:
-                    # Use confluence vectors for correlation
-                    vec_a = np.array(all_assets[symbol_a]['confluence_vector'])
-                    vec_b = np.array(all_assets[symbol_b]['confluence_vector'])
-                    
-                    # Calculate cosine similarity
-                    if np.linalg.norm(vec_a) > 0 and np.linalg.norm(vec_b) > 0:
-                        correlation = np.dot(vec_a, vec_b) / (np.linalg.norm(vec_a) * np.linalg.norm(vec_b))
-                    else:
-                        correlation = 0.0
-                    
-                    pair_key = f"{symbol_a}_{symbol_b}"
-                    self.correlations[pair_key] = correlation
-                    
+                    analysis.update(future.result())
                 except Exception as e:
-                    continue
+                    print(f"Error in analysis shard: {str(e)}")
+        
+        for asset_type in asset_types:
+            print(f"Processing {asset_type}...")
+            items = [
+                (asset, frames[asset], inputs[(asset_type, asset)][1], *analysis[asset][:2])
+                for asset in self.asset_config[asset_type] if asset in analysis
+            ]
+            type_data, timings = self.analyze_asset_type(asset_type, items)
+            
+            for asset in self.asset_config[asset_type]:
+                if asset in type_data:
+                    self.asset_timings[asset]['analysis'] = analysis[asset][2] + timings[asset]
+                    self.frames[asset] = frames[asset]
+                else:
+                    self.frames.pop(asset, None)
+            self.market_data[asset_type] = type_data
+
+    def report_asset_timings(self, fetch_elapsed: float, top_n: int = 5):
+        """Print the slowest assets of the last run and the fetch wall time"""
+        if not self.asset_timings:
+            return
+        
+        serial_total = sum(t.get('fetch', 0) + t.get('sentiment', 0) for t in self.asset_timings.values())
+        print(f"⏱️  Fetch wall time {fetch_elapsed:.2f}s (serial sum {serial_total:.2f}s)")
+        
+        slowest = sorted(self.asset_timings.items(), key=lambda item: item[1]['total'], reverse=True)
+        for asset, timing in slowest[:top_n]:
+            parts = ", ".join(f"{stage} {seconds:.2f}s" for stage, seconds in timing.items())
+            print(f"   {asset}: {parts}")
+
+    def calculate_all_correlations(self, market_data: Dict):
+        """Calculate confluence-vector cosine similarity for all asset pairs as one matrix"""
+        symbols = [symbol for assets in market_data.values() for symbol in assets]
+        vectors = np.array(
+            [data['confluence_vector'] for assets in market_data.values() for data in assets.values()],
+            dtype=float
+        ).reshape(len(symbols), -1)
+        
+        # Normalize rows once; zero vectors stay zero so their similarity is 0.0
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        unit = np.divide(vectors, norms, out=np.zeros_like(vectors), where=norms > 0)
+        
+        self.correlation_symbols = symbols
+        self.correlation_matrix = unit @ unit.T
+
+    @staticmethod
+    def _daily_closes(df: pd.DataFrame) -> Optional[pd.Series]:
+        """Closes indexed by calendar day, one per day, or None without Date/Close columns"""
+        if df.empty or 'Close' not in df.columns or 'Date' not in df.columns:
+            return None
+        
+        # Align on calendar day; providers disagree on timezone and bar time
+        dates = pd.DatetimeIndex(df['Date'])
+        if dates.tz is not None:
+            dates = dates.tz_localize(None)
+        days = pd.DatetimeIndex(dates.to_numpy().astype('datetime64[D]').astype('datetime64[ns]'))
+        close = pd.Series(df['Close'].to_numpy(dtype=float), index=days)
+        if close.index.is_monotonic_increasing and close.index.is_unique:
+            return close
+        return close[~close.index.duplicated(keep='last')].sort_index()
+
+    def calculate_return_correlations(self, frames: Dict[str, pd.DataFrame], method: str = 'pearson',
+                                      min_periods: int = 20):
+        """Calculate Pearson or Spearman correlation of daily returns over aligned closes"""
+        returns = {}
+        for symbol, df in frames.items():
+            close = self._daily_closes(df)
+            if close is not None:
+                returns[symbol] = close.pct_change()
+        
+        if not returns:
+            self.return_correlation_symbols = []
+            self.return_correlation_matrix = np.zeros((0, 0))
+            return
+        
+        if method not in ('pearson', 'spearman'):
+            raise ValueError(f"Unsupported correlation method: {method}")
+        
+        # Spearman ranks each pair over its common dates; ranks taken over each column's own calendar would not compare
+        aligned = pd.DataFrame(returns)
+        self.return_correlation_method = method
+        self.return_correlation_symbols = list(aligned.columns)
+        self.return_correlation_matrix = aligned.corr(method=method, min_periods=min_periods).to_numpy()
+
+    @staticmethod
+    def _matrix_to_json(matrix: np.ndarray) -> List:
+        """Convert a matrix to nested lists with NaN as null"""
+        return np.where(np.isnan(matrix), None, matrix).tolist()
 
     def save_processed_data(self, market_data: Dict):
         """Save all processed data for frontend consumption"""
         
-        # Main market data file
-        with open(os.path.join(self.data_dir, 'market_data.json'), 'w') as f:
-            # Convert numpy arrays to lists for JSON serialization
-            json_data = {}
-            for asset_type, assets in market_data.items():
-                json_data[asset_type] = {}
-                for symbol, data in assets.items():
-                    json_data[asset_type][symbol] = data.copy()
-                    # Ensure confluence_vector is a list
-                    if isinstance(json_data[asset_type][symbol]['confluence_vector'], np.ndarray):
-                        json_data[asset_type][symbol]['confluence_vector'] = json_data[asset_type][symbol]['confluence_vector'].tolist()
-            
-            json.dump(json_data, f, indent=2, default=str)
+        # Main market data file plus per-asset fragments
+        reserialized = self.writer.write_market_data(market_data)
+        print(f"💾 Reserialized {reserialized} changed assets")
         
         # Correlations file
-        with open(os.path.join(self.data_dir, 'correlations.json'), 'w') as f:
-            json.dump(self.correlations, f, indent=2)
+        self.writer.write_json('correlations.json', {
+            'symbols': self.correlation_symbols,
+            'matrix': self._matrix_to_json(self.correlation_matrix),
+            'returns': {
+                'method': self.return_correlation_method,
+                'symbols': self.return_correlation_symbols,
+                'matrix': self._matrix_to_json(self.return_correlation_matrix)
+            }
+        })
+        
+        # Resonance file
+        if self.resonance:
+            resonance = dict(self.resonance)
+            if 'matrix' in resonance:
+                resonance['matrix'] = self._matrix_to_json(resonance['matrix'])
+            self.writer.write_json('resonance.json', resonance)
         
-        # Adaptive weights file
-        with open(os.path.join(self.data_dir, 'adaptive_weights.json'), 'w') as f:
-            json.dump(self.adaptive_weights, f, indent=2)
+        # Adaptive weights file, plus the checkpoint the next run resumes from
+        self.writer.write_json('adaptive_weights.json', self.adaptive_weights.to_dict())
+        self.adaptive_weights.save(self.weights_checkpoint)
         
         # Create CSV for legacy compatibility
         self.create_csv_exports(market_data)
+        self.writer.publish_manifest()
 
     def create_csv_exports(self, market_data: Dict):
         """Create CSV files for different use cases"""
@@ -480,24 +1799,25 @@ class FinancialMarketEngine:
                 flat_data.append(row)
         
         df_flat = pd.DataFrame(flat_data)
-        df_flat.to_csv(os.path.join(self.data_dir, 'market_data_flat.csv'), index=False)
-        
-        # Correlations matrix
-        if self.correlations:
-            corr_data = []
-            for pair, correlation in self.correlations.items():
-                symbol_a, symbol_b = pair.split('_')
-                corr_data.append({
-                    'symbol_a': symbol_a,
-                    'symbol_b': symbol_b,
-                    'correlation': correlation
-                })
-            
-            df_corr = pd.DataFrame(corr_data)
-            df_corr.to_csv(os.path.join(self.data_dir, 'correlations.csv'), index=False)
+        self.writer.write_bytes('market_data_flat.csv', df_flat.to_csv(index=False).encode('utf-8'))
+        
+        # Correlations matrix, one row per pair from the upper triangle
+        if self.correlation_symbols:
+            symbols = np.array(self.correlation_symbols, dtype=object)
+            rows, cols = np.triu_indices(len(symbols), k=1)
+            df_corr = pd.DataFrame({
+                'symbol_a': symbols[rows],
+                'symbol_b': symbols[cols],
+                'correlation': self.correlation_matrix[rows, cols]
+            })
+            self.writer.write_bytes('correlations.csv', df_corr.to_csv(index=False).encode('utf-8'))
 
     def generate_shape_mapping_data(self, market_data: Dict) -> Dict:
         """Generate 3D shape mapping data for visualization"""
+        with self.timed_stage('shape_mapping'):
+            return self._generate_shape_mapping_data(market_data)
+
+    def _generate_shape_mapping_data(self, market_data: Dict) -> Dict:
         shape_data = {}
         
         for asset_type, assets in market_data.items():
@@ -546,11 +1866,79 @@ class FinancialMarketEngine:
                 shape_data[asset_type][symbol] = shape_props
         
         # Save shape mapping data
-        with open(os.path.join(self.data_dir, 'shape_mapping.json'), 'w') as f:
-            json.dump(shape_data, f, indent=2, default=str)
+        if self.shape_output in ('json', 'both'):
+            self.writer.write_json('shape_mapping.json', shape_data)
+        if self.shape_output in ('binary', 'both'):
+            changed = self.write_shape_buffer(shape_data)
+            print(f"🔷 Shape buffer: {changed} changed assets in delta frame")
+        self.writer.publish_manifest()
         
         return shape_data
 
+    def pack_shape_records(self, shape_data: Dict) -> Tuple[List[Tuple[str, str]], np.ndarray]:
+        """Pack shape properties into fixed-stride records, one per (asset_type, symbol)"""
+        asset_types = list(self.asset_config)
+        keys = [(asset_type, symbol) for asset_type, shapes in shape_data.items() for symbol in shapes]
+        records = np.zeros(len(keys), dtype=SHAPE_RECORD_DTYPE)
+        quantize = lambda value: int(round(min(max(value, 0.0), 1.0) * 255))
+        
+        for i, (asset_type, symbol) in enumerate(keys):
+            shape = shape_data[asset_type][symbol]
+            position, scale = shape['position'], shape['scale']
+            color, animation = shape['color'], shape['animation']
+            records[i] = (
+                position['x'], position['y'], position['z'],
+                scale['base'], scale['volatility_multiplier'],
+                animation['pulse_frequency'], animation['rotation_speed'], animation['oscillation_amplitude'],
+                i, quantize(color['hue']), quantize(color['saturation']), quantize(color['lightness']),
+                SHAPE_TYPES.index(shape['shape_type']),
+                asset_types.index(asset_type) if asset_type in asset_types else 255
+            )
+        return keys, records
+
+    def write_shape_buffer(self, shape_data: Dict) -> int:
+        """Write the packed shape buffer, its symbol index and a delta frame
+        
+        The delta frame holds only records whose bytes changed since the
+        previous frame and names that frame's generation as its base. A base
+        generation of 0 means the symbol index changed and the delta is a full
+        frame. Returns the number of records in the delta.
+        """
+        keys, records = self.pack_shape_records(shape_data)
+        generation = self.writer.manifest['generation'] + 1  # generation the next manifest publishes
+        previous_keys, previous = self._shape_frame
+        
+        if previous is not None and previous_keys == keys:
+            width = SHAPE_RECORD_DTYPE.itemsize
+            changed = (records.view(np.uint8).reshape(-1, width) != previous.view(np.uint8).reshape(-1, width)).any(axis=1)
+            delta, base_generation = records[changed], self._shape_generation
+        else:
+            delta, base_generation = records, 0
+        
+        def frame(body: np.ndarray, base: int) -> bytes:
+            header = SHAPE_HEADER.pack(b'HXSB', SHAPE_BUFFER_VERSION, SHAPE_RECORD_DTYPE.itemsize,
+                                       len(body), generation, base)
+            return header + body.tobytes()
+        
+        self.writer.write_json('shape_index.json', {
+            'version': SHAPE_BUFFER_VERSION,
+            'header_size': SHAPE_HEADER.size,
+            'stride': SHAPE_RECORD_DTYPE.itemsize,
+            'fields': {
+                name: {'offset': offset, 'type': {'f': 'float32', 'u': 'uint32' if dtype.itemsize == 4 else 'uint8'}[dtype.kind]}
+                for name, (dtype, offset) in SHAPE_RECORD_DTYPE.fields.items()
+            },
+            'shape_types': SHAPE_TYPES,
+            'asset_types': list(self.asset_config),
+            'symbols': [list(key) for key in keys]
+        })
+        self.writer.write_bytes('shape_buffer.bin', frame(records, 0))
+        self.writer.write_bytes('shape_delta.bin', frame(delta, base_generation))
+        
+        self._shape_frame = (keys, records)
+        self._shape_generation = generation
+        return len(delta)
+
     def _determine_shape_type(self, asset_data: Dict) -> str:
         """Determine 3D shape type based on market characteristics"""
         confluence = asset_data['confluence_magnitude']
@@ -566,25 +1954,494 @@ class FinancialMarketEngine:
         else:
             return 'sphere'       # Default = simple sphere
 
+    @staticmethod
+    def _rolling_panel(values: np.ndarray, window: int, reducer) -> np.ndarray:
+        """Reduce trailing windows down each column of a panel; NaN until a window fills"""
+        out = np.full(values.shape, np.nan)
+        if len(values) >= window:
+            out[window - 1:] = reducer(sliding_window_view(values, window, axis=0))
+        return out
+
+    def _indicator_series_panel(self, close: np.ndarray, high: np.ndarray, low: np.ndarray,
+                                volume: np.ndarray, counts: np.ndarray) -> Dict[str, np.ndarray]:
+        """Every ``calculate_technical_indicators`` value at every bar, as (bars x symbols) panels"""
+        lagged = lambda values, lag: np.vstack([np.full((min(lag, len(values)), values.shape[1]), np.nan), values[:-lag]])
+        mean = lambda windows: windows.mean(axis=-1)
+        previous_close = lagged(close, 1)
+        
+        with np.errstate(divide='ignore', invalid='ignore'):
+            delta = close - previous_close
+            avg_gain = self._rolling_panel(np.clip(delta, 0, None), 14, mean)
+            avg_loss = self._rolling_panel(np.clip(-delta, 0, None), 14, mean)
+            rsi = 100 - (100 / (1 + avg_gain / avg_loss))
+            
+            ema12 = self._ewm_panel(close, 12)
+            ema26 = self._ewm_panel(close, 26)
+            macd_line = ema12 - ema26
+            macd = macd_line - self._ewm_panel(macd_line, 9)
+            ema_cross = (ema12 - ema26) / close
+            
+            sma20 = self._rolling_panel(close, 20, mean)
+            std20 = self._rolling_panel(close, 20, lambda windows: windows.std(axis=-1, ddof=1))
+            bb_squeeze = 4 * std20 / sma20
+            
+            lowest_low = self._rolling_panel(low, 14, lambda windows: windows.min(axis=-1))
+            highest_high = self._rolling_panel(high, 14, lambda windows: windows.max(axis=-1))
+            stochastic = 100 * (close - lowest_low) / (highest_high - lowest_low)
+            
+            avg_volume = self._rolling_panel(volume, 20, mean)
+            volume_profile = (volume - avg_volume) / avg_volume
+            
+            reference = lagged(close, 9)
+            momentum = (close - reference) / reference
+            
+            true_range = np.fmax(high - low, np.fmax(np.abs(high - previous_close), np.abs(low - previous_close)))
+            volatility = self._rolling_panel(true_range, 14, mean) / close
+        
+        return {
+            'rsi': np.where(counts > 14, rsi, 50),
+            'macd': np.where(counts > 26, macd, 0),
+            'bb_squeeze': np.where(counts > 20, bb_squeeze, 0.1),
+            'stochastic': np.where(counts > 14, stochastic, 50),
+            'ema_cross': np.where(counts > 26, ema_cross, 0),
+            'volume_profile': np.where(counts > 20, volume_profile, 0),
+            'momentum': np.where(counts > 10, momentum, 0),
+            'volatility': np.where(counts > 14, volatility, 0.02)
+        }
+
+    @staticmethod
+    def _rolling_entropy_panel(close: np.ndarray, counts: np.ndarray, window: int) -> np.ndarray:
+        """``calculate_geometric_entropy`` over the trailing ``window`` closes at every bar"""
+        rows, columns = close.shape
+        bins = 10
+        
+        # window closes -> window - 1 returns; pad so every bar has a full (NaN-padded) window
+        returns = np.vstack([np.full((1, columns), np.nan), close[1:] / close[:-1] - 1])
+        padded = np.vstack([np.full((window - 2, columns), np.nan), returns])
+        windows = sliding_window_view(padded, window - 1, axis=0).reshape(rows * columns, window - 1)
+        
+        valid = ~np.isnan(windows)
+        n_valid = valid.sum(axis=1)
+        low = np.where(valid, windows, np.inf).min(axis=1)
+        high = np.where(valid, windows, -np.inf).max(axis=1)
+        
+        # Same bin edges and edge corrections as np.histogram, one row per window
+        equal = (high == low) | (n_valid == 0)
+        first_edge = np.where(equal, low - 0.5, low)
+        last_edge = np.where(equal, high + 0.5, high)
+        first_edge[n_valid == 0], last_edge[n_valid == 0] = 0.0, 1.0
+        edges = np.arange(bins + 1) * ((last_edge - first_edge) / bins)[:, None] + first_edge[:, None]
+        edges[:, -1] = last_edge
+        
+        values = np.where(valid, windows, first_edge[:, None])
+        index = ((values - first_edge[:, None]) * (bins / (last_edge - first_edge))[:, None]).astype(np.intp)
+        index = np.clip(index, 0, bins - 1)
+        index -= values < np.take_along_axis(edges, index, axis=1)
+        index += (values >= np.take_along_axis(edges, index + 1, axis=1)) & (index != bins - 1)
+        index = np.where(valid, index, bins)
+        
+        flat = (np.arange(len(windows))[:, None] * (bins + 1) + index).ravel()
+        counts_per_bin = np.bincount(flat, minlength=len(windows) * (bins + 1)).reshape(-1, bins + 1)[:, :bins]
+        
+        with np.errstate(divide='ignore', invalid='ignore'):
+            density = counts_per_bin / np.diff(edges, axis=1) / n_valid[:, None]
+            positive = density > 0
+            terms = np.where(positive, density * np.log(np.where(positive, density, 1.0)), 0.0)
+            entropy = np.minimum(-terms.sum(axis=1) / np.log(positive.sum(axis=1)), 1.0)
+        
+        entropy = entropy.reshape(rows, columns)
+        return np.where((counts >= 10) & (n_valid.reshape(rows, columns) > 0), entropy, 0.5)
+
+    def _confluence_panel(self, indicators: Dict[str, np.ndarray], weights: List[Dict]) -> Tuple[np.ndarray, np.ndarray]:
+        """``calculate_confluence_score`` at every bar; ``weights`` holds one dict per column"""
+        normalized = {
+            'rsi': (indicators['rsi'] - 50) / 50,
+            'macd': np.tanh(indicators['macd'] * 100),
+            'stochastic': (indicators['stochastic'] - 50) / 50,
+            'ema_cross': np.tanh(indicators['ema_cross'] * 100),
+            'momentum': np.tanh(indicators['momentum'] * 10)
+        }
+        
+        vector = np.zeros(indicators['rsi'].shape + (3,))
+        total_weight = np.zeros(len(weights))
+        for indicator, value in normalized.items():
+            weight = np.array([column.get(indicator, 0.0) for column in weights])
+            angle = confluence_angle(indicator)
+            direction = np.array([np.cos(angle), np.sin(angle), np.cos(angle * 2)])
+            vector += (weight * value)[..., None] * direction
+            total_weight += weight
+        
+        vector = np.divide(vector, total_weight[:, None], out=vector, where=total_weight[:, None] > 0)
+        return np.linalg.norm(vector, axis=-1), vector
+
+    def backfill_history(self, frames: Optional[Dict[str, pd.DataFrame]] = None, entropy_window: int = 60,
+                         chunk_size: int = 256, write: bool = True) -> pd.DataFrame:
+        """Compute indicators, entropy, confluence and shape type for every bar of every asset
+        
+        Uses the full stored OHLCV history by default. Entropy at each bar is
+        taken over the trailing ``entropy_window`` closes, and confluence uses
+        the current adaptive weights of the asset's type. The long-format table
+        is written to confluence_history.parquet (CSV without pyarrow).
+        """
+        if frames is None:
+            frames = {}
+            for asset in (asset for assets in self.asset_config.values() for asset in assets):
+                df = self.store.load(asset) if self.store is not None else pd.DataFrame()
+                frames[asset] = df if not df.empty else self.frames.get(asset, pd.DataFrame())
+        
+        asset_types = {asset: asset_type for asset_type, assets in self.asset_config.items() for asset in assets}
+        uniform = {indicator: 1.0 / 8 for indicator in ['rsi', 'macd', 'bb_squeeze', 'stochastic', 'ema_cross',
+                                                        'volume_profile', 'momentum', 'volatility']}
+        valid_frames = {symbol: df for symbol, df in frames.items()
+                        if not df.empty and 'Close' in df.columns and 'Date' in df.columns}
+        symbols_all = list(valid_frames)
+        tables = []
+        
+        for start in range(0, len(symbols_all), chunk_size):
+            chunk = {symbol: valid_frames[symbol] for symbol in symbols_all[start:start + chunk_size]}
+            symbols, lengths, close, high, low, volume = self._build_panel(chunk)
+            rows = close.shape[0]
+            counts = np.arange(1, rows + 1)[:, None] - (rows - lengths)[None, :]
+            
+            indicators = self._indicator_series_panel(close, high, low, volume, counts)
+            entropy = self._rolling_entropy_panel(close, counts, entropy_window)
+            weights = [self.adaptive_weights.get(asset_types.get(symbol), uniform) for symbol in symbols]
+            magnitude, vector = self._confluence_panel(indicators, weights)
+            shape_type = np.select(
+                [magnitude > 0.7, indicators['volatility'] > 0.05,
+                 (indicators['rsi'] > 70) | (indicators['rsi'] < 30)],
+                ['icosahedron', 'octahedron', 'tetrahedron'],
+                default='sphere'
+            )
+            
+            # Symbol-major flattening of the real (non-padding) bars
+            mask = (counts >= 1).T
+            dates = []
+            for symbol in symbols:
+                date = pd.to_datetime(chunk[symbol]['Date'])
+                dates.append((date.dt.tz_localize(None) if date.dt.tz is not None else date).to_numpy())
+            
+            table = {
+                'date': np.concatenate(dates),
+                'symbol': np.repeat(np.array(symbols, dtype=object), lengths),
+                'asset_type': np.repeat(np.array([asset_types.get(symbol, 'unknown') for symbol in symbols], dtype=object), lengths),
+                'close': close.T[mask],
+                'entropy': entropy.T[mask],
+                'confluence_magnitude': magnitude.T[mask],
+                'confluence_x': vector[..., 0].T[mask],
+                'confluence_y': vector[..., 1].T[mask],
+                'confluence_z': vector[..., 2].T[mask],
+                'shape_type': shape_type.T[mask]
+            }
+            for indicator, values in indicators.items():
+                table[f'indicator_{indicator}'] = values.T[mask]
+            tables.append(pd.DataFrame(table))
+        
+        history = pd.concat(tables, ignore_index=True) if tables else pd.DataFrame()
+        
+        if write and not history.empty:
+            if pyarrow is not None:
+                buffer = BytesIO()
+                history.to_parquet(buffer, index=False)
+                self.writer.write_bytes('confluence_history.parquet', buffer.getvalue())
+            else:
+                self.writer.write_bytes('confluence_history.csv', history.to_csv(index=False).encode('utf-8'))
+            self.writer.publish_manifest()
+        
+        return history
+
+    def close(self):
+        """Release worker pools and pooled connections held by the engine"""
+        if self._sentiment_pool is not None:
+            self._sentiment_pool.shutdown()
+            self._sentiment_pool = None
+        if self._shard_pool is not None:
+            self._shard_pool.shutdown()
+            self._shard_pool = None
+        self.http.prune()
+        self.http.close()
+
+def _shard_indicator_chunk(chunk: Dict[str, pd.DataFrame]) -> Dict[str, Tuple[Dict, float, float]]:
+    """Shard task: indicators, entropy and per-asset seconds for a chunk of symbols"""
+    start = time.perf_counter()
+    indicators = FinancialMarketEngine.calculate_indicator_panel(chunk)
+    entropies = {
+        asset: FinancialMarketEngine.calculate_geometric_entropy(df['Close']) if 'Close' in df.columns else 0.5
+        for asset, df in chunk.items()
+    }
+    seconds = (time.perf_counter() - start) / max(len(chunk), 1)
+    return {asset: (indicators.get(asset, {}), entropies[asset], seconds) for asset in chunk}
+
+@lru_cache(maxsize=None)
+def nyse_holidays(year: int) -> frozenset:
+    """Full-day NYSE closures for a year from the exchange's standing rules
+    
+    Weekend holidays are observed on the nearest weekday, except that a
+    Saturday New Year's Day is not made up on the Friday before. Early closes
+    and one-off closures (national days of mourning) are not included.
+    """
+    def observed(day: date) -> date:
+        if day.weekday() == 5:
+            return day - timedelta(days=1)
+        if day.weekday() == 6:
+            return day + timedelta(days=1)
+        return day
+    
+    def nth_weekday(month: int, weekday: int, n: int) -> date:
+        first = date(year, month, 1)
+        return first + timedelta(days=(weekday - first.weekday()) % 7 + 7 * (n - 1))
+    
+    def last_weekday(month: int, weekday: int) -> date:
+        last = date(year + month // 12, month % 12 + 1, 1) - timedelta(days=1)
+        return last - timedelta(days=(last.weekday() - weekday) % 7)
+    
+    # Anonymous Gregorian computus for Easter Sunday; Good Friday is two days earlier
+    a, b, c = year % 19, year // 100, year % 100
+    d, e = b // 4, b % 4
+    g = (8 * b + 13) // 25
+    h = (19 * a + b - d - g + 15) % 30
+    i, k = c // 4, c % 4
+    l = (32 + 2 * e + 2 * i - h - k) % 7
+    m = (a + 11 * h + 22 * l) // 451
+    easter = date(year, (h + l - 7 * m + 114) // 31, (h + l - 7 * m + 114) % 31 + 1)
+    
+    holidays = {
+        nth_weekday(1, 0, 3),              # Martin Luther King Jr. Day
+        nth_weekday(2, 0, 3),              # Washington's Birthday
+        easter - timedelta(days=2),        # Good Friday
+        last_weekday(5, 0),                # Memorial Day
+        observed(date(year, 7, 4)),        # Independence Day
+        nth_weekday(9, 0, 1),              # Labor Day
+        nth_weekday(11, 3, 4),             # Thanksgiving
+        observed(date(year, 12, 25)),      # Christmas
+    }
+    if date(year, 1, 1).weekday() != 5:
+        holidays.add(observed(date(year, 1, 1)))
+    if year >= 2022:
+        holidays.add(observed(date(year, 6, 19)))  # Juneteenth
+    return frozenset(holidays)
+
+class MarketEngineDaemon:
+    """Long-running market engine with warm state and per-asset-class refresh schedules
+    
+    A single engine (and its imports, VADER analyzer, caches and adaptive
+    weights) lives for the whole process. Asset classes refresh on their own
+    intervals; equities only refresh while the NYSE is open (holidays from
+    ``nyse_holidays``, early closes not modelled). A line-based
+    control socket on localhost accepts ``status``, ``refresh <asset_type|all>``
+    and ``stop`` and answers with one JSON line.
+    """
+    
+    def __init__(self, engine: FinancialMarketEngine, intervals: Optional[Dict[str, int]] = None,
+                 control_host: str = "127.0.0.1", control_port: int = 8765, concurrent: bool = True):
+        self.engine = engine
+        self.concurrent = concurrent
+        self.intervals = {
+            'crypto_coins': 60,
+            'stocks': 300,
+            'fx_pairs': 300,
+            'precious_metals': 3600,
+            'futures': 3600
+        }
+        self.intervals.update(intervals or {})
+        self.market_hours_only = {'stocks'}
+        
+        # Cached HTTP bodies must go stale before the next refresh, or a cycle republishes the last one's prices
+        shortest = min(self.intervals.values())
+        if engine.http.ttl >= shortest:
+            engine.http.ttl = shortest / 2
+        self.exchange_tz = ZoneInfo("America/New_York")
+        
+        self.next_due = {asset_type: 0.0 for asset_type in engine.asset_config}
+        self.forced = set()  # asset types a control command asked for, run even while the market is closed
+        self.last_refresh = {}
+        self.cycles = 0
+        self.last_cycle_seconds = 0.0
+        self.started_at = None
+        self.running = False
+        self.wake = threading.Event()
+        
+        self.control_address = (control_host, control_port)
+        self.control_server = None
+    
+    def is_market_open(self, now: Optional[datetime] = None) -> bool:
+        """Regular NYSE session: non-holiday weekdays 9:30-16:00 New York time"""
+        now = now or datetime.now(self.exchange_tz)
+        if now.weekday() >= 5 or now.date() in nyse_holidays(now.year):
+            return False
+        minutes = now.hour * 60 + now.minute
+        return 9 * 60 + 30 <= minutes < 16 * 60
+    
+    def due_asset_types(self) -> List[str]:
+        """Asset types whose refresh is due, rescheduling skipped closed-market ones"""
+        now = time.time()
+        due = []
+        for asset_type, next_due in self.next_due.items():
+            if asset_type in self.forced:
+                self.forced.discard(asset_type)
+                due.append(asset_type)
+                continue
+            if next_due > now:
+                continue
+            if asset_type in self.market_hours_only and not self.is_market_open():
+                self.next_due[asset_type] = now + self.intervals.get(asset_type, 3600)
+                continue
+            due.append(asset_type)
+        return due
+    
+    def run_cycle(self, asset_types: List[str]):
+        """Refresh the given asset types and republish all outputs"""
+        start = time.perf_counter()
+        market_data = self.engine.process_asset_types(asset_types, concurrent=self.concurrent)
+        self.engine.generate_shape_mapping_data(market_data)
+        
+        finished = time.time()
+        for asset_type in asset_types:
+            self.last_refresh[asset_type] = finished
+            self.next_due[asset_type] = finished + self.intervals.get(asset_type, 3600)
+        self.cycles += 1
+        self.last_cycle_seconds = time.perf_counter() - start
+    
+    def request_refresh(self, asset_type: str) -> bool:
+        """Make an asset type (or 'all') due immediately, even outside market hours"""
+        targets = list(self.next_due) if asset_type == 'all' else [asset_type]
+        if not all(target in self.next_due for target in targets):
+            return False
+        self.forced.update(targets)
+        self.wake.set()
+        return True
+    
+    def status(self) -> Dict:
+        now = time.time()
+        return {
+            'running': self.running,
+            'uptime_seconds': now - self.started_at if self.started_at else 0.0,
+            'cycles': self.cycles,
+            'last_cycle_seconds': self.last_cycle_seconds,
+            'market_open': self.is_market_open(),
+            'assets': {asset_type: len(assets) for asset_type, assets in self.engine.market_data.items()},
+            'asset_types': {
+                asset_type: {
+                    'interval': self.intervals.get(asset_type, 3600),
+                    'last_refresh': datetime.fromtimestamp(self.last_refresh[asset_type]).isoformat()
+                    if asset_type in self.last_refresh else None,
+                    'due_in_seconds': max(self.next_due[asset_type] - now, 0.0)
+                }
+                for asset_type in self.next_due
+            }
+        }
+    
+    def handle_command(self, line: str) -> Dict:
+        parts = line.strip().split()
+        if not parts:
+            return {'ok': False, 'error': 'empty command'}
+        
+        command = parts[0].lower()
+        if command == 'status':
+            return {'ok': True, 'status': self.status()}
+        if command == 'refresh':
+            target = parts[1] if len(parts) > 1 else 'all'
+            if self.request_refresh(target):
+                return {'ok': True, 'refreshing': target}
+            return {'ok': False, 'error': f"unknown asset type: {target}"}
+        if command == 'stop':
+            self.stop()
+            return {'ok': True, 'stopping': True}
+        return {'ok': False, 'error': f"unknown command: {command}"}
+    
+    def _start_control_server(self):
+        daemon = self
+        
+        class ControlHandler(socketserver.StreamRequestHandler):
+            def handle(self):
+                for raw in self.rfile:
+                    response = daemon.handle_command(raw.decode('utf-8', errors='replace'))
+                    self.wfile.write((json.dumps(response, default=str) + "\n").encode('utf-8'))
+        
+        socketserver.ThreadingTCPServer.allow_reuse_address = True
+        self.control_server = socketserver.ThreadingTCPServer(self.control_address, ControlHandler)
+        self.control_server.daemon_threads = True
+        threading.Thread(target=self.control_server.serve_forever, daemon=True).start()
+        print(f"🛰️  Control socket listening on {self.control_address[0]}:{self.control_address[1]}")
+    
+    def run(self):
+        """Run refresh cycles until stopped"""
+        self.running = True
+        self.started_at = time.time()
+        if self.engine.weights_restored:
+            print("✅ Resumed adaptive weights from previous run")
+        self._start_control_server()
+        
+        try:
+            while self.running:
+                due = self.due_asset_types()
+                if due:
+                    try:
+                        self.run_cycle(due)
+                    except Exception as e:
+                        print(f"Error in refresh cycle for {', '.join(due)}: {str(e)}")
+                        for asset_type in due:
+                            self.next_due[asset_type] = time.time() + self.intervals.get(asset_type, 3600)
+                    continue
+                
+                wait = max(min(self.next_due.values()) - time.time(), 0.0)
+                self.wake.wait(timeout=min(wait, 60.0))
+                self.wake.clear()
+        finally:
+            if self.control_server is not None:
+                self.control_server.shutdown()
+                self.control_server.server_close()
+            self.engine.close()
+            print("🔄 Market engine daemon stopped")
+    
+    def stop(self):
+        self.running = False
+        self.wake.set()
+
 def main():
     """Main execution function"""
+    parser = argparse.ArgumentParser(description="HelixOne financial market engine")
+    parser.add_argument('--daemon', action='store_true', help="keep the engine warm and refresh on a schedule")
+    parser.add_argument('--control-port', type=int, default=8765, help="daemon control socket port")
+    parser.add_argument('--offline', action='store_true', help="rerun from the local OHLCV store only")
+    parser.add_argument('--backfill', action='store_true', help="write confluence/entropy/shape history for every stored bar")
+    parser.add_argument('--processes', type=int, default=0, help="worker processes for sharded analysis")
+    args = parser.parse_args()
+    
     print("🚀 Starting Financial Market Engine 2.0...")
     
     # Initialize engine
     engine = FinancialMarketEngine(
         data_dir="data",
-        news_api_key=os.getenv('NEWS_API_KEY')  # Set your NewsAPI key in environment
+        news_api_key=os.getenv('NEWS_API_KEY'),  # Set your NewsAPI key in environment
+        offline=args.offline,
+        processes=args.processes
     )
     
+    if args.backfill:
+        history = engine.backfill_history()
+        print(f"✅ Backfilled {len(history)} bars for {history['symbol'].nunique() if len(history) else 0} assets")
+        return history, {}
+    
+    if args.daemon:
+        daemon = MarketEngineDaemon(engine, control_port=args.control_port)
+        signal.signal(signal.SIGTERM, lambda signum, frame: daemon.stop())
+        try:
+            daemon.run()
+        except KeyboardInterrupt:
+            daemon.stop()
+        return engine.market_data, {}
+    
     # Process all market data
-    market_data = engine.process_all_assets()
+    market_data = engine.process_all_assets(concurrent=True)
     
     # Generate shape mapping for 3D visualization
     shape_data = engine.generate_shape_mapping_data(market_data)
+    engine.close()
     
     # Print summary
     total_assets = sum(len(assets) for assets in market_data.values())
-    total_correlations = len(engine.correlations)
+    total_correlations = len(engine.correlation_symbols) * (len(engine.correlation_symbols) - 1) // 2
     
     print(f"\n📊 PROCESSING COMPLETE:")
     print(f"✅ Assets processed: {total_assets}")
@@ -595,10 +2452,12 @@ def main():
     print(f"\n📁 Generated Files:")
     print(f"- market_data.json (complete market data)")
     print(f"- correlations.json (asset correlations)")
+    print(f"- resonance.json (cross-asset FFT resonance)")
     print(f"- adaptive_weights.json (ML weights)")
     print(f"- shape_mapping.json (3D visualization data)")
     print(f"- market_data_flat.csv (tabular export)")
     print(f"- correlations.csv (correlation matrix)")
+    print(f"- manifest.json (content hashes for incremental fetches)")
     
     return market_data, shape_data
 
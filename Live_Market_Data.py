@@ -8,6 +8,62 @@ volume=float(coin_data.get('usd_24h_vol', 0) or 0),
             logger.error(f"CoinGecko fetch error for {symbol}: {str(e)}")
             self.last_error = str(e)
             return None
+    
+    async def fetch_batch(self, symbols: List[str], asset_type: AssetType) -> Dict[str, MarketDataPoint]:
+        """Fetch real-time crypto data for many coins per /simple/price request"""
+        if asset_type != AssetType.CRYPTO:
+            return {}
+        
+        await self.initialize()
+        results = {}
+        
+        for i in range(0, len(symbols), self.batch_size):
+            chunk = symbols[i:i + self.batch_size]
+            if not self.can_make_request():
+                break
+            
+            ids = {}
+            for symbol in chunk:
+                ids.setdefault(self._get_coingecko_id(symbol), []).append(symbol)
+            
+            try:
+                url = f"{self.config.base_url}/simple/price"
+                params = {
+                    'ids': ','.join(ids),
+                    'vs_currencies': 'usd',
+                    'include_24hr_vol': 'true',
+                    'include_24hr_change': 'true',
+                    'include_market_cap': 'true',
+                    'include_last_updated_at': 'true'
+                }
+                
+                async with self.session.get(url, params=params) as response:
+                    if response.status != 200:
+                        logger.warning(f"CoinGecko API error for {len(chunk)} symbols: {response.status}")
+                        continue
+                    data = await response.json()
+                
+                for coin_id, coin_data in data.items():
+                    price = coin_data.get('usd')
+                    if not price:
+                        continue
+                    
+                    for symbol in ids.get(coin_id, []):
+                        results[symbol] = MarketDataPoint(
+                            symbol=symbol,
+                            timestamp=datetime.fromtimestamp(coin_data.get('last_updated_at', time.time())),
+                            price=float(price),
+                            volume=float(coin_data.get('usd_24h_vol', 0) or 0),
+                            change_percent_24h=float(coin_data.get('usd_24h_change', 0) or 0),
+                            market_cap=float(coin_data.get('usd_market_cap', 0) or 0),
+                            source="coingecko"
+                        )
+                    
+            except Exception as e:
+                logger.error(f"CoinGecko batch fetch error for {len(chunk)} symbols: {str(e)}")
+                self.last_error = str(e)
+        
+        return results
 
 class AlphaVantageSource(BaseDataSource):
     """Alpha Vantage data source implementation"""
@@ -159,8 +215,8 @@ class TechnicalIndicators:
             return None
         
         try:
-            prices_array = np.array(prices)
-            deltas = np.diff(prices_array)
+            prices_array = np.asarray(prices, dtype=np.float64)
+            deltas = np.diff(prices_array[-(period + 1):])
             
             gains = np.where(deltas > 0, deltas, 0)
             losses = np.where(deltas < 0, -deltas, 0)
@@ -208,7 +264,7 @@ class TechnicalIndicators:
             return None, None, None
         
         try:
-            prices_array = np.array(prices[-period:])
+            prices_array = np.asarray(prices[-period:], dtype=np.float64)
             middle = np.mean(prices_array)
             std = np.std(prices_array)
             
@@ -233,8 +289,8 @@ class TechnicalIndicators:
             recent_lows = lows[-k_period:]
             current_close = closes[-1]
             
-            highest_high = max(recent_highs)
-            lowest_low = min(recent_lows)
+            highest_high = np.max(recent_highs)
+            lowest_low = np.min(recent_lows)
             
             if highest_high == lowest_low:
                 k_percent = 50.0
@@ -257,20 +313,13 @@ class TechnicalIndicators:
             return None
         
         try:
-            true_ranges = []
-            
-            for i in range(1, len(closes)):
-                high_low = highs[i] - lows[i]
-                high_close = abs(highs[i] - closes[i-1])
-                low_close = abs(lows[i] - closes[i-1])
-                
-                true_range = max(high_low, high_close, low_close)
-                true_ranges.append(true_range)
+            # Only the last ``period`` true ranges are needed
+            highs = np.asarray(highs[-period:], dtype=np.float64)
+            lows = np.asarray(lows[-period:], dtype=np.float64)
+            prev_closes = np.asarray(closes[-(period + 1):-1], dtype=np.float64)
             
-            if len(true_ranges) < period:
-                return None
-            
-            atr = np.mean(true_ranges[-period:])
+            true_ranges = np.maximum(highs - lows, np.maximum(np.abs(highs - prev_closes), np.abs(lows - prev_closes)))
+            atr = np.mean(true_ranges)
             return float(atr)
             
         except Exception as e:
@@ -278,17 +327,15 @@ class TechnicalIndicators:
             return None
 
     @staticmethod
-    def calculate_all_indicators(historical_data: List[MarketDataPoint]) -> IndicatorData:
+    def calculate_all_indicators(historical_data: Union[PriceSeries, List[MarketDataPoint]]) -> IndicatorData:
         """Calculate all technical indicators from historical data"""
-        if not historical_data:
+        if not len(historical_data):
             return IndicatorData()
         
-        # Extract price arrays
-        prices = [point.price for point in historical_data]
-        highs = [point.high or point.price for point in historical_data]
-        lows = [point.low or point.price for point in historical_data]
-        closes = [point.close or point.price for point in historical_data]
-        volumes = [point.volume or 0 for point in historical_data]
+        # Column views, no per-point extraction
+        series = PriceSeries.coerce(historical_data)
+        prices, highs, lows, closes = series.price, series.high, series.low, series.close
+        volumes = np.nan_to_num(series.volume[-20:])
         
         # Calculate all indicators
         rsi = TechnicalIndicators.calculate_rsi(prices)
@@ -313,7 +360,7 @@ class TechnicalIndicators:
         # Volume SMA
         volume_sma = None
         if len(volumes) >= 20:
-            volume_sma = float(np.mean(volumes[-20:]))
+            volume_sma = float(np.mean(volumes))
         
         return IndicatorData(
             rsi=rsi,
@@ -331,6 +378,352 @@ class TechnicalIndicators:
             atr=atr
         )
 
+class RollingWindow:
+    """Fixed-size window with O(1) Welford mean/variance updates"""
+    
+    def __init__(self, size: int):
+        self.size = size
+        self.values = deque()
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.run = 0  # trailing count of values equal to the newest one
+        self._updates = 0
+    
+    def __len__(self) -> int:
+        return len(self.values)
+    
+    @property
+    def full(self) -> bool:
+        return len(self.values) >= self.size
+    
+    @property
+    def variance(self) -> float:
+        """Population variance (ddof=0), matching np.std"""
+        return max(self.m2 / len(self.values), 0.0) if self.values else 0.0
+    
+    def _step(self, value: float) -> Tuple[float, float, int, int]:
+        """(mean, m2, length, run) after pushing ``value``
+        
+        A window holding one repeated value (a flat price stretch, an all-zero
+        RSI loss window) gets an exact mean and zero m2; Welford residue there
+        would flip RSI's ``avg_loss == 0`` test and blow up the band width.
+        """
+        run = min(self.run + 1, self.size) if self.values and self.values[-1] == value else 1
+        length = min(len(self.values) + 1, self.size)
+        if run >= length:
+            return float(value), 0.0, length, run
+        
+        if self.full:
+            old = self.values[0]
+            mean = self.mean + (value - old) / self.size
+            return mean, self.m2 + (value - old) * (value - mean + old - self.mean), length, run
+        
+        delta = value - self.mean
+        mean = self.mean + delta / length
+        return mean, self.m2 + delta * (value - mean), length, run
+    
+    def peek(self, value: float) -> Tuple[float, float, bool]:
+        """(mean, variance, full) as if ``value`` were pushed, without pushing it"""
+        mean, m2, length, _ = self._step(value)
+        return mean, max(m2 / length, 0.0), length >= self.size
+    
+    def push(self, value: float):
+        """Add a value, evicting the oldest once the window is full"""
+        self.mean, self.m2, _, self.run = self._step(value)
+        if self.full:
+            self.values.popleft()
+        self.values.append(value)
+        
+        # Resync once per window length so sliding updates never accumulate drift
+        self._updates += 1
+        if self._updates >= self.size:
+            self._updates = 0
+            window = np.array(self.values)
+            self.mean = float(window.mean())
+            self.m2 = float(((window - self.mean) ** 2).sum())
+
+class IncrementalIndicators:
+    """Per-symbol indicator state updated in constant time per new bar
+    
+    Feeding bars one by one through ``update`` yields the same IndicatorData as
+    ``TechnicalIndicators.calculate_all_indicators`` over all bars fed so far
+    (to floating-point tolerance).
+    """
+    
+    def __init__(self, rsi_period: int = 14, bb_period: int = 20, stoch_period: int = 14,
+                 atr_period: int = 14, volume_period: int = 20):
+        self.rsi_period = rsi_period
+        self.bb_period = bb_period
+        self.stoch_period = stoch_period
+        self.atr_period = atr_period
+        self.count = 0
+        self.last_timestamp = None
+        
+        # EMA state as (weighted sum, weight total), matching pandas ewm(adjust=True)
+        self._ema = {12: [0.0, 0.0], 26: [0.0, 0.0]}
+        self._signal = [0.0, 0.0]
+        self._macd = None
+        self._macd_signal = None
+        
+        self._last_price = None
+        self._last_close = None
+        self._gains = RollingWindow(rsi_period)
+        self._losses = RollingWindow(rsi_period)
+        self._prices = RollingWindow(bb_period)
+        self._true_ranges = RollingWindow(atr_period)
+        self._volumes = RollingWindow(volume_period)
+        
+        # Monotonic deques of (bar index, value) for rolling high/low
+        self._highs = deque()
+        self._lows = deque()
+    
+    @classmethod
+    def from_history(cls, historical_data: Union[PriceSeries, List[MarketDataPoint]], **kwargs) -> 'IncrementalIndicators':
+        """Seed state from a batch of historical points"""
+        state = cls(**kwargs)
+        for point in historical_data:
+            state.update(point)
+        return state
+    
+    @staticmethod
+    def _ewm_step(state: List[float], value: float, span: int) -> float:
+        decay = 1.0 - 2.0 / (span + 1.0)
+        state[0] = value + decay * state[0]
+        state[1] = 1.0 + decay * state[1]
+        return state[0] / state[1]
+    
+    def _push_extreme(self, window: deque, value: float, keep_max: bool):
+        while window and (window[-1][1] <= value if keep_max else window[-1][1] >= value):
+            window.pop()
+        window.append((self.count, value))
+        while window[0][0] <= self.count - self.stoch_period:
+            window.popleft()
+    
+    def _peek_extreme(self, window: deque, value: float, keep_max: bool) -> float:
+        """Rolling extreme after a push of ``value``; only the head entry can expire"""
+        for index, extreme in itertools.islice(window, 2):
+            if index > self.count - self.stoch_period:
+                return max(extreme, value) if keep_max else min(extreme, value)
+        return value
+    
+    def update(self, point: MarketDataPoint) -> IndicatorData:
+        """Fold a new bar into the state and return the current indicators"""
+        price = point.price
+        high = point.high or point.price
+        low = point.low or point.price
+        close = point.close or point.price
+        
+        # RSI inputs
+        if self._last_price is not None:
+            delta = price - self._last_price
+            self._gains.push(delta if delta > 0 else 0.0)
+            self._losses.push(-delta if delta < 0 else 0.0)
+        
+        # EMAs and MACD
+        ema_12 = self._ewm_step(self._ema[12], price, 12)
+        ema_26 = self._ewm_step(self._ema[26], price, 26)
+        self._macd = ema_12 - ema_26
+        self._macd_signal = self._ewm_step(self._signal, self._macd, 9)
+        
+        # ATR inputs
+        if self._last_close is not None:
+            self._true_ranges.push(max(high - low, abs(high - self._last_close), abs(low - self._last_close)))
+        
+        self._prices.push(price)
+        self._volumes.push(point.volume or 0)
+        self._push_extreme(self._highs, high, keep_max=True)
+        self._push_extreme(self._lows, low, keep_max=False)
+        
+        self._last_price = price
+        self._last_close = close
+        self.count += 1
+        self.last_timestamp = point.timestamp
+        
+        return self.current()
+    
+    def preview(self, point: MarketDataPoint) -> IndicatorData:
+        """Indicators as if ``point`` were appended, without committing it
+        
+        Same arithmetic as ``update`` on local values, so it costs O(1) and
+        leaves the state untouched.
+        """
+        price = point.price
+        high = point.high or point.price
+        low = point.low or point.price
+        close = point.close or point.price
+        
+        gains, losses = self._gains.mean, self._losses.mean
+        if self._last_price is not None:
+            delta = price - self._last_price
+            gains = self._gains.peek(delta if delta > 0 else 0.0)[0]
+            losses = self._losses.peek(-delta if delta < 0 else 0.0)[0]
+        
+        ema_12 = self._ewm_step(list(self._ema[12]), price, 12)
+        ema_26 = self._ewm_step(list(self._ema[26]), price, 26)
+        macd = ema_12 - ema_26
+        macd_signal = self._ewm_step(list(self._signal), macd, 9)
+        
+        atr = self._true_ranges.mean
+        if self._last_close is not None:
+            atr = self._true_ranges.peek(
+                max(high - low, abs(high - self._last_close), abs(low - self._last_close))
+            )[0]
+        
+        price_mean, price_variance, _ = self._prices.peek(price)
+        volume_mean, _, volume_full = self._volumes.peek(point.volume or 0)
+        
+        return self._indicators(
+            self.count + 1, gains, losses, ema_12, ema_26, macd, macd_signal,
+            price_mean, price_variance,
+            self._peek_extreme(self._highs, high, keep_max=True),
+            self._peek_extreme(self._lows, low, keep_max=False),
+            close, atr, volume_mean if volume_full else None
+        )
+    
+    def current(self) -> IndicatorData:
+        """Indicators for all bars fed so far"""
+        if self.count == 0:
+            return IndicatorData()
+        
+        return self._indicators(
+            self.count, self._gains.mean, self._losses.mean,
+            self._ema[12][0] / self._ema[12][1], self._ema[26][0] / self._ema[26][1],
+            self._macd, self._macd_signal, self._prices.mean, self._prices.variance,
+            self._highs[0][1], self._lows[0][1], self._last_close,
+            self._true_ranges.mean, self._volumes.mean if self._volumes.full else None
+        )
+    
+    def _indicators(self, count: int, avg_gain: float, avg_loss: float, ema_12: float, ema_26: float,
+                    macd: float, macd_signal: float, price_mean: float, price_variance: float,
+                    highest_high: float, lowest_low: float, close: float, atr: float,
+                    volume_sma: Optional[float]) -> IndicatorData:
+        """IndicatorData from window statistics, with each indicator gated on its warm-up length"""
+        rsi = None
+        if count >= self.rsi_period + 1:
+            rsi = 100.0 if avg_loss == 0 else float(100.0 - (100.0 / (1.0 + avg_gain / avg_loss)))
+        
+        if count >= 26:
+            macd, macd_signal = float(macd), float(macd_signal)
+            ema_12, ema_26 = float(ema_12), float(ema_26)
+        else:
+            macd = macd_signal = ema_12 = ema_26 = None
+        
+        bb_upper = bb_lower = bb_middle = sma_20 = None
+        if count >= self.bb_period:
+            bb_middle = float(price_mean)
+            std = float(np.sqrt(price_variance))
+            bb_upper, bb_lower, sma_20 = bb_middle + std * 2, bb_middle - std * 2, bb_middle
+        
+        stoch_k = stoch_d = None
+        if count >= self.stoch_period:
+            if highest_high == lowest_low:
+                stoch_k = 50.0
+            else:
+                stoch_k = float((close - lowest_low) / (highest_high - lowest_low) * 100)
+            stoch_d = stoch_k
+        
+        atr = float(atr) if count >= self.atr_period + 1 else None
+        volume_sma = float(volume_sma) if volume_sma is not None else None
+        
+        return IndicatorData(
+            rsi=rsi,
+            macd=macd,
+            macd_signal=macd_signal,
+            bb_upper=bb_upper,
+            bb_lower=bb_lower,
+            bb_middle=bb_middle,
+            ema_12=ema_12,
+            ema_26=ema_26,
+            sma_20=sma_20,
+            stochastic_k=stoch_k,
+            stochastic_d=stoch_d,
+            volume_sma=volume_sma,
+            atr=atr
+        )
+
+class SymbolHistory:
+    """Closed daily bars for one symbol plus the indicator state folded over them"""
+    
+    def __init__(self, depth: int):
+        self.depth = depth
+        self.bars = PriceSeries.empty()
+        self.indicators = IncrementalIndicators()
+        self.last_bar_date = None
+        self.synced_on = None  # live date the closed bars were last brought up to
+        self.retry_at = 0.0
+        self.lock = asyncio.Lock()
+    
+    def extend(self, bars: List[MarketDataPoint], before) -> int:
+        """Append bars newer than the last stored one and dated before ``before``"""
+        new_bars = []
+        for bar in sorted(bars, key=lambda b: b.timestamp):
+            bar_date = bar.timestamp.date()
+            if bar_date >= before or (self.last_bar_date and bar_date <= self.last_bar_date):
+                continue
+            self.indicators.update(bar)
+            self.last_bar_date = bar_date
+            new_bars.append(bar)
+        
+        if new_bars:
+            self.bars = self.bars.append(new_bars, max_length=self.depth)
+        return len(new_bars)
+
+class HistoryCache:
+    """Per-symbol ring buffer of daily history, seeded once and extended as bars close
+    
+    ``fetch_history(symbol, days)`` is only called to seed a symbol and, once
+    the live date rolls past the last sync, to fetch the few bars that closed
+    since; live points are never stored, so the in-progress bar is always the
+    one passed to ``get``.
+    """
+    
+    def __init__(self, fetch_history, depth: int = 50, retry_interval: float = 300.0):
+        self.fetch_history = fetch_history
+        self.depth = depth
+        self.retry_interval = retry_interval
+        self.symbols: Dict[str, SymbolHistory] = {}
+        self.fetches = 0
+    
+    async def get(self, symbol: str, live: MarketDataPoint) -> SymbolHistory:
+        """History for ``symbol`` up to (not including) the day of ``live``"""
+        history = self.symbols.get(symbol)
+        if history is None:
+            history = self.symbols[symbol] = SymbolHistory(self.depth)
+        
+        today = live.timestamp.date()
+        if history.synced_on == today or time.time() < history.retry_at:
+            return history
+        
+        async with history.lock:
+            if history.synced_on == today:
+                return history
+            
+            if len(history.bars):
+                # Only the bars that closed since the last stored one
+                days = (today - history.last_bar_date).days + 3
+            else:
+                # Calendar days covering ``depth`` trading bars
+                days = int(self.depth * 1.5) + 5
+            
+            self.fetches += 1
+            bars = await self.fetch_history(symbol, days=days)
+            if not bars and not len(history.bars):
+                history.retry_at = time.time() + self.retry_interval
+                return history
+            
+            added = history.extend(bars, before=today)
+            history.synced_on = today
+            logger.debug(f"History for {symbol}: +{added} bars, {len(history.bars)} cached")
+        
+        return history
+    
+    def stats(self) -> Dict[str, int]:
+        return {
+            'symbols': len(self.symbols),
+            'bars': sum(len(h.bars) for h in self.symbols.values()),
+            'fetches': self.fetches
+        }
+
 # =============================================================================
 # HELIX PATTERN ANALYSIS ENGINE
 # =============================================================================
@@ -402,7 +795,7 @@ class HelixPatternAnalyzer:
     
     @staticmethod
     def calculate_helix_vector(indicators: IndicatorData, price_data: MarketDataPoint, 
-                             historical_data: List[MarketDataPoint]) -> List[float]:
+                             historical_data: Union[PriceSeries, List[MarketDataPoint]]) -> List[float]:
         """Calculate 3D helix vector for geometric visualization"""
         
         # Base vector components
@@ -434,7 +827,7 @@ class HelixPatternAnalyzer:
         
         # Add price momentum component
         if len(historical_data) >= 5:
-            recent_prices = [point.price for point in historical_data[-5:]]
+            recent_prices = PriceSeries.coerce(historical_data[-5:]).price
             price_momentum = (recent_prices[-1] - recent_prices[0]) / recent_prices[0]
             z_component += np.tanh(price_momentum * 10) * 0.3
         
@@ -450,33 +843,26 @@ class HelixPatternAnalyzer:
         return vector.tolist()
     
     @staticmethod
-    def detect_helix_pattern(historical_data: List[MarketDataPoint]) -> Dict[str, Any]:
+    def detect_helix_pattern(historical_data: Union[PriceSeries, List[MarketDataPoint]]) -> Dict[str, Any]:
         """Detect and classify helix patterns in price data"""
         if len(historical_data) < 20:
             return {"pattern": "insufficient_data", "confidence": 0.0}
         
         # Extract price series
-        prices = [point.price for point in historical_data]
-        timestamps = [point.timestamp for point in historical_data]
+        prices = PriceSeries.coerce(historical_data).price
         
         # Calculate moving averages for trend analysis
-        short_ma = pd.Series(prices).rolling(window=5).mean().tolist()
-        long_ma = pd.Series(prices).rolling(window=20).mean().tolist()
-        
-        # Analyze trend direction and strength
-        trend_signals = []
-        for i in range(20, len(prices)):
-            if short_ma[i] > long_ma[i]:
-                trend_signals.append(1)  # Bullish
-            else:
-                trend_signals.append(-1)  # Bearish
+        short_ma = pd.Series(prices).rolling(window=5).mean().to_numpy()
+        long_ma = pd.Series(prices).rolling(window=20).mean().to_numpy()
         
-        if not trend_signals:
+        # Analyze trend direction and strength: 1 bullish, -1 bearish
+        trend_signals = np.where(short_ma[20:] > long_ma[20:], 1, -1)
+        
+        if not len(trend_signals):
             return {"pattern": "neutral", "confidence": 0.5}
         
         # Detect pattern based on trend consistency and momentum
-        bullish_signals = sum(1 for signal in trend_signals if signal == 1)
-        bearish_signals = sum(1 for signal in trend_signals if signal == -1)
+        bullish_signals = int(np.count_nonzero(trend_signals == 1))
         
         total_signals = len(trend_signals)
         bullish_ratio = bullish_signals / total_signals
@@ -491,8 +877,7 @@ class HelixPatternAnalyzer:
             pattern_type = "descending_helix"
         elif 0.4 <= bullish_ratio <= 0.6:
             # Check for oscillating pattern
-            pattern_changes = sum(1 for i in range(1, len(trend_signals)) 
-                                if trend_signals[i] != trend_signals[i-1])
+            pattern_changes = int(np.count_nonzero(np.diff(trend_signals)))
             if pattern_changes > len(trend_signals) * 0.3:
                 pattern_type = "double_helix"
             else:
@@ -501,8 +886,8 @@ class HelixPatternAnalyzer:
             pattern_type = "transitional_helix"
         
         # Calculate additional pattern metrics
-        volatility = np.std(prices[-10:]) / np.mean(prices[-10:])
-        momentum = (prices[-1] - prices[-5]) / prices[-5] if len(prices) >= 5 else 0
+        volatility = float(np.std(prices[-10:]) / np.mean(prices[-10:]))
+        momentum = float((prices[-1] - prices[-5]) / prices[-5]) if len(prices) >= 5 else 0
         
         return {
             "pattern": pattern_type,
@@ -513,6 +898,143 @@ class HelixPatternAnalyzer:
             "detected_at": datetime.utcnow().isoformat()
         }
 
+# =============================================================================
+# COMPUTE EXECUTOR
+# =============================================================================
+
+@dataclass
+class AnalysisJob:
+    """Everything the analysis stage needs for one symbol, cheap to pickle"""
+    symbol: str
+    current: MarketDataPoint
+    history: PriceSeries
+    indicator_state: IncrementalIndicators  # live per-symbol state, only read via preview()
+    sentiment: Optional[SentimentData] = None
+
+def analyze_symbol(job: AnalysisJob) -> Dict[str, Any]:
+    """CPU-bound part of the pipeline: indicators, confluence and helix analysis"""
+    current_data = job.current
+    historical_data = job.history
+    
+    # Calculate technical indicators
+    indicators = job.indicator_state.preview(current_data)
+    
+    # Calculate confluence and helix patterns
+    confluence_score = HelixPatternAnalyzer.calculate_confluence_score(indicators, current_data)
+    helix_vector = HelixPatternAnalyzer.calculate_helix_vector(indicators, current_data, historical_data)
+    helix_pattern = HelixPatternAnalyzer.detect_helix_pattern(historical_data.append(current_data))
+    
+    return {
+        'symbol': job.symbol,
+        'timestamp': current_data.timestamp.isoformat(),
+        'price_data': asdict(current_data),
+        'indicators': asdict(indicators),
+        'sentiment': asdict(job.sentiment) if job.sentiment else None,
+        'confluence_score': confluence_score,
+        'helix_vector': helix_vector,
+        'helix_pattern': helix_pattern,
+        'data_quality': {
+            'sources_used': [current_data.source],
+            'historical_points': len(historical_data),
+            'indicators_calculated': sum(1 for v in asdict(indicators).values() if v is not None),
+            'sentiment_available': job.sentiment is not None
+        }
+    }
+
+def _analyze_batch(jobs: List[AnalysisJob]) -> Tuple[float, List[Optional[Dict[str, Any]]]]:
+    """Worker entry point: analyze a batch, returning its start time for queue-wait metrics"""
+    started_at = time.time()
+    results = []
+    for job in jobs:
+        try:
+            results.append(analyze_symbol(job))
+        except Exception as e:
+            logger.error(f"Analysis failed for {job.symbol}: {str(e)}")
+            results.append(None)
+    return started_at, results
+
+class ComputeExecutor:
+    """Runs symbol analysis off the event loop in a process or thread pool
+    
+    ``run_batch`` splits a cycle's jobs into at most ``workers`` chunks, so a
+    whole watchlist costs a handful of pool submissions; ``mode="inline"``
+    runs on the loop (debugging only).
+    """
+    
+    def __init__(self, mode: str = "process", workers: Optional[int] = None):
+        if mode not in ("process", "thread", "inline"):
+            raise ValueError(f"Unknown compute mode: {mode}")
+        self.mode = mode
+        self.workers = workers or min(4, os.cpu_count() or 1)
+        self.pool = None
+        
+        self.pending = 0
+        self.metrics = {
+            'batches': 0, 'jobs': 0, 'failed': 0, 'max_queue_depth': 0,
+            'queue_wait_ms_total': 0.0, 'queue_wait_ms_max': 0.0, 'run_ms_total': 0.0
+        }
+    
+    def _get_pool(self):
+        if self.pool is None:
+            executor = ProcessPoolExecutor if self.mode == "process" else ThreadPoolExecutor
+            self.pool = executor(max_workers=self.workers)
+        return self.pool
+    
+    async def _submit(self, jobs: List[AnalysisJob]) -> List[Optional[Dict[str, Any]]]:
+        submitted_at = time.time()
+        self.pending += 1
+        self.metrics['max_queue_depth'] = max(self.metrics['max_queue_depth'], self.pending)
+        try:
+            if self.mode == "inline":
+                started_at, results = _analyze_batch(jobs)
+            else:
+                loop = asyncio.get_running_loop()
+                started_at, results = await loop.run_in_executor(self._get_pool(), _analyze_batch, jobs)
+        finally:
+            self.pending -= 1
+        
+        wait_ms = max(started_at - submitted_at, 0.0) * 1000
+        self.metrics['batches'] += 1
+        self.metrics['queue_wait_ms_total'] += wait_ms
+        self.metrics['queue_wait_ms_max'] = max(self.metrics['queue_wait_ms_max'], wait_ms)
+        self.metrics['run_ms_total'] += (time.time() - started_at) * 1000
+        return results
+    
+    async def run_batch(self, jobs: List[AnalysisJob]) -> List[Optional[Dict[str, Any]]]:
+        """Analyze ``jobs`` in the pool; results line up with ``jobs`` (None on failure)"""
+        if not jobs:
+            return []
+        
+        size = -(-len(jobs) // self.workers)
+        chunks = [jobs[i:i + size] for i in range(0, len(jobs), size)]
+        results = []
+        for chunk_results in await asyncio.gather(*(self._submit(chunk) for chunk in chunks)):
+            results.extend(chunk_results)
+        
+        self.metrics['jobs'] += len(jobs)
+        self.metrics['failed'] += sum(1 for result in results if result is None)
+        return results
+    
+    async def run(self, job: AnalysisJob) -> Optional[Dict[str, Any]]:
+        return (await self._submit([job]))[0]
+    
+    def stats(self) -> Dict[str, Any]:
+        """Queue depth and timing metrics"""
+        batches = self.metrics['batches']
+        return {
+            'mode': self.mode,
+            'workers': self.workers,
+            'queue_depth': self.pending,
+            **self.metrics,
+            'avg_queue_wait_ms': self.metrics['queue_wait_ms_total'] / batches if batches else 0.0,
+            'avg_run_ms': self.metrics['run_ms_total'] / batches if batches else 0.0
+        }
+    
+    def shutdown(self):
+        if self.pool is not None:
+            self.pool.shutdown(wait=False, cancel_futures=True)
+            self.pool = None
+
 # =============================================================================
 # DATA AGGREGATION ENGINE
 # =============================================================================
@@ -520,17 +1042,26 @@ class HelixPatternAnalyzer:
 class MarketDataAggregator:
     """Main engine for aggregating market data from multiple sources"""
     
-    def __init__(self, redis_client, db_session):
+    def __init__(self, redis_client, db_session, history_depth: int = 50,
+                 compute_mode: str = "process", compute_workers: Optional[int] = None,
+                 sentiment_interval: float = 900.0):
         self.redis_client = redis_client
         self.db_session = db_session
         self.rate_limiter = RateLimitManager(redis_client)
+        self.history = HistoryCache(self.fetch_historical_data, depth=history_depth)
+        self.compute = ComputeExecutor(compute_mode, compute_workers)
+        self.http = HTTPClientManager()
+        
+        # News moves far slower than quotes: sentiment is refetched at most every sentiment_interval
+        self.sentiment_interval = sentiment_interval
+        self.sentiment_cache: Dict[str, Tuple[float, Optional[SentimentData]]] = {}
         
         # Initialize data sources
         self.sources = {
-            'yahoo_finance': YahooFinanceSource(DATA_SOURCES['yahoo_finance'], self.rate_limiter),
-            'coingecko': CoinGeckoSource(DATA_SOURCES['coingecko'], self.rate_limiter),
-            'alpha_vantage': AlphaVantageSource(DATA_SOURCES['alpha_vantage'], self.rate_limiter),
-            'newsapi': NewsAPISource(DATA_SOURCES['newsapi'], self.rate_limiter)
+            'yahoo_finance': YahooFinanceSource(DATA_SOURCES['yahoo_finance'], self.rate_limiter, self.http),
+            'coingecko': CoinGeckoSource(DATA_SOURCES['coingecko'], self.rate_limiter, self.http),
+            'alpha_vantage': AlphaVantageSource(DATA_SOURCES['alpha_vantage'], self.rate_limiter, self.http),
+            'newsapi': NewsAPISource(DATA_SOURCES['newsapi'], self.rate_limiter, self.http)
         }
         
         # Failover state tracking
@@ -541,6 +1072,8 @@ class MarketDataAggregator:
         """Cleanup all data sources"""
         for source in self.sources.values():
             await source.cleanup()
+        await self.http.close()
+        self.compute.shutdown()
     
     def get_asset_type(self, symbol: str) -> AssetType:
         """Determine asset type from symbol"""
@@ -556,25 +1089,26 @@ class MarketDataAggregator:
         else:
             return AssetType.STOCK
     
-    async def fetch_real_time_data(self, symbol: str) -> Optional[MarketDataPoint]:
-        """Fetch real-time data with automatic failover"""
-        asset_type = self.get_asset_type(symbol)
-        
-        # Try sources in priority order
+    def _sources_for(self, asset_type: AssetType) -> List[Tuple[str, BaseDataSource]]:
+        """Healthy sources that serve an asset type, in priority order"""
         sorted_sources = sorted(
             self.sources.items(), 
             key=lambda x: DATA_SOURCES[x[0]].priority
         )
         
-        for source_name, source in sorted_sources:
-            # Skip unhealthy sources
-            if not self.source_health.get(source_name, True):
-                continue
-            
-            # Skip if source doesn't support this asset type
-            if asset_type == AssetType.CRYPTO and source_name not in ['coingecko', 'yahoo_finance']:
-                continue
-            
+        return [
+            (source_name, source) for source_name, source in sorted_sources
+            # Skip unhealthy sources and those that don't support this asset type
+            if self.source_health.get(source_name, True)
+            and not (asset_type == AssetType.CRYPTO and source_name not in ['coingecko', 'yahoo_finance'])
+        ]
+    
+    async def fetch_real_time_data(self, symbol: str) -> Optional[MarketDataPoint]:
+        """Fetch real-time data with automatic failover"""
+        asset_type = self.get_asset_type(symbol)
+        
+        # Try sources in priority order
+        for source_name, source in self._sources_for(asset_type):
             try:
                 data = await source.fetch_data(symbol, asset_type)
                 if data:
@@ -592,6 +1126,57 @@ class MarketDataAggregator:
         logger.error(f"All sources failed for {symbol}")
         return None
     
+    async def fetch_real_time_batch(self, symbols: List[str]) -> Dict[str, MarketDataPoint]:
+        """Fetch real-time data for many symbols with batch requests, grouped by asset type
+        
+        Each group goes to the batch-capable sources in priority order; only
+        symbols still missing afterwards fall back to ``fetch_real_time_data``.
+        """
+        groups = {}
+        for symbol in symbols:
+            groups.setdefault(self.get_asset_type(symbol), []).append(symbol)
+        
+        async def fetch_group(asset_type: AssetType, group: List[str]) -> Dict[str, MarketDataPoint]:
+            fetched = {}
+            for source_name, source in self._sources_for(asset_type):
+                remaining = [symbol for symbol in group if symbol not in fetched]
+                if not remaining:
+                    break
+                if not source.supports_batch:
+                    continue
+                
+                try:
+                    data = await source.fetch_batch(remaining, asset_type)
+                except Exception as e:
+                    logger.warning(f"Batch fetch from {source_name} failed for {len(remaining)} symbols: {str(e)}")
+                    self.source_health[source_name] = False
+                    self.last_health_check[source_name] = datetime.utcnow()
+                    continue
+                
+                if data:
+                    logger.info(f"Batch fetched {len(data)}/{len(remaining)} {asset_type.value} from {source_name}")
+                    self.source_health[source_name] = True
+                    fetched.update(data)
+            return fetched
+        
+        results = {}
+        for fetched in await asyncio.gather(*(fetch_group(asset_type, group) for asset_type, group in groups.items())):
+            results.update(fetched)
+        
+        # Single-symbol failover only for the misses
+        misses = [symbol for symbol in symbols if symbol not in results]
+        if misses:
+            semaphore = asyncio.Semaphore(10)
+            
+            async def fetch_single(symbol: str) -> Optional[MarketDataPoint]:
+                async with semaphore:
+                    return await self.fetch_real_time_data(symbol)
+            
+            points = await asyncio.gather(*(fetch_single(symbol) for symbol in misses))
+            results.update({symbol: point for symbol, point in zip(misses, points) if point})
+        
+        return results
+    
     async def fetch_historical_data(self, symbol: str, days: int = 30) -> List[MarketDataPoint]:
         """Fetch historical data with failover"""
         asset_type = self.get_asset_type(symbol)
@@ -620,59 +1205,58 @@ class MarketDataAggregator:
         return []
     
     async def fetch_sentiment_data(self, symbol: str) -> Optional[SentimentData]:
-        """Fetch sentiment data from news sources"""
+        """Fetch sentiment data from news sources, reusing results younger than ``sentiment_interval``"""
+        cached = self.sentiment_cache.get(symbol)
+        if cached and time.monotonic() - cached[0] < self.sentiment_interval:
+            return cached[1]
+        
         if 'newsapi' not in self.sources or not self.source_health.get('newsapi', True):
             return None
         
         try:
-            return await self.sources['newsapi'].fetch_sentiment(symbol)
+            sentiment = await self.sources['newsapi'].fetch_sentiment(symbol)
         except Exception as e:
             logger.error(f"Sentiment fetch failed for {symbol}: {str(e)}")
             return None
+        
+        self.sentiment_cache[symbol] = (time.monotonic(), sentiment)
+        return sentiment
     
-    async def process_symbol_complete(self, symbol: str) -> Optional[Dict[str, Any]]:
-        """Complete processing pipeline for a symbol"""
+    async def prepare_symbol(self, symbol: str,
+                             current_data: Optional[MarketDataPoint] = None) -> Optional[AnalysisJob]:
+        """I/O part of the pipeline: quote, cached history and sentiment for one symbol"""
         try:
-            logger.info(f"Processing complete data for {symbol}")
-            
-            # Fetch real-time data
-            current_data = await self.fetch_real_time_data(symbol)
+            # Fetch real-time data unless a batch request already did
+            if current_data is None:
+                current_data = await self.fetch_real_time_data(symbol)
             if not current_data:
                 return None
             
-            # Fetch historical data for indicators
-            historical_data = await self.fetch_historical_data(symbol, days=50)
-            
-            # Calculate technical indicators
-            indicators = TechnicalIndicators.calculate_all_indicators(historical_data + [current_data])
+            # Cached closed bars for indicators; the live point is the open bar
+            history = await self.history.get(symbol, current_data)
             
-            # Fetch sentiment data
+            # Sentiment on its own, slower cadence
             sentiment_data = await self.fetch_sentiment_data(symbol)
             
-            # Calculate confluence and helix patterns
-            confluence_score = HelixPatternAnalyzer.calculate_confluence_score(indicators, current_data)
-            helix_vector = HelixPatternAnalyzer.calculate_helix_vector(indicators, current_data, historical_data)
-            helix_pattern = HelixPatternAnalyzer.detect_helix_pattern(historical_data + [current_data])
+            return AnalysisJob(symbol, current_data, history.bars, history.indicators, sentiment_data)
             
-            # Compile complete result
-            result = {
-                'symbol': symbol,
-                'timestamp': current_data.timestamp.isoformat(),
-                'price_data': asdict(current_data),
-                'indicators': asdict(indicators),
-                'sentiment': asdict(sentiment_data) if sentiment_data else None,
-                'confluence_score': confluence_score,
-                'helix_vector': helix_vector,
-                'helix_pattern': helix_pattern,
-                'data_quality': {
-                    'sources_used': [current_data.source],
-                    'historical_points': len(historical_data),
-                    'indicators_calculated': sum(1 for v in asdict(indicators).values() if v is not None),
-                    'sentiment_available': sentiment_data is not None
-                }
-            }
+        except Exception as e:
+            logger.error(f"Data preparation failed for {symbol}: {str(e)}")
+            return None
+    
+    async def process_symbol_complete(self, symbol: str,
+                                      current_data: Optional[MarketDataPoint] = None) -> Optional[Dict[str, Any]]:
+        """Complete processing pipeline for a symbol, optionally from an already fetched quote"""
+        try:
+            logger.info(f"Processing complete data for {symbol}")
             
-            logger.info(f"✅ Complete processing finished for {symbol}")
+            job = await self.prepare_symbol(symbol, current_data)
+            if not job:
+                return None
+            
+            result = await self.compute.run(job)
+            if result:
+                logger.info(f"✅ Complete processing finished for {symbol}")
             return result
             
         except Exception as e:
@@ -683,6 +1267,17 @@ class MarketDataAggregator:
         """Periodic health check for all data sources"""
         logger.info("Running data source health checks...")
         
+        # Probes run on the dedicated health pool
+        pool_token = http_pool.set('health')
+        try:
+            await self._run_health_checks()
+        finally:
+            http_pool.reset(pool_token)
+        
+        logger.info(f"HTTP pool stats: {self.http.stats()}")
+    
+    async def _run_health_checks(self):
+        """Probe each source and refresh its health flag"""
         for source_name, source in self.sources.items():
             try:
                 # Simple health check - try to fetch a common symbol
@@ -734,6 +1329,457 @@ class DataBroadcaster:
         except Exception as e:
             logger.error(f"Broadcast error for {symbol}: {str(e)}")
 
+# =============================================================================
+# DATABASE WRITE-BEHIND SINK
+# =============================================================================
+
+MARKET_DATA_COLUMNS = (
+    'id', 'asset_id', 'timestamp', 'price', 'volume', 'high', 'low', 'open', 'close',
+    'indicators', 'sentiment_score', 'confluence_magnitude', 'confluence_vector', 'created_at'
+)
+
+class MarketDataSink:
+    """Write-behind PostgreSQL writer for processed market data
+    
+    ``submit`` only enqueues; a background task flushes batches with COPY
+    (or a multi-row INSERT) through an asyncpg pool once ``batch_size`` rows
+    are queued or ``flush_interval`` seconds have passed. The queue is
+    bounded, so when the database falls behind ``submit`` waits instead of
+    letting memory grow. Asset ids come from an in-memory symbol map; unknown
+    symbols are looked up or created once per flush.
+    """
+    
+    def __init__(self, dsn: str, batch_size: int = 200, flush_interval: float = 2.0,
+                 max_queue: int = 5000, use_copy: bool = True, pool_size: int = 4,
+                 max_retries: int = 5):
+        self.dsn = dsn.replace('postgresql+asyncpg://', 'postgresql://').replace('postgresql+psycopg2://', 'postgresql://')
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.use_copy = use_copy
+        self.pool_size = pool_size
+        self.max_retries = max_retries
+        
+        self.queue = asyncio.Queue(maxsize=max_queue)
+        self.asset_ids: Dict[str, uuid.UUID] = {}
+        self.pool = None
+        self._flusher = None
+        
+        self.metrics = {'queued': 0, 'written': 0, 'dropped': 0, 'batches': 0, 'retries': 0,
+                        'backpressure_waits': 0, 'last_flush_ms': 0.0}
+    
+    async def start(self):
+        """Open the pool, load known assets and start the flusher"""
+        self.pool = await asyncpg.create_pool(self.dsn, min_size=1, max_size=self.pool_size)
+        
+        rows = await self.pool.fetch("SELECT id, symbol FROM market_assets WHERE is_active = TRUE")
+        self.asset_ids = {row['symbol']: row['id'] for row in rows}
+        
+        self._flusher = asyncio.create_task(self._flush_loop())
+        logger.info(f"📝 Market data sink started ({len(self.asset_ids)} known assets)")
+    
+    async def submit(self, symbol: str, asset_type: str, processed_data: Dict[str, Any]):
+        """Queue a processed symbol for writing; waits when the queue is full"""
+        timestamp = datetime.fromisoformat(processed_data['timestamp'].replace('Z', '+00:00'))
+        if timestamp.tzinfo is not None:
+            timestamp = timestamp.astimezone(timezone.utc).replace(tzinfo=None)
+        
+        price_data = processed_data['price_data']
+        sentiment = processed_data.get('sentiment')
+        row = (
+            uuid.uuid4(), timestamp,
+            price_data.get('price'), price_data.get('volume'), price_data.get('high'),
+            price_data.get('low'), price_data.get('open'), price_data.get('close'),
+            json.dumps(processed_data['indicators']),
+            sentiment.get('overall_score') if sentiment else None,
+            processed_data['confluence_score'],
+            list(processed_data['helix_vector']),
+            datetime.utcnow()
+        )
+        
+        if self.queue.full():
+            self.metrics['backpressure_waits'] += 1
+        await self.queue.put((symbol, asset_type, row))
+        self.metrics['queued'] += 1
+    
+    async def _flush_loop(self):
+        while True:
+            batch = [await self.queue.get()]
+            deadline = time.monotonic() + self.flush_interval
+            
+            # Fill the batch until it is full or the interval runs out
+            while len(batch) < self.batch_size:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self.queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            
+            await self._flush_with_retry(batch)
+            for _ in batch:
+                self.queue.task_done()
+    
+    async def _flush_with_retry(self, batch: List[Tuple[str, str, tuple]]):
+        """Write a batch, backing off while the database is unavailable"""
+        for attempt in range(self.max_retries + 1):
+            try:
+                await self._flush(batch)
+                return
+            except Exception as e:
+                if attempt == self.max_retries:
+                    self.metrics['dropped'] += len(batch)
+                    logger.error(f"Dropping {len(batch)} market data rows after {attempt + 1} attempts: {str(e)}")
+                    return
+                self.metrics['retries'] += 1
+                delay = min(2 ** attempt, 30)
+                logger.warning(f"Market data flush failed ({str(e)}), retrying in {delay}s")
+                await asyncio.sleep(delay)
+    
+    async def _resolve_assets(self, conn, assets: Dict[str, str]) -> Dict[str, uuid.UUID]:
+        """Ids for symbols missing from the map, creating assets that don't exist yet
+        
+        The caller merges the result into the map only after its transaction
+        commits, so a rolled-back insert never leaves a dangling id behind.
+        """
+        missing = [symbol for symbol in assets if symbol not in self.asset_ids]
+        if not missing:
+            return {}
+        
+        rows = await conn.fetch(
+            "SELECT id, symbol FROM market_assets WHERE is_active = TRUE AND symbol = ANY($1::text[])", missing
+        )
+        resolved = {row['symbol']: row['id'] for row in rows}
+        
+        new_assets = [
+            (uuid.uuid4(), symbol, assets[symbol], symbol, True, 'USD', '{}', datetime.utcnow())
+            for symbol in missing if symbol not in resolved
+        ]
+        if new_assets:
+            await conn.executemany(
+                "INSERT INTO market_assets (id, symbol, asset_type, name, is_active, currency, metadata, created_at) "
+                "VALUES ($1, $2, $3, $4, $5, $6, $7, $8)",
+                new_assets
+            )
+            resolved.update({asset[1]: asset[0] for asset in new_assets})
+        return resolved
+    
+    async def _flush(self, batch: List[Tuple[str, str, tuple]]):
+        start_time = time.perf_counter()
+        
+        async with self.pool.acquire() as conn:
+            async with conn.transaction():
+                resolved = await self._resolve_assets(conn, {symbol: asset_type for symbol, asset_type, _ in batch})
+                asset_ids = {**self.asset_ids, **resolved}
+                records = [(row[0], asset_ids[symbol]) + row[1:] for symbol, _, row in batch]
+                
+                if self.use_copy:
+                    await conn.copy_records_to_table('market_data', records=records, columns=MARKET_DATA_COLUMNS)
+                else:
+                    placeholders = ', '.join(f"${i + 1}" for i in range(len(MARKET_DATA_COLUMNS)))
+                    await conn.executemany(
+                        f"INSERT INTO market_data ({', '.join(MARKET_DATA_COLUMNS)}) VALUES ({placeholders})",
+                        records
+                    )
+        
+        self.asset_ids.update(resolved)
+        self.metrics['batches'] += 1
+        self.metrics['written'] += len(batch)
+        self.metrics['last_flush_ms'] = (time.perf_counter() - start_time) * 1000
+        logger.debug(f"Flushed {len(batch)} market data rows in {self.metrics['last_flush_ms']:.1f}ms")
+    
+    def stats(self) -> Dict[str, Any]:
+        return {'queue_depth': self.queue.qsize(), 'known_assets': len(self.asset_ids), **self.metrics}
+    
+    async def close(self, timeout: float = 30.0):
+        """Drain queued rows, then stop the flusher and close the pool"""
+        if self._flusher:
+            try:
+                await asyncio.wait_for(self.queue.join(), timeout)
+            except asyncio.TimeoutError:
+                logger.warning(f"Market data sink closed with {self.queue.qsize()} rows unwritten")
+            self._flusher.cancel()
+            self._flusher = None
+        if self.pool:
+            await self.pool.close()
+            self.pool = None
+
+# =============================================================================
+# REDIS CYCLE CACHE
+# =============================================================================
+
+class MarketCacheSink:
+    """Writes a whole update cycle's snapshots to Redis in one pipelined round trip"""
+    
+    def __init__(self, client: 'aioredis.Redis', ttl: int = 300, summary_ttl: int = 600,
+                 summary_key: str = "helixone:market_summary"):
+        self.client = client
+        self.ttl = ttl
+        self.summary_ttl = summary_ttl
+        self.summary_key = summary_key
+        self.metrics = {'cycles': 0, 'symbols': 0, 'errors': 0, 'last_latency_ms': 0.0, 'max_latency_ms': 0.0}
+    
+    @classmethod
+    def from_sync_client(cls, redis_client, **kwargs) -> 'MarketCacheSink':
+        """Async client on the same server/db as an existing sync client"""
+        connection = redis_client.connection_pool.connection_kwargs
+        shared = ('host', 'port', 'db', 'username', 'password', 'socket_timeout',
+                  'socket_connect_timeout', 'decode_responses', 'encoding')
+        return cls(aioredis.Redis(**{key: connection[key] for key in shared if key in connection}), **kwargs)
+    
+    @staticmethod
+    def snapshot(symbol: str, processed_data: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """Per-symbol cache entry and market summary entry"""
+        # Prepare data for caching (remove non-serializable items)
+        cache_data = {
+            'symbol': symbol,
+            'timestamp': processed_data['timestamp'],
+            'price': processed_data['price_data']['price'],
+            'change_24h': processed_data['price_data'].get('change_24h'),
+            'change_percent_24h': processed_data['price_data'].get('change_percent_24h'),
+            'volume': processed_data['price_data'].get('volume'),
+            'confluence_score': processed_data['confluence_score'],
+            'helix_vector': processed_data['helix_vector'],
+            'helix_pattern': processed_data['helix_pattern']['pattern'],
+            'indicators': {
+                key: value for key, value in processed_data['indicators'].items() 
+                if value is not None
+            },
+            'sentiment_score': (
+                processed_data['sentiment']['overall_score'] 
+                if processed_data.get('sentiment') else 0.0
+            ),
+            'last_updated': datetime.utcnow().isoformat()
+        }
+        
+        summary_data = {
+            'symbol': symbol,
+            'price': cache_data['price'],
+            'change_percent': cache_data.get('change_percent_24h', 0),
+            'confluence': cache_data['confluence_score'],
+            'pattern': cache_data['helix_pattern']
+        }
+        return cache_data, summary_data
+    
+    async def write_cycle(self, processed: List[Tuple[str, Dict[str, Any]]],
+                          ttls: Optional[Dict[str, int]] = None) -> int:
+        """SETEX every symbol, one HSET of the summary and one EXPIRE, pipelined
+        
+        ``ttls`` overrides the default TTL per symbol, so entries for rarely
+        refreshed symbols outlive the gap until their next refresh.
+        """
+        if not processed:
+            return 0
+        
+        ttls = ttls or {}
+        start_time = time.perf_counter()
+        summary = {}
+        
+        try:
+            pipe = self.client.pipeline(transaction=False)
+            for symbol, processed_data in processed:
+                cache_data, summary_data = self.snapshot(symbol, processed_data)
+                pipe.setex(f"helixone:market_data:{symbol}", ttls.get(symbol, self.ttl),
+                           json.dumps(cache_data, default=str))
+                summary[symbol] = json.dumps(summary_data, default=str)
+            
+            # Also cache in a market summary for quick access
+            pipe.hset(self.summary_key, mapping=summary)
+            pipe.expire(self.summary_key, max(self.summary_ttl, *ttls.values(), 0))
+            await pipe.execute()
+            
+        except Exception as e:
+            self.metrics['errors'] += 1
+            logger.error(f"Cache storage error for {len(processed)} symbols: {str(e)}")
+            return 0
+        
+        latency_ms = (time.perf_counter() - start_time) * 1000
+        self.metrics['cycles'] += 1
+        self.metrics['symbols'] += len(processed)
+        self.metrics['last_latency_ms'] = latency_ms
+        self.metrics['max_latency_ms'] = max(self.metrics['max_latency_ms'], latency_ms)
+        logger.debug(f"Cached {len(processed)} symbols in one pipeline ({latency_ms:.1f}ms)")
+        return len(processed)
+    
+    async def cleanup_expired(self, pattern: str = "helixone:market_data:*", batch_size: int = 500,
+                              pause: float = 0.01, time_budget: Optional[float] = None,
+                              cursor_key: str = "helixone:cleanup:cursor") -> Dict[str, Any]:
+        """Incrementally UNLINK keys matching ``pattern`` that have no expiry
+        
+        Walks the keyspace with SCAN in ``batch_size`` steps, checks TTLs in one
+        pipeline per batch and sleeps ``pause`` between batches. The cursor is
+        saved in ``cursor_key`` after every batch, so a run that is cancelled or
+        hits ``time_budget`` resumes where it stopped.
+        """
+        started = time.monotonic()
+        cursor = int(await self.client.get(cursor_key) or 0)
+        resumed = cursor != 0
+        progress = {'scanned': 0, 'unlinked': 0, 'batches': 0, 'resumed': resumed, 'complete': False}
+        
+        while True:
+            cursor, keys = await self.client.scan(cursor=cursor, match=pattern, count=batch_size)
+            progress['batches'] += 1
+            progress['scanned'] += len(keys)
+            
+            if keys:
+                pipe = self.client.pipeline(transaction=False)
+                for key in keys:
+                    pipe.ttl(key)
+                ttls = await pipe.execute()
+                
+                # -1: no expiration set (-2 means already gone)
+                stale = [key for key, ttl in zip(keys, ttls) if ttl == -1]
+                if stale:
+                    await self.client.unlink(*stale)
+                    progress['unlinked'] += len(stale)
+            
+            if cursor == 0:
+                await self.client.delete(cursor_key)
+                progress['complete'] = True
+                break
+            
+            await self.client.set(cursor_key, cursor, ex=86400)
+            if time_budget is not None and time.monotonic() - started >= time_budget:
+                break
+            
+            # Let other commands (and our own event loop) through between batches
+            await asyncio.sleep(pause)
+        
+        progress['elapsed_s'] = round(time.monotonic() - started, 3)
+        return progress
+    
+    def stats(self) -> Dict[str, Any]:
+        return dict(self.metrics)
+    
+    async def close(self):
+        await self.client.aclose()
+
+# =============================================================================
+# REFRESH SCHEDULER
+# =============================================================================
+
+class RefreshScheduler:
+    """Priority queue of next-due refresh times, one entry per symbol
+    
+    Cadence comes from demand: subscribed symbols refresh at their highest
+    subscriber tier's interval, shortened for more subscribers and higher
+    volatility; unsubscribed ones and closed markets fall back to
+    ``idle_interval``. Rescheduling uses lazy deletion, so an entry is only
+    live while it matches ``self.due[symbol]``.
+    """
+    
+    # Seconds between refreshes by subscriber tier level (basic, pro, premium, enterprise)
+    TIER_INTERVALS = {0: 30.0, 1: 15.0, 2: 5.0, 3: 2.0}
+    REFERENCE_VOLATILITY = 0.02  # daily ATR / price that gets the tier interval unchanged
+    EXCHANGE_TZ = ZoneInfo("America/New_York")
+    
+    def __init__(self, get_asset_type, min_interval: float = 2.0, idle_interval: float = 3600.0,
+                 coalesce: float = 1.0):
+        self.get_asset_type = get_asset_type
+        self.min_interval = min_interval
+        self.idle_interval = idle_interval
+        self.coalesce = coalesce
+        
+        self.heap: List[Tuple[float, str]] = []
+        self.due: Dict[str, float] = {}
+        self.popped_due: Dict[str, float] = {}
+        self.last_run: Dict[str, float] = {}
+        self.volatility: Dict[str, float] = {}
+        self.demand: Dict[str, Tuple[int, int]] = {}
+    
+    def is_market_open(self, symbol: str, now: Optional[datetime] = None) -> bool:
+        """Crypto trades 24/7, FX Sunday 17:00 to Friday 17:00 New York, stocks 9:30-16:00 on weekdays"""
+        asset_type = self.get_asset_type(symbol)
+        if asset_type == AssetType.CRYPTO:
+            return True
+        
+        local = (now or datetime.now(timezone.utc)).astimezone(self.EXCHANGE_TZ)
+        minutes = local.hour * 60 + local.minute
+        if asset_type == AssetType.FOREX:
+            weekday = local.weekday()
+            if weekday == 5:
+                return False
+            if weekday == 6:
+                return minutes >= 17 * 60
+            if weekday == 4:
+                return minutes < 17 * 60
+            return True
+        
+        return local.weekday() < 5 and 9 * 60 + 30 <= minutes < 16 * 60
+    
+    def interval(self, symbol: str, now: Optional[datetime] = None) -> float:
+        """Seconds until ``symbol`` should be refreshed again"""
+        subscribers, tier_level = self.demand.get(symbol, (0, 0))
+        if not subscribers or not self.is_market_open(symbol, now):
+            return self.idle_interval
+        
+        interval = self.TIER_INTERVALS.get(tier_level, self.TIER_INTERVALS[0])
+        interval /= 1.0 + math.log10(subscribers)
+        
+        volatility = self.volatility.get(symbol)
+        if volatility:
+            interval /= min(max(volatility / self.REFERENCE_VOLATILITY, 0.5), 3.0)
+        
+        return min(max(interval, self.min_interval), self.idle_interval)
+    
+    def _schedule(self, symbol: str, due_at: float):
+        self.due[symbol] = due_at
+        heapq.heappush(self.heap, (due_at, symbol))
+    
+    def update_demand(self, universe: List[str], demand: Dict[str, Tuple[int, int]], now: float):
+        """Track new demand; symbols whose cadence got shorter are pulled forward"""
+        self.demand = demand
+        symbols = set(universe) | set(demand)
+        
+        # Drop symbols nobody watches any more (their heap entries go stale)
+        for symbol in [symbol for symbol in self.due if symbol not in symbols]:
+            del self.due[symbol]
+        
+        for symbol in symbols:
+            last_run = self.last_run.get(symbol)
+            due_at = now if last_run is None else last_run + self.interval(symbol)
+            if symbol not in self.due or due_at < self.due[symbol]:
+                self._schedule(symbol, max(due_at, now))
+    
+    def pop_due(self, now: float) -> List[str]:
+        """Symbols due now, plus any due within the coalescing window so they share a batch"""
+        symbols = []
+        while self.heap and self.heap[0][0] <= now + self.coalesce:
+            due_at, symbol = heapq.heappop(self.heap)
+            if self.due.get(symbol) == due_at:
+                del self.due[symbol]
+                self.popped_due[symbol] = due_at
+                symbols.append(symbol)
+        return symbols
+    
+    def complete(self, symbols: List[str], processed: Dict[str, Dict[str, Any]], now: float):
+        """Record a refresh and schedule each symbol's next one"""
+        for symbol in symbols:
+            processed_data = processed.get(symbol)
+            if processed_data:
+                price = processed_data['price_data'].get('price')
+                atr = processed_data['indicators'].get('atr')
+                if atr and price:
+                    self.volatility[symbol] = atr / price
+            
+            # Count from the original due time so coalescing doesn't shorten the cadence
+            base = max(now, self.popped_due.pop(symbol, now))
+            self.last_run[symbol] = base
+            self._schedule(symbol, base + self.interval(symbol))
+    
+    def seconds_until_next(self, now: float) -> float:
+        while self.heap and self.due.get(self.heap[0][1]) != self.heap[0][0]:
+            heapq.heappop(self.heap)
+        return max(self.heap[0][0] - now, 0.0) if self.heap else self.idle_interval
+    
+    def stats(self) -> Dict[str, Any]:
+        return {
+            'scheduled': len(self.due),
+            'subscribed': len(self.demand),
+            'heap_size': len(self.heap),
+            'hot': sum(1 for symbol in self.due if self.interval(symbol) < self.idle_interval)
+        }
+
 # =============================================================================
 # BACKGROUND DATA PROCESSING SERVICE
 # =============================================================================
@@ -741,16 +1787,33 @@ class DataBroadcaster:
 class MarketDataService:
     """Background service for continuous market data processing"""
     
-    def __init__(self, redis_client, db_session):
+    def __init__(self, redis_client, db_session, history_depth: int = 50,
+                 compute_mode: str = "process", compute_workers: Optional[int] = None,
+                 database_url: Optional[str] = None, redis_url: Optional[str] = None):
         self.redis_client = redis_client
         self.db_session = db_session
-        self.aggregator = MarketDataAggregator(redis_client, db_session)
+        self.aggregator = MarketDataAggregator(
+            redis_client, db_session, history_depth=history_depth,
+            compute_mode=compute_mode, compute_workers=compute_workers
+        )
+        self.scheduler = RefreshScheduler(self.aggregator.get_asset_type)
+        # Batched asyncpg writes when a database URL is given, per-row ORM commits otherwise
+        self.sink = MarketDataSink(database_url) if database_url else None
+        # The summary hash has to survive the longest (idle) gap between refreshes
+        summary_ttl = int(2 * self.scheduler.idle_interval)
+        self.cache = (
+            MarketCacheSink(aioredis.Redis.from_url(redis_url, decode_responses=True), summary_ttl=summary_ttl)
+            if redis_url else MarketCacheSink.from_sync_client(redis_client, summary_ttl=summary_ttl)
+        )
         self.broadcaster = DataBroadcaster(None)  # Will be set from main app
         self.is_running = False
-        self.update_interval = 30  # seconds
+        self.demand_poll_interval = 1.0  # seconds; how quickly new subscriptions are picked up
         self.health_check_interval = 300  # 5 minutes
+        # REST reads keep a symbol on the basic-tier cadence for this long
+        self.rest_demand_window = 900
+        self.rest_reads: Dict[str, float] = {}
         
-        # Asset watchlist
+        # Baseline universe, refreshed at idle cadence unless someone subscribes
         self.watchlist = [
             # Major stocks
             'AAPL', 'MSFT', 'GOOGL', 'AMZN', 'TSLA', 'NVDA', 'META', 'NFLX',
@@ -771,6 +1834,9 @@ class MarketDataService:
         self.is_running = True
         logger.info("🚀 Starting MarketDataService background processing")
         
+        if self.sink:
+            await self.sink.start()
+        
         # Create concurrent tasks
         tasks = [
             asyncio.create_task(self._data_update_loop()),
@@ -783,6 +1849,9 @@ class MarketDataService:
         except asyncio.CancelledError:
             logger.info("MarketDataService tasks cancelled")
         finally:
+            if self.sink:
+                await self.sink.close()
+            await self.cache.close()
             await self.aggregator.cleanup()
     
     async def stop(self):
@@ -790,71 +1859,133 @@ class MarketDataService:
         self.is_running = False
         logger.info("🔄 Stopping MarketDataService")
     
+    def _symbol_demand(self) -> Dict[str, Tuple[int, int]]:
+        """Symbol -> (subscribers, highest tier level) from WebSocket subscriptions and recent REST reads"""
+        demand = {}
+        connection_manager = getattr(self.broadcaster, 'connection_manager', None)
+        if connection_manager is not None and hasattr(connection_manager, 'symbol_demand'):
+            demand = dict(connection_manager.symbol_demand())
+        elif connection_manager is not None:
+            for subscriptions in getattr(connection_manager, 'user_subscriptions', {}).values():
+                for symbol in subscriptions:
+                    demand[symbol] = (demand.get(symbol, (0, 0))[0] + 1, 0)
+        
+        # A REST poller counts as one basic subscriber until it goes quiet
+        cutoff = time.time() - self.rest_demand_window
+        for symbol, read_at in list(self.rest_reads.items()):
+            if read_at < cutoff:
+                del self.rest_reads[symbol]
+            elif symbol not in demand:
+                demand[symbol] = (1, 0)
+        return demand
+    
+    def note_rest_read(self, symbol: str):
+        """Record a REST read so the scheduler keeps the symbol's cache warm"""
+        self.rest_reads[symbol] = time.time()
+    
+    async def fetch_on_demand(self, symbol: str) -> Optional[Dict[str, Any]]:
+        """Process a symbol for a REST cache miss and cache the result for the next reader"""
+        self.note_rest_read(symbol)
+        processed_data = await self.aggregator.process_symbol_complete(symbol)
+        if processed_data:
+            await self._cache_market_data([(symbol, processed_data)])
+        return processed_data
+    
     async def _data_update_loop(self):
-        """Main data update loop"""
+        """Main data update loop, driven by the refresh scheduler"""
         while self.is_running:
             try:
-                start_time = time.time()
+                self.scheduler.update_demand(self.watchlist, self._symbol_demand(), time.time())
                 
-                # Process watchlist symbols
-                tasks = []
-                semaphore = asyncio.Semaphore(10)  # Limit concurrent requests
+                symbols = self.scheduler.pop_due(time.time())
+                if symbols:
+                    processed = await self._refresh_symbols(symbols)
+                    self.scheduler.complete(symbols, processed, time.time())
                 
-                for symbol in self.watchlist:
-                    task = asyncio.create_task(
-                        self._process_symbol_with_semaphore(semaphore, symbol)
-                    )
-                    tasks.append(task)
-                
-                # Wait for all processing to complete
-                results = await asyncio.gather(*tasks, return_exceptions=True)
-                
-                # Count successful updates
-                successful_updates = sum(1 for result in results if not isinstance(result, Exception))
-                total_time = time.time() - start_time
-                
-                logger.info(
-                    f"📊 Data update cycle complete: {successful_updates}/{len(self.watchlist)} "
-                    f"symbols updated in {total_time:.2f}s"
-                )
-                
-                # Wait before next update
-                await asyncio.sleep(self.update_interval)
+                # Sleep until the next symbol is due, but keep polling demand
+                await asyncio.sleep(min(self.scheduler.seconds_until_next(time.time()), self.demand_poll_interval))
                 
             except Exception as e:
                 logger.error(f"Data update loop error: {str(e)}")
                 await asyncio.sleep(60)  # Wait longer on error
     
-    async def _process_symbol_with_semaphore(self, semaphore: asyncio.Semaphore, symbol: str):
-        """Process a symbol with semaphore limiting"""
+    async def _refresh_symbols(self, symbols: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Fetch, analyze and publish one batch of due symbols"""
+        start_time = time.time()
+        
+        # Quotes for the whole batch in a few batch requests
+        quotes = await self.aggregator.fetch_real_time_batch(symbols)
+        
+        # History and sentiment for the quoted symbols
+        tasks = []
+        semaphore = asyncio.Semaphore(10)  # Limit concurrent requests
+        
+        for symbol in symbols:
+            if symbol not in quotes:
+                logger.warning(f"⚠️ No data available for {symbol}")
+                continue
+            task = asyncio.create_task(
+                self._prepare_with_semaphore(semaphore, symbol, quotes[symbol])
+            )
+            tasks.append(task)
+        
+        jobs = [job for job in await asyncio.gather(*tasks) if job]
+        
+        # Whole batch's analysis in one job off the event loop
+        processed = await self.aggregator.compute.run_batch(jobs)
+        published = [(job.symbol, processed_data) for job, processed_data in zip(jobs, processed) if processed_data]
+        
+        # Store, cache and broadcast
+        successful_updates = await self._publish_cycle(published)
+        total_time = time.time() - start_time
+        
+        logger.info(
+            f"📊 Data update cycle complete: {successful_updates}/{len(symbols)} "
+            f"symbols updated in {total_time:.2f}s"
+        )
+        logger.debug(f"Scheduler: {self.scheduler.stats()}")
+        logger.debug(f"Compute executor: {self.aggregator.compute.stats()}")
+        logger.debug(f"Redis cycle cache: {self.cache.stats()}")
+        
+        return dict(published)
+    
+    async def _prepare_with_semaphore(self, semaphore: asyncio.Semaphore, symbol: str,
+                                      current_data: Optional[MarketDataPoint] = None) -> Optional[AnalysisJob]:
+        """Gather a symbol's analysis inputs with semaphore limiting"""
         async with semaphore:
-            try:
-                # Process complete symbol data
-                processed_data = await self.aggregator.process_symbol_complete(symbol)
-                
-                if processed_data:
-                    # Store in database
-                    await self._store_market_data(symbol, processed_data)
-                    
-                    # Cache in Redis
-                    await self._cache_market_data(symbol, processed_data)
-                    
-                    # Broadcast to WebSocket clients
-                    if self.broadcaster:
-                        await self.broadcaster.broadcast_market_update(symbol, processed_data)
-                    
-                    logger.debug(f"✅ Successfully processed {symbol}")
-                    return True
-                else:
-                    logger.warning(f"⚠️ No data available for {symbol}")
-                    return False
-                    
-            except Exception as e:
-                logger.error(f"❌ Error processing {symbol}: {str(e)}")
-                return False
+            job = await self.aggregator.prepare_symbol(symbol, current_data)
+            if not job:
+                logger.warning(f"⚠️ No data available for {symbol}")
+            return job
+    
+    async def _publish_cycle(self, processed: List[Tuple[str, Dict[str, Any]]]) -> int:
+        """Store, cache and broadcast a cycle's processed symbols; returns the number stored"""
+        # Store in database
+        results = await asyncio.gather(*(
+            self._store_market_data(symbol, processed_data) for symbol, processed_data in processed
+        ), return_exceptions=True)
+        for (symbol, _), result in zip(processed, results):
+            if isinstance(result, Exception):
+                logger.error(f"❌ Error storing {symbol}: {str(result)}")
+        
+        # Cache in Redis, one round trip for the whole cycle
+        await self._cache_market_data(processed)
+        
+        # Broadcast to WebSocket clients
+        if self.broadcaster:
+            await asyncio.gather(*(
+                self.broadcaster.broadcast_market_update(symbol, processed_data)
+                for symbol, processed_data in processed
+            ))
+        
+        return sum(1 for result in results if not isinstance(result, Exception))
     
     async def _store_market_data(self, symbol: str, processed_data: Dict[str, Any]):
         """Store processed market data in PostgreSQL"""
+        if self.sink:
+            await self.sink.submit(symbol, self.aggregator.get_asset_type(symbol).value, processed_data)
+            return
+        
         try:
             from sprint_1_backend_api import MarketAsset, MarketData
             
@@ -904,57 +2035,14 @@ class MarketDataService:
             logger.error(f"Database storage error for {symbol}: {str(e)}")
             self.db_session.rollback()
     
-    async def _cache_market_data(self, symbol: str, processed_data: Dict[str, Any]):
-        """Cache processed market data in Redis"""
-        try:
-            cache_key = f"helixone:market_data:{symbol}"
-            
-            # Prepare data for caching (remove non-serializable items)
-            cache_data = {
-                'symbol': symbol,
-                'timestamp': processed_data['timestamp'],
-                'price': processed_data['price_data']['price'],
-                'change_24h': processed_data['price_data'].get('change_24h'),
-                'change_percent_24h': processed_data['price_data'].get('change_percent_24h'),
-                'volume': processed_data['price_data'].get('volume'),
-                'confluence_score': processed_data['confluence_score'],
-                'helix_vector': processed_data['helix_vector'],
-                'helix_pattern': processed_data['helix_pattern']['pattern'],
-                'indicators': {
-                    key: value for key, value in processed_data['indicators'].items() 
-                    if value is not None
-                },
-                'sentiment_score': (
-                    processed_data['sentiment']['overall_score'] 
-                    if processed_data.get('sentiment') else 0.0
-                ),
-                'last_updated': datetime.utcnow().isoformat()
-            }
-            
-            # Cache with 5 minute expiration
-            self.redis_client.setex(
-                cache_key, 
-                300, 
-                json.dumps(cache_data, default=str)
-            )
-            
-            # Also cache in a market summary for quick access
-            summary_key = "helixone:market_summary"
-            summary_data = {
-                'symbol': symbol,
-                'price': cache_data['price'],
-                'change_percent': cache_data.get('change_percent_24h', 0),
-                'confluence': cache_data['confluence_score'],
-                'pattern': cache_data['helix_pattern']
-            }
-            
-            self.redis_client.hset(summary_key, symbol, json.dumps(summary_data))
-            self.redis_client.expire(summary_key, 600)  # 10 minutes
-            
-            logger.debug(f"Cached market data for {symbol}")
-            
-        except Exception as e:
-            logger.error(f"Cache storage error for {symbol}: {str(e)}")
+    def _cache_ttl(self, symbol: str) -> int:
+        """Cache TTL covering the gap until the symbol's next scheduled refresh"""
+        return max(self.cache.ttl, int(2 * self.scheduler.interval(symbol)))
+    
+    async def _cache_market_data(self, processed: List[Tuple[str, Dict[str, Any]]]):
+        """Cache a cycle's processed market data in Redis"""
+        ttls = {symbol: self._cache_ttl(symbol) for symbol, _ in processed}
+        await self.cache.write_cycle(processed, ttls)
     
     async def _health_check_loop(self):
         """Periodic health check loop"""
@@ -994,19 +2082,11 @@ class MarketDataService:
                 self.db_session.commit()
                 logger.info(f"Cleaned up {deleted_count} old market data records")
             
-            # Clean up old Redis cache entries
-            pattern = "helixone:market_data:*"
-            keys = self.redis_client.keys(pattern)
-            
-            expired_keys = []
-            for key in keys:
-                ttl = self.redis_client.ttl(key)
-                if ttl < 0:  # No expiration set or expired
-                    expired_keys.append(key)
-            
-            if expired_keys:
-                self.redis_client.delete(*expired_keys)
-                logger.info(f"Cleaned up {len(expired_keys)} expired cache entries")
+            # Clean up old Redis cache entries incrementally (SCAN, never KEYS)
+            progress = await self.cache.cleanup_expired("helixone:market_data:*")
+            if progress['unlinked']:
+                logger.info(f"Cleaned up {progress['unlinked']} expired cache entries")
+            logger.debug(f"Cache cleanup: {progress}")
                 
         except Exception as e:
             logger.error(f"Cleanup error: {str(e)}")
@@ -1143,6 +2223,8 @@ async def add_sprint2_endpoints(app: FastAPI, market_service: MarketDataService)
             results = []
             
             for symbol in request.symbols[:20]:  # Limit to 20 symbols
+                market_service.note_rest_read(symbol)
+                
                 # Try to get from cache first
                 cache_key = f"helixone:market_data:{symbol}"
                 cached_data = market_service.redis_client.get(cache_key)
@@ -1167,8 +2249,8 @@ async def add_sprint2_endpoints(app: FastAPI, market_service: MarketDataService)
                     
                     results.append(response)
                 else:
-                    # Process live if not cached
-                    processed_data = await market_service.aggregator.process_symbol_complete(symbol)
+                    # Process live if not cached; the result is cached for the next reader
+                    processed_data = await market_service.fetch_on_demand(symbol)
                     
                     if processed_data:
                         response = MarketDataResponseV2(
@@ -1260,6 +2342,31 @@ async def add_sprint2_endpoints(app: FastAPI, market_service: MarketDataService)
         except Exception as e:
             logger.error(f"Advanced helix analysis error for {symbol}: {str(e)}")
             raise HTTPException(status_code=500, detail="Failed to generate advanced helix analysis")
+    
+    @app.get("/api/v2/market/http-stats")
+    async def get_http_pool_stats(current_user = Depends(get_current_user)):
+        """Connection pool statistics for the shared data source HTTP client"""
+        return market_service.aggregator.http.stats()
+    
+    @app.get("/api/v2/market/compute-stats")
+    async def get_compute_stats(current_user = Depends(get_current_user)):
+        """Queue depth and timing metrics for the analysis executor"""
+        return market_service.aggregator.compute.stats()
+    
+    @app.get("/api/v2/market/sink-stats")
+    async def get_sink_stats(current_user = Depends(get_current_user)):
+        """Write-behind queue depth and flush metrics for market data storage"""
+        return market_service.sink.stats() if market_service.sink else {}
+    
+    @app.get("/api/v2/market/cache-stats")
+    async def get_cache_stats(current_user = Depends(get_current_user)):
+        """Pipelined Redis write latency per update cycle"""
+        return market_service.cache.stats()
+    
+    @app.get("/api/v2/market/scheduler-stats")
+    async def get_scheduler_stats(current_user = Depends(get_current_user)):
+        """Refresh scheduler queue size and how many symbols are on a hot cadence"""
+        return market_service.scheduler.stats()
 
 # =============================================================================
 # DEPLOYMENT CONFIGURATION
@@ -1343,7 +2450,7 @@ async def main():
     
     # Create service
     db_session = SessionLocal()
-    market_service = MarketDataService(redis_client, db_session)
+    market_service = MarketDataService(redis_client, db_session, database_url=DATABASE_URL, redis_url=REDIS_URL)
     
     logger.info("🚀 Starting HelixOne Market Data Service")
     
@@ -1380,20 +2487,29 @@ print("\n🚀 Ready for Sprint 3: Payment & Subscription System")# HelixOne Mark
 import asyncio
 import aiohttp
 import yfinance as yf
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Dict, List, Optional, Tuple, Any, Union
 from dataclasses import dataclass, asdict
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
+from zoneinfo import ZoneInfo
+import os
 import json
 import logging
 import numpy as np
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
 import time
+import math
+import heapq
+import itertools
+import uuid
 import hashlib
+import contextvars
+from collections import deque
 from enum import Enum
 import pandas as pd
 from textblob import TextBlob
 from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
 import redis
+import redis.asyncio as aioredis
 import asyncpg
 from sqlalchemy.orm import Session
 from sqlalchemy import func
@@ -1481,6 +2597,109 @@ class MarketDataPoint:
     market_cap: Optional[float] = None
     source: str = "unknown"
 
+class PriceSeries:
+    """Columnar OHLCV history: contiguous float64 columns and int64 epoch-second timestamps
+    
+    Missing high/low/open/close fall back to the price (as the indicators
+    always did) and missing volume is NaN. Slicing returns views, so windows
+    over a history cost no copies.
+    """
+    
+    __slots__ = ('symbol', 'source', 'timestamps', 'price', 'high', 'low', 'open', 'close', 'volume')
+    COLUMNS = ('price', 'high', 'low', 'open', 'close', 'volume')
+    
+    def __init__(self, symbol: str, timestamps: np.ndarray, price: np.ndarray, high: np.ndarray = None,
+                 low: np.ndarray = None, open: np.ndarray = None, close: np.ndarray = None,
+                 volume: np.ndarray = None, source: str = "unknown"):
+        self.symbol = symbol
+        self.source = source
+        self.timestamps = np.asarray(timestamps, dtype=np.int64)
+        self.price = np.asarray(price, dtype=np.float64)
+        self.high = self.price if high is None else np.asarray(high, dtype=np.float64)
+        self.low = self.price if low is None else np.asarray(low, dtype=np.float64)
+        self.open = self.price if open is None else np.asarray(open, dtype=np.float64)
+        self.close = self.price if close is None else np.asarray(close, dtype=np.float64)
+        self.volume = np.full(len(self.price), np.nan) if volume is None else np.asarray(volume, dtype=np.float64)
+    
+    @classmethod
+    def empty(cls, symbol: str = "", source: str = "unknown") -> 'PriceSeries':
+        return cls(symbol, np.empty(0, dtype=np.int64), np.empty(0), source=source)
+    
+    @classmethod
+    def from_points(cls, points: List[MarketDataPoint]) -> 'PriceSeries':
+        """Build the columns from MarketDataPoint objects"""
+        if not points:
+            return cls.empty()
+        
+        n = len(points)
+        timestamps = np.fromiter((int(p.timestamp.timestamp()) for p in points), dtype=np.int64, count=n)
+        price = np.fromiter((p.price for p in points), dtype=np.float64, count=n)
+        columns = {}
+        for name in ('high', 'low', 'open', 'close'):
+            columns[name] = np.fromiter((getattr(p, name) or p.price for p in points), dtype=np.float64, count=n)
+        volume = np.fromiter((np.nan if p.volume is None else p.volume for p in points), dtype=np.float64, count=n)
+        
+        return cls(points[0].symbol, timestamps, price, volume=volume, source=points[0].source, **columns)
+    
+    @classmethod
+    def coerce(cls, data: Union['PriceSeries', List[MarketDataPoint]]) -> 'PriceSeries':
+        """Accept either representation at API edges"""
+        return data if isinstance(data, PriceSeries) else cls.from_points(data)
+    
+    def __len__(self) -> int:
+        return len(self.price)
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return PriceSeries(self.symbol, self.timestamps[index], source=self.source,
+                               **{name: getattr(self, name)[index] for name in self.COLUMNS})
+        return self.point(index)
+    
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self.point(i)
+    
+    def point(self, i: int) -> MarketDataPoint:
+        """Row ``i`` as a MarketDataPoint"""
+        volume = self.volume[i]
+        return MarketDataPoint(
+            symbol=self.symbol,
+            timestamp=datetime.fromtimestamp(int(self.timestamps[i])),
+            price=float(self.price[i]),
+            volume=None if np.isnan(volume) else float(volume),
+            high=float(self.high[i]),
+            low=float(self.low[i]),
+            open=float(self.open[i]),
+            close=float(self.close[i]),
+            source=self.source
+        )
+    
+    def to_points(self) -> List[MarketDataPoint]:
+        return list(self)
+    
+    def append(self, points: Union['PriceSeries', List[MarketDataPoint], MarketDataPoint],
+               max_length: Optional[int] = None) -> 'PriceSeries':
+        """New series with ``points`` appended, keeping at most the last ``max_length`` rows"""
+        if isinstance(points, MarketDataPoint):
+            points = [points]
+        other = PriceSeries.coerce(points)
+        start = 0
+        if max_length is not None:
+            start = max(len(self) + len(other) - max_length, 0)
+        
+        def join(a, b):
+            return np.concatenate((a[min(start, len(a)):], b[max(start - len(a), 0):]))
+        
+        return PriceSeries(
+            self.symbol or other.symbol, join(self.timestamps, other.timestamps),
+            source=self.source if len(self) else other.source,
+            **{name: join(getattr(self, name), getattr(other, name)) for name in self.COLUMNS}
+        )
+    
+    @property
+    def nbytes(self) -> int:
+        return self.timestamps.nbytes + sum(getattr(self, name).nbytes for name in self.COLUMNS)
+
 @dataclass
 class IndicatorData:
     rsi: Optional[float] = None
@@ -1547,28 +2766,183 @@ class RateLimitManager:
             return datetime.utcnow() + timedelta(seconds=ttl)
         return datetime.utcnow()
 
+# =============================================================================
+# SHARED HTTP CLIENT LAYER
+# =============================================================================
+
+# Selects the pool used by data source requests; health checks switch it to
+# "health" so probes never queue behind (or hold) production connections.
+http_pool = contextvars.ContextVar('http_pool', default='default')
+
+class HTTPClientManager:
+    """Shared aiohttp connection pools for all data sources
+    
+    One tuned ``TCPConnector`` per pool (production fetches and health
+    checks) with per-host limits, DNS caching and keep-alive; each source
+    gets a lightweight session on top of it with its own timeout.
+    """
+    
+    def __init__(self, limit: int = 100, limit_per_host: int = 20, dns_cache_ttl: int = 300,
+                 keepalive_timeout: float = 30.0, connect_timeout: float = 5.0,
+                 health_limit: int = 10):
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.dns_cache_ttl = dns_cache_ttl
+        self.keepalive_timeout = keepalive_timeout
+        self.connect_timeout = connect_timeout
+        self.health_limit = health_limit
+        
+        self.connectors = {}
+        self.sessions = {}
+        self.pool_stats = {}
+    
+    def _new_stats(self) -> Dict[str, Any]:
+        return {'in_use': 0, 'waiting': 0, 'requests': 0, 'errors': 0,
+                'created': 0, 'reused': 0, 'queued_total': 0, 'queue_wait_max_ms': 0.0}
+    
+    def _trace_config(self, pool: str) -> aiohttp.TraceConfig:
+        """Trace hooks feeding the per-pool statistics"""
+        stats = self.pool_stats[pool]
+        trace = aiohttp.TraceConfig()
+        
+        async def on_request_start(session, ctx, params):
+            stats['requests'] += 1
+            stats['in_use'] += 1
+        
+        async def on_request_done(session, ctx, params):
+            stats['in_use'] -= 1
+        
+        async def on_request_exception(session, ctx, params):
+            stats['in_use'] -= 1
+            stats['errors'] += 1
+        
+        async def on_queued_start(session, ctx, params):
+            ctx.queued_at = time.perf_counter()
+            stats['waiting'] += 1
+            stats['queued_total'] += 1
+        
+        async def on_queued_end(session, ctx, params):
+            stats['waiting'] -= 1
+            waited = (time.perf_counter() - getattr(ctx, 'queued_at', time.perf_counter())) * 1000
+            stats['queue_wait_max_ms'] = max(stats['queue_wait_max_ms'], waited)
+        
+        async def on_connection_created(session, ctx, params):
+            stats['created'] += 1
+        
+        async def on_connection_reused(session, ctx, params):
+            stats['reused'] += 1
+        
+        trace.on_request_start.append(on_request_start)
+        trace.on_request_end.append(on_request_done)
+        trace.on_request_exception.append(on_request_exception)
+        trace.on_connection_queued_start.append(on_queued_start)
+        trace.on_connection_queued_end.append(on_queued_end)
+        trace.on_connection_create_end.append(on_connection_created)
+        trace.on_connection_reuseconn.append(on_connection_reused)
+        return trace
+    
+    def _limits(self, pool: str) -> Tuple[int, int]:
+        """(limit, limit_per_host) a pool's connector is created with"""
+        if pool == 'health':
+            return self.health_limit, min(self.limit_per_host, self.health_limit)
+        return self.limit, self.limit_per_host
+    
+    def _connector(self, pool: str) -> aiohttp.TCPConnector:
+        connector = self.connectors.get(pool)
+        if connector is None or connector.closed:
+            limit, limit_per_host = self._limits(pool)
+            connector = aiohttp.TCPConnector(
+                limit=limit,
+                limit_per_host=limit_per_host,
+                use_dns_cache=True,
+                ttl_dns_cache=self.dns_cache_ttl,
+                keepalive_timeout=self.keepalive_timeout,
+                enable_cleanup_closed=True
+            )
+            self.connectors[pool] = connector
+            self.pool_stats.setdefault(pool, self._new_stats())
+        return connector
+    
+    def session(self, config: DataSourceConfig, pool: Optional[str] = None) -> aiohttp.ClientSession:
+        """Session for a source on the current (or given) pool, sharing its connector"""
+        pool = pool or http_pool.get()
+        key = (pool, config.name)
+        session = self.sessions.get(key)
+        
+        if session is None or session.closed:
+            timeout = aiohttp.ClientTimeout(
+                total=config.timeout,
+                sock_connect=min(self.connect_timeout, config.timeout)
+            )
+            session = aiohttp.ClientSession(
+                connector=self._connector(pool),
+                connector_owner=False,
+                timeout=timeout,
+                trace_configs=[self._trace_config(pool)]
+            )
+            self.sessions[key] = session
+        return session
+    
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Pool statistics: in-use and waiting requests, new vs reused connections"""
+        report = {}
+        for pool, stats in self.pool_stats.items():
+            requests = stats['created'] + stats['reused']
+            # Counters outlive close(); limits then come from the configuration
+            connector = self.connectors.get(pool)
+            limit, limit_per_host = (
+                (connector.limit, connector.limit_per_host) if connector is not None else self._limits(pool)
+            )
+            report[pool] = {
+                **stats,
+                'queue_wait_max_ms': round(stats['queue_wait_max_ms'], 2),
+                'reuse_ratio': stats['reused'] / requests if requests else 0.0,
+                'limit': limit,
+                'limit_per_host': limit_per_host,
+                'open': connector is not None and not connector.closed
+            }
+        return report
+    
+    async def close(self):
+        """Close all sessions, then the shared connectors"""
+        for session in self.sessions.values():
+            if not session.closed:
+                await session.close()
+        for connector in self.connectors.values():
+            if not connector.closed:
+                await connector.close()
+        self.sessions.clear()
+        self.connectors.clear()
+
 # =============================================================================
 # DATA SOURCE IMPLEMENTATIONS
 # =============================================================================
 
 class BaseDataSource:
-    def __init__(self, config: DataSourceConfig, rate_limiter: RateLimitManager):
+    supports_batch = False  # True when fetch_batch uses a native multi-symbol endpoint
+    batch_size = 50
+    
+    def __init__(self, config: DataSourceConfig, rate_limiter: RateLimitManager,
+                 http: Optional[HTTPClientManager] = None):
         self.config = config
         self.rate_limiter = rate_limiter
-        self.session = None
+        self.owns_http = http is None
+        self.http = http or HTTPClientManager()
         self.last_error = None
+    
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        """Shared-pool session for this source on the active pool"""
+        return self.http.session(self.config)
         
     async def initialize(self):
         """Initialize HTTP session"""
-        if not self.session:
-            timeout = aiohttp.ClientTimeout(total=self.config.timeout)
-            self.session = aiohttp.ClientSession(timeout=timeout)
+        self.http.session(self.config)
     
     async def cleanup(self):
         """Cleanup resources"""
-        if self.session:
-            await self.session.close()
-            self.session = None
+        if self.owns_http:
+            await self.http.close()
     
     def can_make_request(self) -> bool:
         """Check if we can make a request based on rate limits"""
@@ -1578,6 +2952,13 @@ class BaseDataSource:
         """Fetch data for a symbol - to be implemented by subclasses"""
         raise NotImplementedError
     
+    async def fetch_batch(self, symbols: List[str], asset_type: AssetType) -> Dict[str, MarketDataPoint]:
+        """Fetch data for many symbols; sources without a batch endpoint fetch them one by one"""
+        points = await asyncio.gather(
+            *(self.fetch_data(symbol, asset_type) for symbol in symbols), return_exceptions=True
+        )
+        return {symbol: point for symbol, point in zip(symbols, points) if isinstance(point, MarketDataPoint)}
+    
     async def fetch_historical_data(self, symbol: str, days: int = 30) -> List[MarketDataPoint]:
         """Fetch historical data - to be implemented by subclasses"""
         raise NotImplementedError
@@ -1585,6 +2966,8 @@ class BaseDataSource:
 class YahooFinanceSource(BaseDataSource):
     """Yahoo Finance data source implementation"""
     
+    supports_batch = True
+    
     async def fetch_data(self, symbol: str, asset_type: AssetType) -> Optional[MarketDataPoint]:
         """Fetch real-time data from Yahoo Finance"""
         if not self.can_make_request():
@@ -1660,6 +3043,86 @@ class YahooFinanceSource(BaseDataSource):
             self.last_error = str(e)
             return None
     
+    async def fetch_batch(self, symbols: List[str], asset_type: AssetType) -> Dict[str, MarketDataPoint]:
+        """Fetch real-time quotes for many symbols per yfinance multi-ticker download
+        
+        yfinance handles Yahoo's cookie/crumb handshake, which the bare
+        /v7/finance/quote endpoint now requires. The latest daily bar is the
+        live quote and the one before it gives the day's change.
+        """
+        results = {}
+        
+        for i in range(0, len(symbols), self.batch_size):
+            chunk = symbols[i:i + self.batch_size]
+            if not self.can_make_request():
+                break
+            
+            try:
+                # yfinance is blocking; keep it off the event loop
+                raw = await asyncio.to_thread(
+                    yf.download, chunk, period='5d', interval='1d', group_by='ticker',
+                    auto_adjust=False, threads=True, progress=False
+                )
+            except Exception as e:
+                logger.error(f"Yahoo Finance batch fetch error for {len(chunk)} symbols: {str(e)}")
+                self.last_error = str(e)
+                continue
+            
+            for symbol in chunk:
+                try:
+                    point = self._quote_from_bars(symbol, raw, len(chunk))
+                except Exception as e:
+                    logger.warning(f"Yahoo Finance batch quote unusable for {symbol}: {str(e)}")
+                    continue
+                if point:
+                    results[symbol] = point
+        
+        return results
+    
+    @staticmethod
+    def _quote_from_bars(symbol: str, raw: pd.DataFrame, chunk_size: int) -> Optional[MarketDataPoint]:
+        """Live quote for one ticker from a multi-ticker daily download"""
+        if isinstance(raw.columns, pd.MultiIndex):
+            if symbol not in raw.columns.get_level_values(0):
+                return None
+            bars = raw[symbol]
+        elif chunk_size == 1:
+            bars = raw
+        else:
+            return None
+        
+        # The wide frame is indexed by the union of all tickers' dates
+        bars = bars.dropna(subset=['Close'])
+        if bars.empty:
+            return None
+        
+        latest = bars.iloc[-1]
+        price = float(latest['Close'])
+        change_24h = change_percent_24h = None
+        if len(bars) >= 2:
+            prev_close = float(bars['Close'].iloc[-2])
+            if prev_close:
+                change_24h = price - prev_close
+                change_percent_24h = (change_24h / prev_close) * 100
+        
+        # Today's bar is still open, so stamp it now; older bars keep their session date
+        bar_time = bars.index[-1].to_pydatetime().replace(tzinfo=None)
+        timestamp = datetime.now() if bar_time.date() == datetime.now().date() else bar_time
+        
+        return MarketDataPoint(
+            symbol=symbol,
+            timestamp=timestamp,
+            price=price,
+            volume=float(latest['Volume']) if not pd.isna(latest['Volume']) else 0.0,
+            high=float(latest['High']) if not pd.isna(latest['High']) else price,
+            low=float(latest['Low']) if not pd.isna(latest['Low']) else price,
+            open=float(latest['Open']) if not pd.isna(latest['Open']) else price,
+            close=price,
+            change_24h=change_24h,
+            change_percent_24h=change_percent_24h,
+            source="yahoo_finance"
+        )
+    
     async def fetch_historical_data(self, symbol: str, days: int = 30) -> List[MarketDataPoint]:
         """Fetch historical data from Yahoo Finance"""
         if not self.can_make_request():
@@ -1699,6 +3162,8 @@ class YahooFinanceSource(BaseDataSource):
 class CoinGeckoSource(BaseDataSource):
     """CoinGecko data source for cryptocurrency data"""
     
+    supports_batch = True
+    
     def _get_coingecko_id(self, symbol: str) -> str:
         """Convert symbol to CoinGecko ID"""
         symbol_map = {
@@ -0,0 +1,212 @@
+"""
+Offline benchmark suite for Complete_Market_Engine.
+
+Runs FinancialMarketEngine against a seeded synthetic OHLCV and news
+generator (no Yahoo/CoinGecko/NewsAPI access), times each pipeline stage at
+several universe sizes and writes a JSON report that can be compared across
+commits:
+
+    python Market_Engine_Benchmark.py --sizes 10 100 1000 --output bench.json
+    python Market_Engine_Benchmark.py --compare baseline.json
+"""
+
+import os
+import sys
+import json
+import time
+import zlib
+import shutil
+import argparse
+import platform
+import tempfile
+import subprocess
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from Complete_Market_Engine import FinancialMarketEngine
+
+STAGES = ['fetch', 'sentiment', 'indicators', 'entropy', 'weights', 'confluence',
+          'correlations', 'resonance', 'save', 'shape_mapping']
+
+HEADLINE_WORDS = {
+    'positive': ['surges', 'beats estimates', 'rallies', 'record high', 'upgrade', 'strong demand'],
+    'negative': ['plunges', 'misses estimates', 'sell-off', 'downgrade', 'lawsuit', 'weak outlook'],
+    'neutral': ['reports earnings', 'announces', 'trading update', 'market wrap', 'quarterly filing']
+}
+
+class SyntheticMarketEngine(FinancialMarketEngine):
+    """FinancialMarketEngine whose data providers are replaced by a seeded generator"""
+
+    def __init__(self, n_assets: int, seed: int = 42, data_dir: str = "data", bars: int = 252):
+        super().__init__(data_dir=data_dir, news_api_key="synthetic", use_store=False)
+        self.seed = seed
+        self.bars = bars
+        self.asset_config = self.build_universe(n_assets)
+        self.initialize_weights()
+
+    def build_universe(self, n_assets: int) -> Dict[str, List[str]]:
+        """Spread ``n_assets`` synthetic symbols across asset types in the default proportions"""
+        base = {asset_type: len(assets) for asset_type, assets in self.asset_config.items()}
+        total = sum(base.values())
+
+        universe = {}
+        assigned = 0
+        for i, (asset_type, count) in enumerate(base.items()):
+            size = n_assets - assigned if i == len(base) - 1 else round(n_assets * count / total)
+            prefix = 'coin-' if asset_type == 'crypto_coins' else f"{asset_type[:3].upper()}"
+            universe[asset_type] = [f"{prefix}{assigned + j:05d}" for j in range(size)]
+            assigned += size
+        return universe
+
+    def _rng(self, symbol: str) -> np.random.Generator:
+        return np.random.default_rng([self.seed, zlib.crc32(symbol.encode('utf-8'))])
+
+    def fetch_yfinance_data(self, ticker: str, period: str = "1y", start: Optional[str] = None) -> pd.DataFrame:
+        """Geometric Brownian motion OHLCV on business days, shaped like yfinance history"""
+        rng = self._rng(ticker)
+        close = rng.uniform(10, 500) * np.exp(np.cumsum(rng.normal(0.0003, 0.02, self.bars)))
+        spread = np.abs(rng.normal(0, 0.01, self.bars))
+
+        return pd.DataFrame({
+            'Date': pd.bdate_range(end='2024-12-31', periods=self.bars, tz='America/New_York'),
+            'Open': close * (1 + rng.normal(0, 0.005, self.bars)),
+            'High': close * (1 + spread),
+            'Low': close * (1 - spread),
+            'Close': close,
+            'Volume': rng.integers(100_000, 10_000_000, self.bars).astype(float),
+            'Symbol': ticker
+        })
+
+    def fetch_yfinance_batch(self, tickers: List[str], period: str = "1y",
+                             start: Optional[str] = None) -> Dict[str, pd.DataFrame]:
+        """Per-ticker synthetic frames, keyed like the batched Yahoo download"""
+        return {ticker: self.fetch_yfinance_data(ticker, period=period, start=start) for ticker in tickers}
+
+    def fetch_crypto_data(self, coin_id: str, days: int = 365) -> pd.DataFrame:
+        """Daily closes and volumes, shaped like the CoinGecko market_chart frame"""
+        rng = self._rng(coin_id)
+        periods = min(days, 365) + 1
+        close = rng.uniform(0.5, 50_000) * np.exp(np.cumsum(rng.normal(0.0005, 0.04, periods)))
+
+        return pd.DataFrame({
+            'Close': close,
+            'Date': pd.date_range(end='2024-12-31', periods=periods),
+            'Symbol': coin_id,
+            'Volume': rng.uniform(1e6, 1e9, periods)
+        })
+
+    def fetch_news_articles(self, asset: str, max_articles: int = 20) -> Tuple[List[str], Dict[str, str]]:
+        """Generated headlines, keyed like fetched articles for the engine's batched scoring"""
+        rng = self._rng(f"news:{asset}")
+        texts = {}
+        for i in range(max_articles):
+            tone = rng.choice(list(HEADLINE_WORDS))
+            text = f"{asset} {rng.choice(HEADLINE_WORDS[tone])} as investors react"
+            texts[self.sentiment_cache.article_key({'url': f"synthetic://{asset}/{i}"}, text)] = text
+        return list(texts), texts
+
+def run_benchmark(n_assets: int, seed: int = 42) -> Dict[str, float]:
+    """Time every pipeline stage once for a universe of ``n_assets``
+
+    Runs the engine's own orchestration (``process_all_assets`` plus shape
+    mapping, as the nightly run does) and reads the stage timings the engine
+    records.
+    """
+    data_dir = tempfile.mkdtemp(prefix=f"helix_bench_{n_assets}_")
+    engine = SyntheticMarketEngine(n_assets, seed=seed, data_dir=data_dir)
+
+    try:
+        start = time.perf_counter()
+        market_data = engine.process_all_assets(concurrent=True)
+        engine.generate_shape_mapping_data(market_data)
+        elapsed = time.perf_counter() - start
+        timings = {stage: engine.stage_timings.get(stage, 0.0) for stage in STAGES}
+    finally:
+        engine.close()
+        shutil.rmtree(data_dir, ignore_errors=True)
+
+    timings['total'] = elapsed
+    return timings
+
+def git_commit() -> Optional[str]:
+    """Current commit hash, if running inside a git checkout"""
+    try:
+        return subprocess.check_output(
+            ['git', 'rev-parse', 'HEAD'], cwd=os.path.dirname(os.path.abspath(__file__)),
+            stderr=subprocess.DEVNULL, text=True
+        ).strip()
+    except Exception:
+        return None
+
+def compare_reports(current: Dict, baseline: Dict, threshold: float) -> List[str]:
+    """Return a line per stage that got slower than ``threshold`` x the baseline"""
+    baseline_runs = {run['n_assets']: run['stages'] for run in baseline.get('results', [])}
+    regressions = []
+
+    for run in current['results']:
+        previous = baseline_runs.get(run['n_assets'])
+        if not previous:
+            continue
+        for stage, seconds in run['stages'].items():
+            before = previous.get(stage)
+            if before and seconds > before * threshold and seconds - before > 0.01:
+                regressions.append(
+                    f"{run['n_assets']} assets / {stage}: {before:.3f}s -> {seconds:.3f}s ({seconds / before:.2f}x)"
+                )
+    return regressions
+
+def main():
+    """Main execution function"""
+    parser = argparse.ArgumentParser(description="Offline benchmark for the HelixOne market engine")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10, 100, 1000, 10000],
+                        help="universe sizes to benchmark")
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--repeat', type=int, default=1, help="runs per size; the fastest time per stage is kept")
+    parser.add_argument('--output', default='benchmark_report.json')
+    parser.add_argument('--compare', help="baseline report to check for regressions")
+    parser.add_argument('--threshold', type=float, default=1.2, help="slowdown ratio reported as a regression")
+    args = parser.parse_args()
+
+    print("🚀 Starting market engine benchmark...")
+
+    report = {
+        'generated_at': datetime.now().isoformat(),
+        'commit': git_commit(),
+        'seed': args.seed,
+        'environment': {
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'pandas': pd.__version__,
+            'cpu_count': os.cpu_count()
+        },
+        'results': []
+    }
+
+    for n_assets in args.sizes:
+        runs = [run_benchmark(n_assets, seed=args.seed) for _ in range(max(args.repeat, 1))]
+        stages = {stage: min(run[stage] for run in runs) for stage in runs[0]}
+        report['results'].append({'n_assets': n_assets, 'stages': stages})
+
+        print(f"\n📊 {n_assets} assets: {stages['total']:.2f}s total")
+        for stage in STAGES:
+            print(f"   {stage:<14} {stages[stage]:8.3f}s")
+
+    with open(args.output, 'w') as f:
+        json.dump(report, f, indent=2)
+    print(f"\n✅ Report saved to: {args.output}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            regressions = compare_reports(report, json.load(f), args.threshold)
+        if regressions:
+            print(f"\n⚠️ Regressions against {args.compare}:")
+            for line in regressions:
+                print(f"- {line}")
+            sys.exit(1)
+        print(f"✅ No regressions against {args.compare}")
+
+if __name__ == "__main__":
+    main()
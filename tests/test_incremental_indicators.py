@@ -0,0 +1,87 @@
+"""Incremental indicator state must match the batch TechnicalIndicators path"""
+
+import math
+import types
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+SOURCE = Path(__file__).resolve().parent.parent / "Live_Market_Data.py"
+HEADER = "# HelixOne Market Intelligence - Sprint 2: Live"
+
+
+def load_live_market_data() -> types.ModuleType:
+    """Import Live_Market_Data.py, whose text is stored rotated around its header line"""
+    text = SOURCE.read_text()
+    split = text.index(HEADER)
+    tail, head = text[split:].rstrip("\n"), text[:split]
+
+    # The tail ends in a truncated copy of the head's first line; keep only its indentation
+    partial = tail[tail.rindex("\n") + 1:]
+    source = tail[:tail.rindex("\n") + 1] + partial[:len(partial) - len(partial.lstrip())] + head
+    source = source[:source.index("# API INTEGRATION ENDPOINTS")]
+
+    module = types.ModuleType("live_market_data")
+    exec(compile(source, str(SOURCE), "exec"), module.__dict__)
+    return module
+
+
+lmd = load_live_market_data()
+
+FIELDS = ('rsi', 'macd', 'macd_signal', 'bb_upper', 'bb_lower', 'bb_middle', 'ema_12', 'ema_26',
+          'sma_20', 'stochastic_k', 'stochastic_d', 'volume_sma', 'atr')
+
+
+def random_bars(count: int, seed: int, flat: slice = slice(40, 70)):
+    """Random walk bars with a stretch of identical bars (zero variance, zero losses)"""
+    rng = np.random.default_rng(seed)
+    start = datetime(2024, 1, 1)
+    price = 100.0
+    bars = []
+    for i in range(count):
+        in_flat = flat.start <= i < flat.stop
+        if not in_flat:
+            price *= math.exp(rng.normal(0, 0.02))
+        spread = 0.0 if in_flat else abs(rng.normal(0, 0.01)) * price
+        bars.append(lmd.MarketDataPoint(
+            symbol="TEST",
+            timestamp=start + timedelta(days=i),
+            price=price,
+            volume=1000.0 if in_flat else float(rng.integers(1, 10_000)),
+            high=price + spread,
+            low=price - spread,
+            close=price,
+            source="test",
+        ))
+    return bars
+
+
+def assert_matches(actual, expected, where: str):
+    for field in FIELDS:
+        got, want = getattr(actual, field), getattr(expected, field)
+        if want is None:
+            assert got is None, f"{field} at {where}: expected None, got {got}"
+        else:
+            assert got is not None, f"{field} at {where}: expected {want}, got None"
+            assert got == pytest.approx(want, rel=1e-9, abs=1e-9), f"{field} at {where}"
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_update_matches_batch(seed):
+    bars = random_bars(120, seed)
+    state = lmd.IncrementalIndicators()
+    for i, bar in enumerate(bars):
+        incremental = state.update(bar)
+        assert_matches(incremental, lmd.TechnicalIndicators.calculate_all_indicators(bars[:i + 1]), f"bar {i}")
+
+
+def test_preview_matches_update_and_leaves_state():
+    bars = random_bars(90, seed=7)
+    state = lmd.IncrementalIndicators()
+    for i, bar in enumerate(bars):
+        before = state.current()
+        previewed = state.preview(bar)
+        assert_matches(state.current(), before, f"bar {i} after preview")
+        assert_matches(previewed, state.update(bar), f"bar {i}")